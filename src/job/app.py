@@ -1,5 +1,11 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class JobConfig(AppConfig):
     name = "job"
+
+    def ready(self):
+        from job.instrumentation import install_query_timer
+
+        connection_created.connect(install_query_timer, dispatch_uid="job.install_query_timer")
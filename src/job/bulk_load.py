@@ -0,0 +1,90 @@
+import csv
+import io
+import json
+from enum import StrEnum
+from uuid import UUID
+
+from django.db import connection, transaction
+
+from job.model import JobDBModel
+from job.schema.job import JobCreate
+
+COPY_COLUMNS = (
+    "id",
+    "title",
+    "description",
+    "location",
+    "salary_range",
+    "company_name",
+    "posting_date",
+    "expiration_date",
+    "required_skills",
+    "status",
+)
+STAGING_TABLE = "job_post_import"
+
+
+class ConflictAction(StrEnum):
+    UPDATE = "update"
+    SKIP = "skip"
+
+
+class JobCopyLoader:
+    def __init__(self, on_conflict: ConflictAction = ConflictAction.UPDATE):
+        self.on_conflict = on_conflict
+        self.table = JobDBModel._meta.db_table
+
+    def __enter__(self) -> "JobCopyLoader":
+        columns = ", ".join(COPY_COLUMNS)
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+            cursor.execute(f"CREATE TEMP TABLE {STAGING_TABLE} AS SELECT {columns} FROM {self.table} WITH NO DATA")
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+
+    def load(self, jobs: list[tuple[UUID, JobCreate]]) -> int:
+        # ON CONFLICT cannot touch the same row twice in one statement, so the last copy of an id wins
+        unique_jobs = dict(jobs)
+
+        buffer = io.StringIO()
+        # COPY reads an unquoted empty field as NULL, quoting every field keeps "" an empty string
+        writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+        for job_id, job in unique_jobs.items():
+            writer.writerow(
+                (
+                    job_id,
+                    job.title,
+                    job.description,
+                    job.location,
+                    json.dumps(job.salary_range.model_dump()),
+                    job.company_name,
+                    job.posting_date.isoformat(),
+                    job.expiration_date.isoformat(),
+                    json.dumps(job.required_skills),
+                    job.status.value,
+                )
+            )
+        buffer.seek(0)
+
+        columns = ", ".join(COPY_COLUMNS)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {STAGING_TABLE} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+            cursor.execute(
+                f"INSERT INTO {self.table} ({columns}) SELECT {columns} FROM {STAGING_TABLE} {self._conflict_clause()}"
+            )
+            loaded = cursor.rowcount
+            cursor.execute(f"TRUNCATE {STAGING_TABLE}")
+        return loaded
+
+    def _conflict_clause(self) -> str:
+        if self.on_conflict == ConflictAction.SKIP:
+            return "ON CONFLICT (id) DO NOTHING"
+        columns = [column for column in COPY_COLUMNS if column != "id"]
+        updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in columns)
+        # A row that comes in unchanged is left alone, updating it would still move it to the head of the change feed
+        current = ", ".join(f"{self.table}.{column}" for column in columns)
+        incoming = ", ".join(f"EXCLUDED.{column}" for column in columns)
+        return f"ON CONFLICT (id) DO UPDATE SET {updates} WHERE ({current}) IS DISTINCT FROM ({incoming})"
@@ -0,0 +1,171 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+
+from job.schema.cache import CacheStat
+
+
+class LocalCache:
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    async def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            return self._get(key, time.monotonic())
+
+    async def get_many(self, keys: list[Hashable]) -> dict[Hashable, Any]:
+        with self._lock:
+            now = time.monotonic()
+            values = {key: self._get(key, now) for key in keys}
+        return {key: value for key, value in values.items() if value is not None}
+
+    async def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._set(key, value, time.monotonic())
+
+    async def set_many(self, values: dict[Hashable, Any]) -> None:
+        with self._lock:
+            now = time.monotonic()
+            for key, value in values.items():
+                self._set(key, value, now)
+
+    async def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stat(self) -> CacheStat:
+        with self._lock:
+            return CacheStat(
+                backend="local",
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+    def _get(self, key: Hashable, now: float) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= now:
+            del self._entries[key]
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def _set(self, key: Hashable, value: Any, now: float) -> None:
+        self._entries[key] = (now + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+
+class DjangoCache:
+    def __init__(self, alias: str = "default", ttl: float = 30.0, key_prefix: str = "job"):
+        self.alias = alias
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def _cache(self):
+        return caches[self.alias]
+
+    def _make_key(self, key: Hashable) -> str:
+        return f"{self.key_prefix}:{key}"
+
+    async def get(self, key: Hashable) -> Any | None:
+        value = await self._cache.aget(self._make_key(key))
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    async def get_many(self, keys: list[Hashable]) -> dict[Hashable, Any]:
+        # One round trip to the cache server for the whole batch
+        made_keys = {self._make_key(key): key for key in keys}
+        found = await self._cache.aget_many(list(made_keys))
+        with self._lock:
+            self._hits += len(found)
+            self._misses += len(made_keys) - len(found)
+        return {made_keys[made_key]: value for made_key, value in found.items()}
+
+    async def set(self, key: Hashable, value: Any) -> None:
+        await self._cache.aset(self._make_key(key), value, timeout=self.ttl)
+
+    async def set_many(self, values: dict[Hashable, Any]) -> None:
+        await self._cache.aset_many({self._make_key(key): value for key, value in values.items()}, timeout=self.ttl)
+
+    async def delete(self, key: Hashable) -> None:
+        await self._cache.adelete(self._make_key(key))
+
+    def clear(self) -> None:
+        # Drops the whole alias, so point JOB_CACHE_ALIAS at a cache dedicated to jobs
+        self._cache.clear()
+
+    def stat(self) -> CacheStat:
+        # Evictions and size live in the cache server, they are not visible from this process
+        with self._lock:
+            return CacheStat(backend="django", hits=self._hits, misses=self._misses)
+
+
+class GenerationCounter:
+    def __init__(self):
+        self._value = 0
+        self._lock = Lock()
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def bump(self) -> None:
+        with self._lock:
+            self._value += 1
+
+
+def build_cache(backend: str, maxsize: int, ttl: float, alias: str, key_prefix: str) -> LocalCache | DjangoCache:
+    if backend == "local":
+        return LocalCache(maxsize=maxsize, ttl=ttl)
+    if backend == "django":
+        return DjangoCache(alias=alias, ttl=ttl, key_prefix=key_prefix)
+    raise ImproperlyConfigured(f"Unknown job cache backend {backend!r}, expected 'local' or 'django'")
+
+
+job_count_cache = LocalCache(maxsize=settings.JOB_COUNT_CACHE_SIZE, ttl=settings.JOB_COUNT_CACHE_TTL)
+job_list_cache = LocalCache(maxsize=settings.JOB_LIST_CACHE_SIZE, ttl=settings.JOB_LIST_CACHE_TTL)
+job_list_generation = GenerationCounter()
+# Bumped before a job is evicted, so a read that loaded the row before the write does not cache it afterwards
+job_cache_generation = GenerationCounter()
+job_cache = build_cache(
+    settings.JOB_CACHE_BACKEND,
+    maxsize=settings.JOB_CACHE_SIZE,
+    ttl=settings.JOB_CACHE_TTL,
+    alias=settings.JOB_CACHE_ALIAS,
+    key_prefix="job",
+)
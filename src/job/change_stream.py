@@ -0,0 +1,187 @@
+import asyncio
+import contextvars
+import logging
+from typing import AsyncIterator
+
+import psycopg2
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, connections
+
+from job.metrics import change_stream_clients
+from job.model import CHANGE_CHANNEL
+from job.repository import JobRepository
+from job.schema.change import JobChange, JobChangeQuery
+
+logger = logging.getLogger("job.change_stream")
+
+# The largest page the change feed serves
+FEED_PAGE_SIZE = 1000
+RECONNECT_DELAY = 1.0
+
+KEEPALIVE = b": keepalive\n\n"
+
+
+def encode_event(change: JobChange) -> bytes:
+    return f"id: {change.seq}\nevent: {change.type}\ndata: {change.model_dump_json()}\n\n".encode()
+
+
+@sync_to_async
+def release_request_connections() -> None:
+    # Under ASGI a request's DB connections are only closed once its response ends, for a stream that would be one
+    # connection per client for as long as it stays connected
+    connections.close_all()
+
+
+class JobChangeBroker:
+    # One LISTEN connection and one change feed reader per process, however many clients are streaming. A
+    # notification only says that something committed; the changes themselves are read from the feed in sequence
+    # order, encoded once and queued to every client.
+    def __init__(self, channel: str, heartbeat: float = 15.0, poll_interval: float = 30.0, queue_size: int = 1000):
+        self.channel = channel
+        self.heartbeat = heartbeat
+        self.poll_interval = poll_interval
+        self.queue_size = queue_size
+        self._subscribers: set[asyncio.Queue] = set()
+        self._task: asyncio.Task | None = None
+        self._ready = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        self._listener_lost = False
+        self._head = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    async def stream(self, job_repository: JobRepository, since: int | None) -> AsyncIterator[bytes]:
+        queue: asyncio.Queue[tuple[int, bytes] | None] = asyncio.Queue(self.queue_size)
+        self._subscribers.add(queue)
+        change_stream_clients.inc()
+        self._start()
+        try:
+            await release_request_connections()
+            while not self._ready.is_set():
+                try:
+                    await asyncio.wait_for(self._ready.wait(), self.heartbeat)
+                except TimeoutError:
+                    yield KEEPALIVE
+
+            # Everything queued from here on is newer than the head, a client resuming from further back reads the
+            # gap from the feed first and skips what the queue repeats
+            last = -1 if since is None else since
+            while 0 <= last < self._head:
+                feed = await job_repository.get_changes(JobChangeQuery(since=last, limit=FEED_PAGE_SIZE))
+                if not feed.changes:
+                    break
+                yield b"".join(encode_event(change) for change in feed.changes)
+                last = feed.next_since
+                await release_request_connections()
+
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), self.heartbeat)
+                except TimeoutError:
+                    yield KEEPALIVE
+                    continue
+                if item is None:
+                    return
+                seq, event = item
+                if seq > last:
+                    last = seq
+                    yield event
+        finally:
+            self._subscribers.discard(queue)
+            change_stream_clients.dec()
+            # Lets the listener stop once the last client is gone
+            self._wakeup.set()
+
+    def _start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._ready = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        # A fresh context keeps the listener's queries out of the first client's request (its thread, its SQL stats)
+        self._task = asyncio.get_running_loop().create_task(self._run(), context=contextvars.Context())
+
+    async def _run(self) -> None:
+        job_repository = JobRepository()
+        loop = asyncio.get_running_loop()
+        while self._subscribers:
+            try:
+                listener = await sync_to_async(self._listen, thread_sensitive=False)()
+            except psycopg2.Error:
+                logger.exception("Could not LISTEN on %s, retrying", self.channel)
+                await asyncio.sleep(RECONNECT_DELAY)
+                continue
+
+            self._listener_lost = False
+            loop.add_reader(listener.fileno(), self._on_notify, listener)
+            try:
+                if not self._ready.is_set():
+                    self._head = await job_repository.get_change_head()
+                    self._ready.set()
+                await self._pump(job_repository)
+            except Exception:
+                logger.exception("Job change stream failed, reconnecting")
+                await sync_to_async(close_old_connections)()
+                await asyncio.sleep(RECONNECT_DELAY)
+            finally:
+                loop.remove_reader(listener.fileno())
+                listener.close()
+
+    def _listen(self):
+        # Django hands its connections back between queries, LISTEN needs one of its own that stays open
+        listener = psycopg2.connect(**connections["default"].get_connection_params())
+        listener.autocommit = True
+        with listener.cursor() as cursor:
+            cursor.execute(f"LISTEN {self.channel}")
+        return listener
+
+    def _on_notify(self, listener) -> None:
+        try:
+            listener.poll()
+        except psycopg2.Error:
+            self._listener_lost = True
+        listener.notifies.clear()
+        self._wakeup.set()
+
+    async def _pump(self, job_repository: JobRepository) -> None:
+        # Catches up with whatever committed while nobody was listening
+        self._wakeup.set()
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            if not self._subscribers or self._listener_lost:
+                return
+            await self._publish(job_repository)
+
+    async def _publish(self, job_repository: JobRepository) -> None:
+        has_more = True
+        while has_more:
+            feed = await job_repository.get_changes(JobChangeQuery(since=self._head, limit=FEED_PAGE_SIZE))
+            for change in feed.changes:
+                self._dispatch(change.seq, encode_event(change))
+            self._head, has_more = feed.next_since, feed.has_more
+
+    def _dispatch(self, seq: int, event: bytes) -> None:
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait((seq, event))
+            except asyncio.QueueFull:
+                # A client this far behind is cut off instead of buffering without bound, it reconnects with
+                # Last-Event-ID and reads the gap from the feed
+                self._subscribers.discard(queue)
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+
+job_change_broker = JobChangeBroker(
+    CHANGE_CHANNEL,
+    heartbeat=settings.JOB_CHANGE_STREAM_HEARTBEAT,
+    poll_interval=settings.JOB_CHANGE_STREAM_POLL_INTERVAL,
+    queue_size=settings.JOB_CHANGE_STREAM_QUEUE_SIZE,
+)
@@ -0,0 +1,172 @@
+import random
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Iterator
+from uuid import UUID
+
+from job.enum_type import JobStatusEnum
+from job.schema.job import JobCreate
+from job.schema.salary import SalaryRange
+
+SENIORITIES = ["Junior", "", "Senior", "Staff", "Lead", "Principal"]
+ROLES = [
+    "Backend Engineer",
+    "Frontend Engineer",
+    "Fullstack Developer",
+    "DevOps Engineer",
+    "Site Reliability Engineer",
+    "Data Engineer",
+    "Data Analyst",
+    "Data Scientist",
+    "Machine Learning Engineer",
+    "Mobile Developer",
+    "QA Engineer",
+    "Security Engineer",
+    "Product Manager",
+    "UX Designer",
+    "Technical Writer",
+]
+LOCATIONS = [
+    "Taipei",
+    "Remote",
+    "Hsinchu",
+    "Taichung",
+    "Kaohsiung",
+    "Tainan",
+    "Taoyuan",
+    "New Taipei",
+    "Keelung",
+    "Chiayi",
+    "Yilan",
+    "Hualien",
+    "Singapore",
+    "Tokyo",
+    "Hong Kong",
+    "Seoul",
+]
+SKILLS = [
+    "Python",
+    "SQL",
+    "JavaScript",
+    "TypeScript",
+    "React",
+    "Docker",
+    "Kubernetes",
+    "Linux",
+    "Django",
+    "PostgreSQL",
+    "AWS",
+    "Go",
+    "Java",
+    "Git",
+    "Redis",
+    "Vue",
+    "Node.js",
+    "GraphQL",
+    "Terraform",
+    "Kafka",
+    "Spark",
+    "Airflow",
+    "PyTorch",
+    "TensorFlow",
+    "Pandas",
+    "Figma",
+    "Excel",
+    "Rust",
+    "C++",
+    "Kotlin",
+    "Swift",
+    "Flutter",
+    "GCP",
+    "Azure",
+    "Elasticsearch",
+    "MongoDB",
+    "RabbitMQ",
+    "gRPC",
+    "FastAPI",
+    "Spring",
+]
+COMPANY_PREFIXES = ["Tech", "Data", "Cloud", "Cyber", "Quantum", "Pixel", "Bright", "Blue", "Nova", "Hyper", "Smart"]
+COMPANY_SUFFIXES = ["Works", "Labs", "Systems", "Soft", "Logic", "Bridge", "Forge", "Stack", "Wave", "Point", "Hub"]
+DESCRIPTION_TEMPLATES = [
+    "Join our team as a {role} working with {skills}.",
+    "We are hiring a {role} to build products with {skills}.",
+    "As a {role} you will design, ship and operate services using {skills}.",
+    "Looking for a {role} experienced in {skills} to scale our platform.",
+]
+# Distinct skills drawn per job
+MIN_SKILLS = 2
+MAX_SKILLS = 6
+STATUS_WEIGHTS = {JobStatusEnum.ACTIVE: 70, JobStatusEnum.EXPIRED: 20, JobStatusEnum.SCHEDULED: 10}
+
+
+def zipf_cum_weights(n: int, exponent: float) -> list[float]:
+    # Rank k is drawn with probability proportional to 1 / k**exponent
+    return list(accumulate(1 / rank**exponent for rank in range(1, n + 1)))
+
+
+def company_names(count: int) -> list[str]:
+    names = [f"{prefix}{suffix}" for prefix in COMPANY_PREFIXES for suffix in COMPANY_SUFFIXES]
+    return [names[i % len(names)] + (f" {i // len(names) + 1}" if i >= len(names) else "") for i in range(count)]
+
+
+class JobGenerator:
+    def __init__(
+        self,
+        seed: int = 42,
+        company_count: int = 2000,
+        skill_count: int = len(SKILLS),
+        location_count: int = len(LOCATIONS),
+        zipf_exponent: float = 1.1,
+        min_skills: int = MIN_SKILLS,
+        max_skills: int = MAX_SKILLS,
+        start_date: date = date(2024, 1, 1),
+        date_span_days: int = 365,
+    ):
+        self.rng = random.Random(seed)
+        self.companies = company_names(company_count)
+        self.skills = SKILLS[:skill_count] + [f"Skill {i}" for i in range(len(SKILLS), skill_count)]
+        self.locations = LOCATIONS[:location_count] + [f"City {i}" for i in range(len(LOCATIONS), location_count)]
+        self.min_skills = min_skills
+        self.max_skills = min(max_skills, len(self.skills))
+        self.start_date = start_date
+        self.date_span_days = date_span_days
+
+        self._company_weights = zipf_cum_weights(len(self.companies), zipf_exponent)
+        self._skill_weights = zipf_cum_weights(len(self.skills), zipf_exponent)
+        self._location_weights = zipf_cum_weights(len(self.locations), zipf_exponent)
+        self._statuses = list(STATUS_WEIGHTS)
+        self._status_weights = list(accumulate(STATUS_WEIGHTS.values()))
+
+    def generate(self, count: int) -> Iterator[tuple[UUID, JobCreate]]:
+        for _ in range(count):
+            yield self._make_job()
+
+    def _make_job(self) -> tuple[UUID, JobCreate]:
+        rng = self.rng
+        role = rng.choice(ROLES)
+        seniority = rng.choice(SENIORITIES)
+        skills = self._pick_skills(rng.randint(self.min_skills, self.max_skills))
+        posting_date = self.start_date + timedelta(days=rng.randrange(self.date_span_days))
+        salary_min = rng.randrange(30, 150) * 1000
+
+        # Generated values are valid by construction, so skip pydantic validation to keep generation cheap
+        job = JobCreate.model_construct(
+            title=f"{seniority} {role}".strip(),
+            description=rng.choice(DESCRIPTION_TEMPLATES).format(role=role, skills=", ".join(skills)),
+            location=rng.choices(self.locations, cum_weights=self._location_weights)[0],
+            salary_range=SalaryRange.model_construct(min=salary_min, max=int(salary_min * rng.uniform(1.2, 1.6))),
+            company_name=rng.choices(self.companies, cum_weights=self._company_weights)[0],
+            posting_date=posting_date,
+            expiration_date=posting_date + timedelta(days=rng.randint(14, 90)),
+            required_skills=skills,
+            status=rng.choices(self._statuses, cum_weights=self._status_weights)[0],
+        )
+        return UUID(int=rng.getrandbits(128), version=4), job
+
+    def _pick_skills(self, count: int) -> list[str]:
+        picked: dict[str, None] = {}
+        while len(picked) < count:
+            for skill in self.rng.choices(self.skills, cum_weights=self._skill_weights, k=count - len(picked)):
+                picked[skill] = None
+        return list(picked)
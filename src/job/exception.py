@@ -1,3 +1,6 @@
+from pydantic import ValidationError
+
+
 class NotFoundException(Exception):
     def __init__(self, message: str):
         super().__init__(message)
@@ -5,3 +8,16 @@ class NotFoundException(Exception):
 
     def __str__(self):
         return f"NotFoundException: {self.message}"
+
+
+class InvalidQueryException(Exception):
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+    def __str__(self):
+        return f"InvalidQueryException: {self.message}"
+
+
+def describe_validation_error(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in exc.errors())
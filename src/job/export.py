@@ -0,0 +1,63 @@
+import csv
+import io
+import json
+from typing import AsyncIterator
+
+from job.schema.job import ExportFormat, JobField, JobPartialResponse, JobResponse
+
+# CSV cells are flat strings, so nested fields are written as JSON
+CSV_JSON_COLUMNS = ("salary_range", "required_skills")
+
+CONTENT_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+class NDJSONEncoder:
+    def header(self) -> str:
+        return ""
+
+    def row(self, job: JobResponse | JobPartialResponse) -> str:
+        return job.model_dump_json() + "\n"
+
+
+class CSVEncoder:
+    def __init__(self, fields: list[JobField]):
+        self.fields = fields
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def header(self) -> str:
+        return self._line(self.fields)
+
+    def row(self, job: JobResponse | JobPartialResponse) -> str:
+        record = job.model_dump(mode="json")
+        return self._line(
+            json.dumps(record[field]) if field in CSV_JSON_COLUMNS else record[field] for field in self.fields
+        )
+
+    def _line(self, values) -> str:
+        self._writer.writerow(values)
+        line = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return line
+
+
+async def encode_export(
+    jobs: AsyncIterator[JobResponse | JobPartialResponse],
+    export_format: ExportFormat,
+    fields: list[JobField],
+    batch_size: int,
+) -> AsyncIterator[bytes]:
+    encoder = NDJSONEncoder() if export_format == ExportFormat.NDJSON else CSVEncoder(fields)
+    # Rows go out in batches rather than one chunk per job
+    batch = [encoder.header()]
+    async for job in jobs:
+        batch.append(encoder.row(job))
+        if len(batch) >= batch_size:
+            yield "".join(batch).encode()
+            batch = []
+    if any(batch):
+        yield "".join(batch).encode()
@@ -1,50 +1,161 @@
+from typing import Any
 from uuid import UUID
 
-from asgiref.sync import async_to_sync
-from ninja import Query, Router
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.http import parse_etags
+from ninja import Body, Query, Router
 from ninja.errors import HttpError
-from ninja_jwt.authentication import JWTAuth
+from ninja_jwt.authentication import AsyncJWTAuth
 
-from .schema.job import JobCreate, JobListQuery, JobResponse, JobUpdate, PaginationResult
+from .export import CONTENT_TYPES, encode_export
+from .schema.cache import CacheStat
+from .schema.change import JobChangeFeed, JobChangeQuery, JobChangeStreamQuery
+from .schema.job import (
+    JobBatchQuery,
+    JobBatchResult,
+    JobBulkCreateResult,
+    JobCreate,
+    JobExportQuery,
+    JobListQuery,
+    JobResponse,
+    JobUpdate,
+    PaginationResult,
+)
+from .schema.skill import SkillCount, SkillListQuery, SkillSuggestQuery
 from .service import JobService
 
-job_router = Router(auth=JWTAuth(), tags=["Job Management"])
+job_router = Router(auth=AsyncJWTAuth(), tags=["Job Management"])
 
 
-@job_router.get("/skill_list", response=list[str], summary="Get all unique skill")
-def list_all_skill(request):
+@job_router.get("/skill_list", response=list[str] | list[SkillCount], summary="Get all unique skill")
+async def list_all_skill(request, query: SkillListQuery = Query(...)):
     job_service: JobService = request.job_service
-    return async_to_sync(job_service.get_all_skill)()
+    return await job_service.get_all_skill(query)
+
+
+@job_router.get("/skill_suggest", response=list[SkillCount], summary="Suggest skills by prefix")
+async def suggest_skill(request, query: SkillSuggestQuery = Query(...)):
+    job_service: JobService = request.job_service
+    return await job_service.suggest_skill(query)
+
+
+@job_router.get("/cache_stat", response=dict[str, CacheStat], summary="Get job cache hit/miss/eviction counters")
+async def get_cache_stat(request):
+    job_service: JobService = request.job_service
+    return await job_service.get_cache_stat()
+
+
+@job_router.get("/batch", response=JobBatchResult, summary="Get many jobs by ID")
+async def get_job_batch(request, query: JobBatchQuery = Query(...)):
+    job_service: JobService = request.job_service
+    return await job_service.get_job_batch(query)
+
+
+@job_router.post("/batch", response=JobBatchResult, summary="Get many jobs by ID from a request body")
+async def post_job_batch(request, query: JobBatchQuery):
+    job_service: JobService = request.job_service
+    return await job_service.get_job_batch(query)
+
+
+@job_router.get("/export", summary="Stream every matching job as NDJSON or CSV")
+async def export_jobs(request, query: JobExportQuery = Query(...)):
+    job_service: JobService = request.job_service
+    jobs = job_service.export_jobs(query)
+
+    response = StreamingHttpResponse(
+        encode_export(jobs, query.format, query.selected_fields(), settings.JOB_EXPORT_CHUNK_SIZE),
+        content_type=CONTENT_TYPES[query.format],
+    )
+    response["Content-Disposition"] = f'attachment; filename="jobs.{query.format}"'
+    return response
+
+
+@job_router.get("/changes", response=JobChangeFeed, summary="List job changes since a checkpoint")
+async def list_job_changes(request, query: JobChangeQuery = Query(...)):
+    job_service: JobService = request.job_service
+    return await job_service.get_job_changes(query)
+
+
+@job_router.get("/changes/stream", summary="Stream job changes as Server-Sent Events")
+async def stream_job_changes(request, query: JobChangeStreamQuery = Query(...)):
+    job_service: JobService = request.job_service
+    events = job_service.stream_job_changes(query, request.headers.get("Last-Event-ID"))
+
+    response = StreamingHttpResponse(events, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Keeps nginx from buffering the stream
+    response["X-Accel-Buffering"] = "no"
+    return response
 
 
 @job_router.post("/", response=JobResponse, summary="Create a new job")
-def create_job(request, create_job_schema: JobCreate):
+async def create_job(request, create_job_schema: JobCreate):
     job_service: JobService = request.job_service
-    return async_to_sync(job_service.create_job)(create_job_schema)
+    return await job_service.create_job(create_job_schema)
 
 
-@job_router.get("/", response=PaginationResult, summary="List all job")
-def list_job(request, query: JobListQuery = Query(...)):
+@job_router.post("/bulk", response=JobBulkCreateResult, summary="Create jobs in bulk")
+async def bulk_create_job(
+    request, items: list[dict[str, Any]] = Body(..., min_length=1, max_length=settings.JOB_BULK_MAX_ITEMS)
+):
+    # Items are validated one by one in the service so a bad item is reported instead of rejecting the batch
     job_service: JobService = request.job_service
-    return async_to_sync(job_service.get_all_job)(query)
+    return await job_service.bulk_create_job(items)
+
+
+@job_router.get("/", response={200: PaginationResult, 304: None}, summary="List all job")
+async def list_job(request, response: HttpResponse, query: JobListQuery = Query(...)):
+    job_service: JobService = request.job_service
+    body, etag = await job_service.get_all_job(query)
+
+    response["ETag"] = f'"{etag}"'
+    if _etag_matches(request.headers.get("If-None-Match"), etag):
+        return 304, None
+    # Sent as serialized by the service; returned as a PaginationResult, ninja would validate the whole page again
+    page = HttpResponse(body, content_type="application/json")
+    page["ETag"] = response["ETag"]
+    return page
 
 
 @job_router.get("/{job_id}", response=JobResponse, summary="Get job by ID")
-def get_job(request, job_id: UUID):
+async def get_job(request, job_id: UUID):
     job_service: JobService = request.job_service
-    return async_to_sync(job_service.get_job)(job_id)
+    return await job_service.get_job(job_id)
+
+
+@job_router.api_operation(["HEAD"], "/{job_id}", response={200: None, 404: None}, summary="Check job exists by ID")
+async def head_job(request, job_id: UUID):
+    job_service: JobService = request.job_service
+    if await job_service.job_exists(job_id):
+        return 200, None
+    return 404, None
 
 
 @job_router.put("/{job_id}", response=JobResponse, summary="Update job by ID")
-def update_job(request, job_id: UUID, update_job_schema: JobUpdate):
+async def update_job(request, job_id: UUID, update_job_schema: JobUpdate):
+    job_service: JobService = request.job_service
+    return await job_service.update_job(job_id, update_job_schema)
+
+
+@job_router.patch("/{job_id}", response=JobResponse, summary="Partially update job by ID")
+async def patch_job(request, job_id: UUID, update_job_schema: JobUpdate):
     job_service: JobService = request.job_service
-    return async_to_sync(job_service.update_job)(job_id, update_job_schema)
+    return await job_service.update_job(job_id, update_job_schema)
 
 
 @job_router.delete("/{job_id}", response={204: None}, summary="Delete job by ID")
-def delete_job(request, job_id: UUID):
+async def delete_job(request, job_id: UUID):
     job_service: JobService = request.job_service
-    result = async_to_sync(job_service.delete_job)(job_id)
+    result = await job_service.delete_job(job_id)
     if not result:
         raise HttpError(404, f"Job {job_id} not found")
     return 204, None
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    # If-None-Match uses weak comparison, so W/"x" matches "x"
+    tags = parse_etags(if_none_match)
+    return "*" in tags or any(tag.removeprefix("W/") == f'"{etag}"' for tag in tags)
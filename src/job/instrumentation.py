@@ -0,0 +1,81 @@
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from job.metrics import sql_slow_queries
+
+logger = logging.getLogger("job.sql")
+request_logger = logging.getLogger("job.request")
+
+# Characters of the slowest statement kept in the slow request log
+SQL_PREVIEW_LENGTH = 200
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0
+    slowest_sql: str | None = None
+    slowest_duration: float = 0.0
+
+    def add(self, sql: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        if duration > self.slowest_duration:
+            self.slowest_sql = sql
+            self.slowest_duration = duration
+
+
+# The ORM runs on sync_to_async worker threads, each with its own connection, but they inherit the request's
+# context, so the wrapper is installed on every connection and looks up the current request's stats here
+current_query_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+def query_timer(execute, sql, params, many, context):
+    stats = current_query_stats.get()
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - started
+        if stats is not None:
+            stats.add(sql, duration)
+        if duration * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS:
+            sql_slow_queries.inc()
+            logger.warning("Slow query (%.1f ms): %s", duration * 1000, sql)
+
+
+def install_query_timer(sender, connection, **kwargs) -> None:
+    if query_timer not in connection.execute_wrappers:
+        connection.execute_wrappers.append(query_timer)
+
+
+def server_timing(stats: QueryStats, request_duration: float) -> str:
+    return ", ".join(
+        [
+            f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries"',
+            f"db-slowest;dur={stats.slowest_duration * 1000:.2f}",
+            f"view;dur={request_duration * 1000:.2f}",
+        ]
+    )
+
+
+def log_slow_request(request, stats: QueryStats, request_duration: float) -> None:
+    if request_duration * 1000 < settings.SLOW_REQUEST_THRESHOLD_MS:
+        return
+    sql = " ".join((stats.slowest_sql or "").split())
+    if len(sql) > SQL_PREVIEW_LENGTH:
+        sql = sql[:SQL_PREVIEW_LENGTH] + "..."
+    request_logger.warning(
+        "Slow request %s %s (%.1f ms, %d queries, %.1f ms SQL); slowest statement (%.1f ms): %s",
+        request.method,
+        request.path,
+        request_duration * 1000,
+        stats.count,
+        stats.duration * 1000,
+        stats.slowest_duration * 1000,
+        sql or "-",
+    )
@@ -0,0 +1,77 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from uuid import UUID
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from job.bulk_load import ConflictAction, JobCopyLoader
+from job.data_generator import MIN_SKILLS, JobGenerator
+from job.model import JobDBModel
+from job.schema.job import JobCreate
+
+
+def load_batch(batch: list[tuple[UUID, JobCreate]]) -> int:
+    # Runs on a worker thread, which gets its own connection and therefore its own staging table
+    try:
+        with JobCopyLoader(ConflictAction.SKIP) as loader:
+            return loader.load(batch)
+    finally:
+        connection.close()
+
+
+class Command(BaseCommand):
+    help = "Generate synthetic jobs with Zipf-distributed companies, locations and skills for load testing"
+
+    def add_arguments(self, parser):
+        parser.add_argument("count", type=int, help="Number of jobs to generate")
+        parser.add_argument("--seed", type=int, default=42, help="Same seed, same jobs")
+        parser.add_argument("--batch-size", type=int, default=20000, help="Jobs copied per transaction")
+        parser.add_argument("--companies", type=int, default=2000, help="Distinct company names")
+        parser.add_argument("--skills", type=int, default=40, help="Distinct skills")
+        parser.add_argument("--locations", type=int, default=16, help="Distinct locations")
+        parser.add_argument("--zipf", type=float, default=1.1, help="Zipf exponent, higher means more skew")
+        parser.add_argument("--workers", type=int, default=4, help="Parallel COPY connections")
+
+    def handle(self, *args, **options):
+        count: int = options["count"]
+        batch_size: int = options["batch_size"]
+        workers: int = options["workers"]
+        if min(count, batch_size, workers) < 1:
+            raise CommandError("count, --batch-size and --workers must be at least 1")
+        if min(options["companies"], options["locations"]) < 1:
+            raise CommandError("--companies and --locations must be at least 1")
+        if options["skills"] < MIN_SKILLS:
+            raise CommandError(f"--skills must be at least {MIN_SKILLS}, every job gets that many distinct skills")
+
+        generator = JobGenerator(
+            seed=options["seed"],
+            company_count=options["companies"],
+            skill_count=options["skills"],
+            location_count=options["locations"],
+            zipf_exponent=options["zipf"],
+        )
+        jobs = generator.generate(count)
+        loaded = 0
+        started = time.perf_counter()
+
+        # Generation stays on this thread so the output only depends on the seed; index maintenance is the
+        # bottleneck on the database side and scales with concurrent connections
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: set[Future] = set()
+            while batch := list(islice(jobs, batch_size)):
+                pending.add(executor.submit(load_batch, batch))
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    loaded += sum(future.result() for future in done)
+                    self.stdout.write(f"Loaded {loaded}/{count} jobs")
+            loaded += sum(future.result() for future in wait(pending).done)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {JobDBModel._meta.db_table}")
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(f"Generated {loaded} jobs in {elapsed:.2f}s ({loaded / elapsed:.0f} rows/s)")
+        )
@@ -0,0 +1,100 @@
+import csv
+import json
+import sys
+import time
+from contextlib import nullcontext
+from typing import IO, Iterator
+from uuid import UUID, uuid4
+
+from django.core.management.base import BaseCommand, CommandError
+from pydantic import ValidationError
+
+from job.bulk_load import ConflictAction, JobCopyLoader
+from job.exception import describe_validation_error
+from job.export import CSV_JSON_COLUMNS
+from job.schema.job import JobCreate
+
+
+def read_records(file: IO[str], file_format: str) -> Iterator[tuple[int, str | dict]]:
+    if file_format == "csv":
+        reader = csv.DictReader(file)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_no, line in enumerate(file, start=1):
+        if line.strip():
+            yield line_no, line
+
+
+def parse_record(raw: str | dict) -> tuple[UUID, JobCreate]:
+    if isinstance(raw, str):
+        record = json.loads(raw)
+        if not isinstance(record, dict):
+            raise ValueError(f"Expected a JSON object, got {type(record).__name__}")
+    else:
+        # DictReader fills the cells of a short row with None and files a long row's extras under None
+        if None in raw or None in raw.values():
+            raise ValueError("Row does not have as many cells as the header")
+        record = dict(raw)
+        for column in CSV_JSON_COLUMNS:
+            if column in record:
+                record[column] = json.loads(record[column])
+
+    job_id = record.pop("id", None)
+    return UUID(str(job_id)) if job_id else uuid4(), JobCreate.model_validate(record)
+
+
+class Command(BaseCommand):
+    help = "Import jobs from an NDJSON or CSV file through PostgreSQL COPY"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="NDJSON or CSV file, '-' reads from stdin")
+        parser.add_argument("--format", choices=["ndjson", "csv"], help="Defaults to the file extension")
+        parser.add_argument("--chunk-size", type=int, default=5000, help="Rows validated and copied per transaction")
+        parser.add_argument(
+            "--on-conflict",
+            choices=[action.value for action in ConflictAction],
+            default=ConflictAction.UPDATE.value,
+            help="What to do with rows whose id already exists",
+        )
+        parser.add_argument("--max-errors", type=int, default=20, help="Invalid rows to print before going quiet")
+
+    def handle(self, *args, **options):
+        path: str = options["path"]
+        file_format = options["format"] or ("csv" if path.endswith(".csv") else "ndjson")
+        chunk_size: int = options["chunk_size"]
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be at least 1")
+
+        opened = nullcontext(sys.stdin) if path == "-" else open(path, newline="", encoding="utf-8")
+        loaded = invalid = 0
+        started = time.perf_counter()
+
+        with opened as file, JobCopyLoader(ConflictAction(options["on_conflict"])) as loader:
+            chunk: list[tuple[UUID, JobCreate]] = []
+            for line_no, raw in read_records(file, file_format):
+                try:
+                    chunk.append(parse_record(raw))
+                except ValueError as exc:
+                    invalid += 1
+                    if invalid <= options["max_errors"]:
+                        message = describe_validation_error(exc) if isinstance(exc, ValidationError) else str(exc)
+                        self.stderr.write(f"Line {line_no}: {message}")
+                    continue
+
+                if len(chunk) >= chunk_size:
+                    loaded += loader.load(chunk)
+                    chunk.clear()
+                    self.stdout.write(f"Loaded {loaded} jobs")
+
+            if chunk:
+                loaded += loader.load(chunk)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {loaded} jobs, skipped {invalid} invalid rows in {elapsed:.2f}s "
+                f"({loaded / elapsed if elapsed else 0:.0f} rows/s)"
+            )
+        )
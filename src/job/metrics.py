@@ -0,0 +1,244 @@
+import threading
+import weakref
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Callable, Iterator
+
+from django.http import HttpResponse
+
+from job.cache import job_cache, job_count_cache, job_list_cache
+
+LabelValues = tuple[str, ...]
+Sample = tuple[str, dict[str, str], float]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _ShardOwner:
+    # Only referenced from its thread's threading.local, so it is collected as soon as that thread exits
+    __slots__ = ("__weakref__",)
+
+
+class _Shards:
+    # Every thread writes to its own shard, so the hot path needs no lock; shards are only summed when scraped. A
+    # thread that exits folds its shard into a retired total, under ASGI every sync_to_async call may run on a
+    # thread of its own and would otherwise leave a shard behind
+    def __init__(self, factory: Callable, merge: Callable[[Any, Any], None]):
+        self._factory = factory
+        self._merge = merge
+        self._local = threading.local()
+        self._shards = {}
+        self._retired = factory()
+        self._lock = threading.Lock()
+
+    def get(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = self._factory()
+            owner = self._local.owner = _ShardOwner()
+            with self._lock:
+                self._shards[id(shard)] = shard
+            weakref.finalize(owner, self._retire, shard).atexit = False
+            return shard
+
+    def _retire(self, shard) -> None:
+        # Runs once the thread is gone, so nothing writes to the shard any more
+        with self._lock:
+            del self._shards[id(shard)]
+            self._merge(self._retired, shard)
+
+    def snapshot(self) -> list:
+        with self._lock:
+            retired = self._retired.copy()
+            shards = list(self._shards.values())
+        # dict.copy() runs under the GIL, so a shard being written by its thread is copied consistently
+        return [retired, *(shard.copy() for shard in shards)]
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self._shards = _Shards(lambda: defaultdict(float), self._merge)
+
+    def inc(self, *labels: str, value: float = 1) -> None:
+        self._shards.get()[labels] += value
+
+    def values(self) -> dict[LabelValues, float]:
+        totals = defaultdict(float)
+        for shard in self._shards.snapshot():
+            self._merge(totals, shard)
+        return totals
+
+    @staticmethod
+    def _merge(totals: dict[LabelValues, float], shard: dict[LabelValues, float]) -> None:
+        for labels, value in shard.items():
+            totals[labels] += value
+
+    def samples(self) -> Iterator[Sample]:
+        for labels, value in sorted(self.values().items()):
+            yield self.name, dict(zip(self.labelnames, labels)), value
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels: str, value: float = 1) -> None:
+        self._shards.get()[labels] -= value
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help_text: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # Per labels: one count per bucket plus +Inf, then the sum of observed values
+        self._shards = _Shards(lambda: defaultdict(lambda: [0] * (len(buckets) + 1) + [0.0]), self._merge)
+
+    def observe(self, value: float, *labels: str) -> None:
+        row = self._shards.get()[labels]
+        row[bisect_left(self.buckets, value)] += 1
+        row[-1] += value
+
+    @staticmethod
+    def _merge(totals: dict[LabelValues, list], shard: dict[LabelValues, list]) -> None:
+        for labels, row in shard.items():
+            total = totals.setdefault(labels, [0] * len(row))
+            for i, value in enumerate(row):
+                total[i] += value
+
+    def samples(self) -> Iterator[Sample]:
+        totals = {}
+        for shard in self._shards.snapshot():
+            self._merge(totals, shard)
+
+        for labels, row in sorted(totals.items()):
+            label_dict = dict(zip(self.labelnames, labels))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), row):
+                cumulative += count
+                yield f"{self.name}_bucket", {**label_dict, "le": _format_value(bound)}, cumulative
+            yield f"{self.name}_sum", label_dict, row[-1]
+            yield f"{self.name}_count", label_dict, cumulative
+
+
+class CallbackMetric:
+    # Reads values owned elsewhere, such as cache statistics, when scraped
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        help_text: str,
+        labelnames: tuple[str, ...],
+        callback: Callable[[], dict[LabelValues, float]],
+    ):
+        self.name = name
+        self.kind = kind
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self.callback = callback
+
+    def samples(self) -> Iterator[Sample]:
+        for labels, value in sorted(self.callback().items()):
+            yield self.name, dict(zip(self.labelnames, labels)), value
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(_format_sample(*sample) for sample in metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _format_sample(name: str, labels: dict[str, str], value: float) -> str:
+    if not labels:
+        return f"{name} {_format_value(value)}"
+    label_text = ",".join(f'{key}="{_escape(str(label))}"' for key, label in labels.items())
+    return f"{name}{{{label_text}}} {_format_value(value)}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _cache_samples(field: str) -> Callable[[], dict[LabelValues, float]]:
+    def collect() -> dict[LabelValues, float]:
+        stats = {name: cache.stat() for name, cache in CACHES.items()}
+        if field == "hit_ratio":
+            return {
+                (name,): stat.hits / (stat.hits + stat.misses)
+                for name, stat in stats.items()
+                if stat.hits + stat.misses
+            }
+        return {(name,): getattr(stat, field) for name, stat in stats.items() if getattr(stat, field) is not None}
+
+    return collect
+
+
+CACHES = {"job": job_cache, "job_count": job_count_cache, "job_list": job_list_cache}
+
+registry = MetricsRegistry()
+
+http_requests = registry.register(
+    Counter("job_http_requests_total", "Requests handled by route and status", ("method", "route", "status"))
+)
+http_request_duration = registry.register(
+    Histogram("job_http_request_duration_seconds", "Request latency by route", ("method", "route"))
+)
+http_requests_in_flight = registry.register(
+    Gauge("job_http_requests_in_flight", "Requests currently being handled", ("method",))
+)
+change_stream_clients = registry.register(
+    Gauge("job_change_stream_clients", "Clients connected to the job change stream")
+)
+sql_queries = registry.register(Counter("job_sql_queries_total", "SQL statements executed"))
+sql_duration = registry.register(Counter("job_sql_duration_seconds_total", "Time spent executing SQL"))
+sql_slow_queries = registry.register(Counter("job_sql_slow_queries_total", "Statements over the slow query threshold"))
+for name, kind, field, help_text in [
+    ("job_cache_hits_total", "counter", "hits", "Cache hits"),
+    ("job_cache_misses_total", "counter", "misses", "Cache misses"),
+    ("job_cache_evictions_total", "counter", "evictions", "Entries evicted to stay within the size limit"),
+    ("job_cache_size", "gauge", "size", "Entries currently cached"),
+    ("job_cache_hit_ratio", "gauge", "hit_ratio", "Hits over lookups since start"),
+]:
+    registry.register(CallbackMetric(name, kind, help_text, ("cache",), _cache_samples(field)))
+
+
+def route_label(request) -> str:
+    # Route templates keep the label set bounded, unmatched paths share a single label
+    match = getattr(request, "resolver_match", None)
+    return f"/{match.route}" if match is not None else "unmatched"
+
+
+def observe_request(method: str, route: str, status: int, duration: float) -> None:
+    http_requests.inc(method, route, str(status))
+    http_request_duration.observe(duration, method, route)
+
+
+def metrics_view(request) -> HttpResponse:
+    return HttpResponse(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,15 +1,109 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from job.instrumentation import QueryStats, current_query_stats, log_slow_request, server_timing
+from job.metrics import http_requests_in_flight, observe_request, route_label, sql_duration, sql_queries
 from job.repository import JobRepository
 from job.service import JobService
 
 
 class JobServiceMiddleware:
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
         request.job_service = JobService(JobRepository())
         return self.get_response(request)
 
     async def __acall__(self, request):
         request.job_service = JobService(JobRepository())
         return await self.get_response(request)
+
+
+class QueryInstrumentationMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        stats, token, started = self._start(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_query_stats.reset(token)
+        return self._finish(request, response, stats, started)
+
+    async def __acall__(self, request):
+        stats, token, started = self._start(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_query_stats.reset(token)
+        return self._finish(request, response, stats, started)
+
+    @staticmethod
+    def _start(request):
+        request.query_stats = stats = QueryStats()
+        return stats, current_query_stats.set(stats), time.perf_counter()
+
+    @staticmethod
+    def _finish(request, response, stats: QueryStats, started: float):
+        duration = time.perf_counter() - started
+        log_slow_request(request, stats, duration)
+        sql_queries.inc(value=stats.count)
+        sql_duration.inc(value=stats.duration)
+        response["Server-Timing"] = server_timing(stats, duration)
+        return response
+
+
+class RequestMetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        http_requests_in_flight.inc(request.method)
+        started = time.perf_counter()
+        status = 500
+        try:
+            response = self.get_response(request)
+            status = response.status_code
+            return response
+        finally:
+            http_requests_in_flight.dec(request.method)
+            observe_request(request.method, route_label(request), status, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        http_requests_in_flight.inc(request.method)
+        started = time.perf_counter()
+        status = 500
+        try:
+            response = await self.get_response(request)
+            status = response.status_code
+            return response
+        finally:
+            http_requests_in_flight.dec(request.method)
+            observe_request(request.method, route_label(request), status, time.perf_counter() - started)
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.1 on 2026-10-17 10:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='jobdbmodel',
+            name='expiration_date',
+            field=models.DateField(),
+        ),
+        migrations.AlterField(
+            model_name='jobdbmodel',
+            name='posting_date',
+            field=models.DateField(),
+        ),
+        migrations.AlterField(
+            model_name='jobdbmodel',
+            name='salary_range',
+            field=models.JSONField(default=dict),
+        ),
+        migrations.AddIndex(
+            model_name='jobdbmodel',
+            index=models.Index(fields=['posting_date', 'id'], name='job_post_posting_date_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobdbmodel',
+            index=models.Index(fields=['expiration_date', 'id'], name='job_post_expiration_id_idx'),
+        ),
+    ]
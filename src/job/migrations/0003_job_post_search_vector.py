@@ -0,0 +1,24 @@
+# Generated by Django 5.2.1 on 2026-10-17 10:10
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0002_job_post_keyset_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobdbmodel',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('title', config='english', weight='A'), '||', django.contrib.postgres.search.SearchVector('company_name', config='english', weight='B'), django.contrib.postgres.search.SearchConfig('english')), '||', django.contrib.postgres.search.SearchVector('description', config='english', weight='C'), django.contrib.postgres.search.SearchConfig('english')), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddIndex(
+            model_name='jobdbmodel',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='job_post_search_vector_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-17 10:15
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("job", "0004_job_post_trigram_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobdbmodel",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["required_skills"], name="job_post_required_skills_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,104 @@
+# Generated by Django 5.2.1 on 2026-10-17 10:18
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+# Statement-level triggers keep job_skill in step with job_post for every write path (ORM, bulk_create,
+# raw SQL), inside the same transaction as the write itself.
+SKILL_CATALOG_SQL = """
+CREATE FUNCTION job_skill_apply(added jsonb[], removed jsonb[]) RETURNS void LANGUAGE plpgsql AS $$
+DECLARE
+    emptied text[];
+BEGIN
+    WITH changes AS (
+        SELECT skill.name, sum(job.sign)::integer AS delta
+        FROM (
+            SELECT skills, 1 AS sign FROM unnest(added) AS skills
+            UNION ALL
+            SELECT skills, -1 AS sign FROM unnest(removed) AS skills
+        ) AS job
+        CROSS JOIN LATERAL (
+            SELECT DISTINCT jsonb_array_elements_text(
+                CASE WHEN jsonb_typeof(job.skills) = 'array' THEN job.skills ELSE '[]'::jsonb END
+            ) AS name
+        ) AS skill
+        GROUP BY skill.name
+        HAVING sum(job.sign) <> 0
+    ), upserted AS (
+        INSERT INTO job_skill (name, job_count)
+        SELECT name, delta FROM changes ORDER BY name
+        ON CONFLICT (name) DO UPDATE SET job_count = job_skill.job_count + EXCLUDED.job_count
+        RETURNING name, job_count
+    )
+    SELECT array_agg(name) INTO emptied FROM upserted WHERE job_count <= 0;
+
+    IF emptied IS NOT NULL THEN
+        DELETE FROM job_skill WHERE name = ANY(emptied) AND job_count <= 0;
+    END IF;
+END;
+$$;
+
+CREATE FUNCTION job_skill_sync() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM job_skill_apply(ARRAY(SELECT required_skills FROM new_rows), '{}');
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM job_skill_apply(
+            ARRAY(SELECT required_skills FROM new_rows), ARRAY(SELECT required_skills FROM old_rows)
+        );
+    ELSE
+        PERFORM job_skill_apply('{}', ARRAY(SELECT required_skills FROM old_rows));
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER job_post_skill_insert AFTER INSERT ON job_post
+    REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION job_skill_sync();
+CREATE TRIGGER job_post_skill_update AFTER UPDATE ON job_post
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION job_skill_sync();
+CREATE TRIGGER job_post_skill_delete AFTER DELETE ON job_post
+    REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION job_skill_sync();
+
+INSERT INTO job_skill (name, job_count)
+SELECT skill.name, count(*)
+FROM job_post
+CROSS JOIN LATERAL (
+    SELECT DISTINCT jsonb_array_elements_text(
+        CASE WHEN jsonb_typeof(job_post.required_skills) = 'array' THEN job_post.required_skills ELSE '[]'::jsonb END
+    ) AS name
+) AS skill
+GROUP BY skill.name;
+"""
+
+DROP_SKILL_CATALOG_SQL = """
+DROP TRIGGER job_post_skill_delete ON job_post;
+DROP TRIGGER job_post_skill_update ON job_post;
+DROP TRIGGER job_post_skill_insert ON job_post;
+DROP FUNCTION job_skill_sync();
+DROP FUNCTION job_skill_apply(jsonb[], jsonb[]);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0005_job_post_required_skills_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobSkillDBModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.TextField(unique=True)),
+                ('job_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'job_skill',
+                'indexes': [models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='text_pattern_ops'), name='job_skill_name_prefix_idx')],
+            },
+        ),
+        migrations.RunSQL(SKILL_CATALOG_SQL, DROP_SKILL_CATALOG_SQL),
+    ]
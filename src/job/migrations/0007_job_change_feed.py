@@ -0,0 +1,93 @@
+# Generated by Django 5.2.1 on 2026-10-17 11:00
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+# Every insert and update of a job takes the next job_change_seq value (inserts through the column default), and every
+# delete leaves a tombstone with one, so GET /api/job/changes can page through writes by sequence. Values are drawn in
+# write order but become visible in commit order; to let the feed tell which values may still commit, a statement-level
+# trigger makes each writing transaction hold a shared advisory lock keyed by the sequence's last value before it draws
+# any, until the transaction ends (see JobRepository._change_watermark).
+CHANGE_FEED_SQL = """
+CREATE FUNCTION job_change_hold() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF coalesce(current_setting('job.change_held', true), '') = '' THEN
+        PERFORM pg_advisory_xact_lock_shared((SELECT last_value FROM job_change_seq));
+        PERFORM set_config('job.change_held', 'on', true);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE FUNCTION job_post_touch() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.change_seq := nextval('job_change_seq');
+    NEW.created_at := OLD.created_at;
+    NEW.updated_at := now();
+    RETURN NEW;
+END;
+$$;
+
+CREATE FUNCTION job_post_tombstone() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO job_post_tombstone (id, change_seq, deleted_at)
+    SELECT id, nextval('job_change_seq'), now() FROM old_rows
+    ON CONFLICT (id) DO UPDATE SET change_seq = EXCLUDED.change_seq, deleted_at = EXCLUDED.deleted_at;
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER job_post_change_hold BEFORE INSERT OR UPDATE OR DELETE ON job_post
+    FOR EACH STATEMENT EXECUTE FUNCTION job_change_hold();
+CREATE TRIGGER job_post_touch BEFORE UPDATE ON job_post
+    FOR EACH ROW EXECUTE FUNCTION job_post_touch();
+CREATE TRIGGER job_post_tombstone AFTER DELETE ON job_post
+    REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION job_post_tombstone();
+"""
+
+DROP_CHANGE_FEED_SQL = """
+DROP TRIGGER job_post_tombstone ON job_post;
+DROP TRIGGER job_post_touch ON job_post;
+DROP TRIGGER job_post_change_hold ON job_post;
+DROP FUNCTION job_post_tombstone();
+DROP FUNCTION job_post_touch();
+DROP FUNCTION job_change_hold();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0006_job_skill_catalog'),
+    ]
+
+    operations = [
+        migrations.RunSQL("CREATE SEQUENCE job_change_seq", "DROP SEQUENCE job_change_seq"),
+        migrations.CreateModel(
+            name='JobTombstoneDBModel',
+            fields=[
+                ('id', models.UUIDField(primary_key=True, serialize=False)),
+                ('change_seq', models.BigIntegerField(unique=True)),
+                ('deleted_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'job_post_tombstone',
+            },
+        ),
+        migrations.AddField(
+            model_name='jobdbmodel',
+            name='change_seq',
+            field=models.BigIntegerField(db_default=models.Func(models.Value('job_change_seq'), function='nextval', output_field=models.BigIntegerField()), unique=True),
+        ),
+        migrations.AddField(
+            model_name='jobdbmodel',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), db_index=True),
+        ),
+        migrations.AddField(
+            model_name='jobdbmodel',
+            name='updated_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), db_index=True),
+        ),
+        migrations.RunSQL(CHANGE_FEED_SQL, DROP_CHANGE_FEED_SQL),
+    ]
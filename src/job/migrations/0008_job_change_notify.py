@@ -0,0 +1,34 @@
+# Generated by Django 5.2.1 on 2026-10-17 11:30
+
+from django.db import migrations
+
+# One NOTIFY per writing statement wakes the change stream listeners (see job.change_stream). Postgres delivers it on
+# commit only and folds identical notifications within a transaction, so a bulk write costs a single wakeup; the payload
+# is empty because listeners read the changes themselves from the change feed.
+CHANGE_NOTIFY_SQL = """
+CREATE FUNCTION job_change_notify() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM pg_notify('job_change', '');
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER job_post_change_notify AFTER INSERT OR UPDATE OR DELETE ON job_post
+    FOR EACH STATEMENT EXECUTE FUNCTION job_change_notify();
+"""
+
+DROP_CHANGE_NOTIFY_SQL = """
+DROP TRIGGER job_post_change_notify ON job_post;
+DROP FUNCTION job_change_notify();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0007_job_change_feed'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CHANGE_NOTIFY_SQL, DROP_CHANGE_NOTIFY_SQL),
+    ]
@@ -1,11 +1,27 @@
 import uuid
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models import Func, Value
+from django.db.models.functions import Now, Upper
 
 from job.schema.job import JobResponse
+from job.schema.skill import SkillCount
 
 from .enum_type import JobStatusEnum
 
+SEARCH_CONFIG = "english"
+
+CHANGE_SEQUENCE = "job_change_seq"
+CHANGE_CHANNEL = "job_change"
+
+
+class JobManager(models.Manager):
+    def get_queryset(self):
+        # search_vector is only used inside WHERE/ORDER BY, never worth shipping to Python
+        return super().get_queryset().defer("search_vector")
+
 
 class JobDBModel(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -14,14 +30,32 @@ class JobDBModel(models.Model):
     location = models.CharField(max_length=255, db_index=True)
     salary_range = models.JSONField(default=dict)
     company_name = models.CharField(max_length=255)
-    posting_date = models.DateField(db_index=True)
-    expiration_date = models.DateField(db_index=True)
+    posting_date = models.DateField()
+    expiration_date = models.DateField()
     required_skills = models.JSONField(default=list)
     status = models.CharField(
         max_length=20,
         choices=[(status.value, status.name.title()) for status in JobStatusEnum],
         db_index=True,
     )
+    search_vector = models.GeneratedField(
+        expression=SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("company_name", weight="B", config=SEARCH_CONFIG)
+        + SearchVector("description", weight="C", config=SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    # Filled by column defaults on insert and by the job_post_touch trigger (migration 0007) on every update, whatever
+    # the write path; never written from application code
+    created_at = models.DateTimeField(db_default=Now(), db_index=True)
+    updated_at = models.DateTimeField(db_default=Now(), db_index=True)
+    change_seq = models.BigIntegerField(
+        db_default=Func(Value(CHANGE_SEQUENCE), function="nextval", output_field=models.BigIntegerField()),
+        unique=True,
+    )
+
+    objects = JobManager()
 
     def __str__(self):
         return f"{self.title} @ {self.company_name}"
@@ -42,3 +76,43 @@ class JobDBModel(models.Model):
 
     class Meta:
         db_table = "job_post"
+        indexes = [
+            models.Index(fields=["posting_date", "id"], name="job_post_posting_date_id_idx"),
+            models.Index(fields=["expiration_date", "id"], name="job_post_expiration_id_idx"),
+            GinIndex(fields=["search_vector"], name="job_post_search_vector_idx"),
+            GinIndex(fields=["required_skills"], name="job_post_required_skills_idx"),
+            GinIndex(OpClass(Upper("company_name"), name="gin_trgm_ops"), name="job_post_company_name_trgm_idx"),
+            GinIndex(OpClass(Upper("title"), name="gin_trgm_ops"), name="job_post_title_trgm_idx"),
+            GinIndex(OpClass(Upper("location"), name="gin_trgm_ops"), name="job_post_location_trgm_idx"),
+        ]
+
+
+class JobTombstoneDBModel(models.Model):
+    # Written by the job_post delete trigger in migration 0007 so the change feed can report deletions
+    id = models.UUIDField(primary_key=True)
+    change_seq = models.BigIntegerField(unique=True)
+    deleted_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.id} deleted at {self.deleted_at}"
+
+    class Meta:
+        db_table = "job_post_tombstone"
+
+
+class JobSkillDBModel(models.Model):
+    # Maintained by the job_post triggers in migration 0006; never written from application code
+    name = models.TextField(unique=True)
+    job_count = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.name} ({self.job_count})"
+
+    def to_service_model(self) -> SkillCount:
+        return SkillCount(name=self.name, job_count=self.job_count)
+
+    class Meta:
+        db_table = "job_skill"
+        indexes = [
+            models.Index(OpClass(Upper("name"), name="text_pattern_ops"), name="job_skill_name_prefix_idx"),
+        ]
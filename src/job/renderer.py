@@ -0,0 +1,40 @@
+from typing import Any
+
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpRequest
+from ninja.renderers import BaseRenderer, JSONRenderer
+from pydantic_core import to_json, to_jsonable_python
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class PydanticJSONRenderer(BaseRenderer):
+    # pydantic-core encodes dates, UUIDs, enums and models natively and returns bytes, without json.JSONEncoder
+    # calling back into Python for every value it cannot handle
+    media_type = "application/json"
+
+    def render(self, request: HttpRequest, data: Any, *, response_status: int) -> bytes:
+        return to_json(data)
+
+
+class ORJSONRenderer(BaseRenderer):
+    media_type = "application/json"
+
+    def render(self, request: HttpRequest, data: Any, *, response_status: int) -> bytes:
+        # orjson covers dates, UUIDs and enums itself, anything else (e.g. models, Decimal) goes through pydantic
+        return orjson.dumps(data, default=to_jsonable_python)
+
+
+def build_renderer(backend: str) -> BaseRenderer:
+    if backend == "pydantic":
+        return PydanticJSONRenderer()
+    if backend == "orjson":
+        if orjson is None:
+            raise ImproperlyConfigured("The 'orjson' JSON renderer needs the orjson package installed")
+        return ORJSONRenderer()
+    if backend == "json":
+        return JSONRenderer()
+    raise ImproperlyConfigured(f"Unknown JSON renderer {backend!r}, expected 'pydantic', 'orjson' or 'json'")
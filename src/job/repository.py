@@ -1,101 +1,410 @@
-from typing import Type
+import json
+from datetime import date
+from typing import AsyncIterator, Type
 from uuid import UUID
 
 from asgiref.sync import sync_to_async
-from django.db.models import Q
+from django.conf import settings
+from django.contrib.postgres.lookups import TrigramWordSimilar
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection
+from django.db.models import F, Q, QuerySet, Value
+from django.db.models.functions import Upper
+from django.db.models.lookups import GreaterThanOrEqual
 from django.db.models.manager import Manager
 
-from job.exception import NotFoundException
-from job.schema.job import JobCreate, JobListQuery, JobResponse, JobUpdate, PaginationResult, SortOrder
+from job.cache import job_cache, job_cache_generation, job_count_cache, job_list_generation
+from job.enum_type import JobStatusEnum
+from job.exception import InvalidQueryException, NotFoundException
+from job.schema.change import JobChange, JobChangeFeed, JobChangeQuery, JobChangeType
+from job.schema.cursor import CursorDirection, JobCursor
+from job.schema.job import (
+    CountMode,
+    JobCreate,
+    JobExportQuery,
+    JobField,
+    JobFilterQuery,
+    JobListQuery,
+    JobPartialResponse,
+    JobResponse,
+    JobSortField,
+    JobUpdate,
+    PaginationMode,
+    PaginationResult,
+    SkillMatch,
+    SortOrder,
+)
+from job.schema.salary import SalaryRange
+from job.schema.skill import SkillCount, SkillListQuery
+from job.skill_index import skill_prefix_index
 
-from .model import JobDBModel
+from .model import CHANGE_SEQUENCE, SEARCH_CONFIG, JobDBModel, JobSkillDBModel, JobTombstoneDBModel
 
 
 class JobRepository:
-    def __init__(self, model: Type[JobDBModel] = JobDBModel):
+    def __init__(
+        self,
+        model: Type[JobDBModel] = JobDBModel,
+        skill_model: Type[JobSkillDBModel] = JobSkillDBModel,
+        tombstone_model: Type[JobTombstoneDBModel] = JobTombstoneDBModel,
+    ):
         self.objects: Manager[JobDBModel] = model.objects
+        self.skills: Manager[JobSkillDBModel] = skill_model.objects
+        self.tombstones: Manager[JobTombstoneDBModel] = tombstone_model.objects
 
     async def create(self, create_job: JobCreate) -> JobResponse:
         create_job_dict: dict = create_job.model_dump()
         created_job: JobDBModel = await self.objects.acreate(**create_job_dict)
+        self._invalidate_caches()
 
         return created_job.to_service_model()
 
+    async def bulk_create(self, create_jobs: list[JobCreate]) -> list[JobResponse]:
+        # bulk_create wraps all batches in one transaction, so either every job is inserted or none is
+        created_jobs: list[JobDBModel] = await self.objects.abulk_create(
+            [JobDBModel(**create_job.model_dump()) for create_job in create_jobs],
+            batch_size=settings.JOB_BULK_BATCH_SIZE,
+        )
+        self._invalidate_caches()
+
+        return [job.to_service_model() for job in created_jobs]
+
     async def get_by_id(self, job_id: UUID) -> JobResponse:
+        cached: JobResponse | None = await job_cache.get(job_id)
+        if cached is not None:
+            return cached
+
+        generation = job_cache_generation.value
         job: JobDBModel = await self._get_or_raise(job_id)
-        return job.to_service_model()
+        job_response = job.to_service_model()
+        if generation == job_cache_generation.value:
+            await job_cache.set(job_id, job_response)
+        return job_response
 
-    async def get_all(self, query: JobListQuery) -> PaginationResult:
-        filters = Q()
+    async def get_by_ids(self, job_ids: list[UUID]) -> dict[UUID, JobResponse]:
+        jobs: dict[UUID, JobResponse] = await job_cache.get_many(job_ids)
+        uncached = [job_id for job_id in job_ids if job_id not in jobs]
+        if uncached:
+            generation = job_cache_generation.value
+            fetched = {job.id: job.to_service_model() async for job in self.objects.filter(id__in=uncached)}
+            if generation == job_cache_generation.value:
+                await job_cache.set_many(fetched)
+            jobs.update(fetched)
+        return jobs
 
-        if query.status:
-            filters &= Q(status=query.status)
-        if query.location:
-            filters &= Q(location=query.location)
-        if query.company_name:
-            filters &= Q(company_name__icontains=query.company_name)
-        if query.search:
-            filters &= (
-                Q(title__icontains=query.search)
-                | Q(description__icontains=query.search)
-                | Q(company_name__icontains=query.search)
-            )
-        if query.skills:
-            skill_filters = Q()
-            for skill in query.skills:
-                skill_filters |= Q(required_skills__contains=[skill])
-            filters &= skill_filters
+    async def get_all(self, query: JobListQuery) -> PaginationResult:
+        cursor = self._decode_cursor(query) if query.cursor else None
+        qs = self.objects.filter(self._build_filters(query))
 
-        qs = self.objects.filter(filters)
+        total = await self._count(qs, query)
 
-        total = await sync_to_async(qs.count)()
+        if query.pagination == PaginationMode.CURSOR or cursor:
+            return await self._get_page_by_cursor(qs, query, cursor, total)
 
-        order_field = query.order_by.value
-        if query.sort_order == SortOrder.DESC:
-            order_field = f"-{order_field}"
-        qs = qs.order_by(order_field)
+        if query.order_by == JobSortField.RELEVANCE:
+            qs = qs.alias(relevance=SearchRank(F("search_vector"), self._search_query(query.search)))
+        qs = qs.order_by(*self._ordering(query.order_by.value, query.sort_order == SortOrder.DESC))
 
         offset = (query.page - 1) * query.page_size
-        qs = qs[offset : offset + query.page_size]
+        # A sparse fieldset only reads its own columns, so large ones such as description stay in the database
+        fields = query.selected_fields()
+        job_list = await self._fetch_rows(qs[offset : offset + query.page_size], fields)
 
-        job_list = await sync_to_async(list)(qs)
-
-        return PaginationResult(
+        return PaginationResult.model_construct(
             total=total,
+            count_mode=query.count_mode,
             page=query.page,
             page_size=query.page_size,
-            list=[job.to_service_model() for job in job_list],
+            list=[self._to_list_item(job, fields, sparse=bool(query.fields)) for job in job_list],
         )
 
     async def update(self, job_id: UUID, update_job: JobUpdate) -> JobResponse:
-        job: JobDBModel = await self._get_or_raise(job_id)
+        # Only fields sent by the client are written; nested values such as salary_range are still dumped whole
+        changes = {
+            field: value for field, value in update_job.model_dump().items() if field in update_job.model_fields_set
+        }
+        if not changes:
+            return (await self._get_or_raise(job_id)).to_service_model()
 
-        for field, value in update_job.model_dump().items():
-            setattr(job, field, value)
+        job: JobDBModel | None = await self._update_returning(job_id, changes)
+        if job is None:
+            raise NotFoundException(f"Job with id {job_id} not found")
 
-        await job.asave()
+        await self._evict(job_id)
+        self._invalidate_caches()
         return job.to_service_model()
 
+    async def export(self, query: JobExportQuery) -> AsyncIterator[JobResponse | JobPartialResponse]:
+        fields = query.selected_fields()
+        # values() rather than values_list(): ValuesListIterable runs its query as soon as aiterator() starts it,
+        # on the event loop thread, while ValuesIterable defers it to aiterator()'s sync_to_async chunks
+        qs = self.objects.filter(self._build_filters(query)).order_by("id").values(*fields)
+        # aiterator() reads through a server-side cursor one chunk at a time, so memory stays flat at any table size
+        async for job in qs.aiterator(chunk_size=settings.JOB_EXPORT_CHUNK_SIZE):
+            yield self._to_list_item(job, fields, sparse=bool(query.fields))
+
+    async def exists(self, job_id: UUID) -> bool:
+        if await job_cache.get(job_id) is not None:
+            return True
+        # SELECT 1 ... LIMIT 1 on the primary key, answered from the index without building a model
+        return await self.objects.filter(id=job_id).aexists()
+
     async def delete(self, job_id: UUID) -> bool:
         deleted_count, _ = await self.objects.filter(id=job_id).adelete()
+        await self._evict(job_id)
+        if deleted_count:
+            self._invalidate_caches()
         return deleted_count > 0
 
-    async def get_all_skill(self) -> list[str]:
-        @sync_to_async
-        def extract_skills():
-            skills = self.objects.values_list("required_skills", flat=True)
-            unique_skills = set()
+    async def get_changes(self, query: JobChangeQuery) -> JobChangeFeed:
+        seq_range = Q(change_seq__gt=query.since, change_seq__lt=await self._change_watermark())
+        fields = list(JobField)
+
+        # Each source is cut at limit + 1 rows, which is enough to fill the merged page and tell whether more follow
+        jobs = await self._fetch_rows(
+            self.objects.filter(seq_range).order_by("change_seq")[: query.limit + 1],
+            [*fields, "change_seq", "created_at", "updated_at"],
+        )
+        tombstones = self.tombstones.filter(seq_range).order_by("change_seq")[: query.limit + 1]
+
+        changes = [
+            JobChange(
+                seq=job["change_seq"],
+                # Both columns default to the transaction time on insert, later updates move updated_at
+                type=JobChangeType.CREATED if job["created_at"] == job["updated_at"] else JobChangeType.UPDATED,
+                id=job["id"],
+                changed_at=job["updated_at"],
+                job=self._to_list_item(job, fields),
+            )
+            for job in jobs
+        ]
+        changes += [
+            JobChange(
+                seq=tombstone.change_seq, type=JobChangeType.DELETED, id=tombstone.id, changed_at=tombstone.deleted_at
+            )
+            async for tombstone in tombstones
+        ]
+        changes.sort(key=lambda change: change.seq)
+
+        page = changes[: query.limit]
+        return JobChangeFeed(
+            changes=page,
+            next_since=page[-1].seq if page else query.since,
+            has_more=len(changes) > query.limit,
+        )
+
+    async def get_change_head(self) -> int:
+        # The since that skips every change already visible in the feed
+        return await self._change_watermark() - 1
 
-            for skill_list in skills:
-                if isinstance(skill_list, list):
-                    unique_skills.update(skill_list)
+    async def get_all_skill(self, query: SkillListQuery) -> list[str] | list[SkillCount]:
+        qs = self.skills.order_by("name")
+        if query.prefix:
+            qs = qs.filter(name__istartswith=query.prefix)
 
-            return sorted(unique_skills)
+        if query.with_count:
+            return [skill.to_service_model() async for skill in qs]
+        return [name async for name in qs.values_list("name", flat=True)]
 
-        return await extract_skills()
+    @staticmethod
+    def _invalidate_caches() -> None:
+        job_count_cache.clear()
+        job_list_generation.bump()
+        skill_prefix_index.invalidate()
+
+    @staticmethod
+    async def _evict(job_id: UUID) -> None:
+        # A read that started before this write and finishes after it sees a new generation and skips the cache;
+        # other processes sharing a django cache backend are still only bounded by JOB_CACHE_TTL
+        job_cache_generation.bump()
+        await job_cache.delete(job_id)
 
     async def _get_or_raise(self, job_id: UUID) -> JobDBModel:
-        job = await sync_to_async(lambda: self.objects.filter(id=job_id).first())()
-        if job is None:
-            raise NotFoundException(f"Job with id {job_id} not found")
-        return job
+        # aget() adds no ORDER BY, unlike afirst() on an unordered queryset
+        try:
+            return await self.objects.aget(id=job_id)
+        except ObjectDoesNotExist:
+            raise NotFoundException(f"Job with id {job_id} not found") from None
+
+    @staticmethod
+    @sync_to_async
+    def _change_watermark() -> int:
+        # Every job_change_seq value below the result is either committed or never will be. Writers hold a shared
+        # advisory lock keyed at or below their first value until they end (migration 0007), and the sequence is read
+        # before the locks so a writer that starts in between draws a value at or above it
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT CASE WHEN is_called THEN last_value + 1 ELSE last_value END FROM {CHANGE_SEQUENCE}")
+            (watermark,) = cursor.fetchone()
+            cursor.execute(
+                "SELECT min((classid::bigint << 32) | objid::bigint) FROM pg_locks "
+                "WHERE locktype = 'advisory' AND objsubid = 1 "
+                "AND database = (SELECT oid FROM pg_database WHERE datname = current_database())"
+            )
+            (held,) = cursor.fetchone()
+        return watermark if held is None else min(watermark, held)
+
+    @sync_to_async
+    def _update_returning(self, job_id: UUID, changes: dict) -> JobDBModel | None:
+        # QuerySet.update() only reports a row count, so this is one UPDATE ... RETURNING round trip instead of
+        # SELECT + save(), and columns that did not change are left out of the SET list
+        meta = self.objects.model._meta
+        quote = connection.ops.quote_name
+        assignments = [(meta.get_field(name), value) for name, value in changes.items()]
+        returning = [field.column for field in meta.concrete_fields if not field.generated]
+
+        sql = (
+            f"UPDATE {quote(meta.db_table)} "
+            f"SET {', '.join(f'{quote(field.column)} = %s' for field, _ in assignments)} "
+            f"WHERE {quote(meta.pk.column)} = %s "
+            f"RETURNING {', '.join(quote(column) for column in returning)}"
+        )
+        params = [field.get_db_prep_save(value, connection) for field, value in assignments]
+        params.append(meta.pk.get_db_prep_value(job_id, connection))
+
+        # raw() maps the returned row onto the model and applies the same converters as a normal query
+        return next(iter(self.objects.raw(sql, params)), None)
+
+    async def _get_page_by_cursor(
+        self, qs: QuerySet, query: JobListQuery, cursor: JobCursor | None, total: int
+    ) -> PaginationResult:
+        order_field = query.order_by.value
+        backward = cursor is not None and cursor.direction == CursorDirection.PREV
+        descending = (query.sort_order == SortOrder.DESC) != backward
+
+        if cursor:
+            qs = qs.filter(self._seek_filter(order_field, cursor.value, cursor.id, descending))
+        qs = qs.order_by(*self._ordering(order_field, descending))
+
+        fields = query.selected_fields()
+        job_list = await self._fetch_rows(qs[: query.page_size + 1], list(dict.fromkeys([*fields, order_field])))
+        has_more = len(job_list) > query.page_size
+        job_list = job_list[: query.page_size]
+        if backward:
+            job_list.reverse()
+
+        has_next = backward or has_more
+        has_prev = has_more if backward else cursor is not None
+
+        def make_cursor(job: dict, direction: CursorDirection) -> str:
+            return JobCursor(
+                order_by=query.order_by,
+                sort_order=query.sort_order,
+                direction=direction,
+                value=job[order_field],
+                id=job["id"],
+            ).encode()
+
+        return PaginationResult.model_construct(
+            total=total,
+            count_mode=query.count_mode,
+            page=query.page,
+            page_size=query.page_size,
+            list=[self._to_list_item(job, fields, sparse=bool(query.fields)) for job in job_list],
+            next_cursor=make_cursor(job_list[-1], CursorDirection.NEXT) if job_list and has_next else None,
+            prev_cursor=make_cursor(job_list[0], CursorDirection.PREV) if job_list and has_prev else None,
+        )
+
+    @staticmethod
+    async def _fetch_rows(qs: QuerySet, columns: list[str]) -> list[dict]:
+        # values_list() skips building a JobDBModel per row
+        return [dict(zip(columns, row)) async for row in qs.values_list(*columns)]
+
+    @staticmethod
+    def _to_list_item(job: dict, fields: list[str], sparse: bool = False) -> JobResponse | JobPartialResponse:
+        # Rows come from columns whose types and constraints already match the schema, so neither the items nor the
+        # page around them are validated; only the nested and enum values need their Python types
+        values = {field: job[field] for field in fields}
+        if JobField.SALARY_RANGE in values:
+            salary_range = values[JobField.SALARY_RANGE]
+            values[JobField.SALARY_RANGE] = (
+                SalaryRange.model_construct(**salary_range)
+                if isinstance(salary_range, dict)
+                else SalaryRange.model_validate(salary_range)
+            )
+        if JobField.STATUS in values:
+            values[JobField.STATUS] = JobStatusEnum(values[JobField.STATUS])
+        return (JobPartialResponse if sparse else JobResponse).model_construct(**values)
+
+    @staticmethod
+    async def _count(qs: QuerySet, query: JobListQuery) -> int | None:
+        if query.count_mode == CountMode.NONE:
+            return None
+
+        if query.count_mode == CountMode.ESTIMATED:
+            plan = json.loads(await qs.aexplain(format="json"))
+            # Depending on the driver, Django hands back the plan either as PostgreSQL's one-element list or unwrapped
+            plan = plan[0] if isinstance(plan, list) else plan
+            return int(plan["Plan"]["Plan Rows"])
+
+        # Read before counting, like the list cache key: a count that overlaps a write is stored under the old
+        # generation, which no later lookup uses
+        cache_key = (job_list_generation.value, query.filter_key())
+        total = await job_count_cache.get(cache_key)
+        if total is None:
+            total = await qs.acount()
+            await job_count_cache.set(cache_key, total)
+        return total
+
+    @staticmethod
+    def _decode_cursor(query: JobListQuery) -> JobCursor:
+        cursor = JobCursor.decode(query.cursor)
+        if cursor.order_by != query.order_by or cursor.sort_order != query.sort_order:
+            raise InvalidQueryException("Cursor does not match the requested order_by and sort_order")
+        return cursor
+
+    @staticmethod
+    def _build_filters(query: JobFilterQuery) -> Q:
+        filters = Q()
+
+        if query.status:
+            filters &= Q(status=query.status)
+        if query.location:
+            if query.fuzzy:
+                filters &= JobRepository._fuzzy_filter("location", query.location, query.similarity_threshold)
+            else:
+                filters &= Q(location=query.location)
+        if query.company_name:
+            if query.fuzzy:
+                filters &= JobRepository._fuzzy_filter("company_name", query.company_name, query.similarity_threshold)
+            else:
+                filters &= Q(company_name__icontains=query.company_name)
+        if query.search:
+            filters &= Q(search_vector=JobRepository._search_query(query.search))
+        if query.skills:
+            # ?& / ?| match top-level array elements and are answered by the jsonb_ops GIN index
+            if query.skills_match == SkillMatch.ALL:
+                filters &= Q(required_skills__has_keys=query.skills)
+            else:
+                filters &= Q(required_skills__has_any_keys=query.skills)
+
+        return filters
+
+    @staticmethod
+    def _fuzzy_filter(field: str, value: str, threshold: float | None) -> Q:
+        # Upper() matches the trigram index expression, which also serves the icontains lookups
+        column = Upper(field)
+        term = Upper(Value(value))
+
+        condition = Q(TrigramWordSimilar(column, term))
+        if threshold is not None:
+            condition &= Q(GreaterThanOrEqual(TrigramWordSimilarity(term, column), threshold))
+        return condition
+
+    @staticmethod
+    def _search_query(search: str) -> SearchQuery:
+        return SearchQuery(search, search_type="websearch", config=SEARCH_CONFIG)
+
+    @staticmethod
+    def _ordering(order_field: str, descending: bool) -> list[str]:
+        # id breaks ties so the order matches the (order_field, id) composite index
+        if descending:
+            return [f"-{order_field}", "-id"]
+        return [order_field, "id"]
+
+    @staticmethod
+    def _seek_filter(order_field: str, value: date, job_id: UUID, descending: bool) -> Q:
+        # The outer range bound lets the planner start the index scan at the cursor position
+        if descending:
+            return Q(**{f"{order_field}__lte": value}) & (Q(**{f"{order_field}__lt": value}) | Q(id__lt=job_id))
+        return Q(**{f"{order_field}__gte": value}) & (Q(**{f"{order_field}__gt": value}) | Q(id__gt=job_id))
@@ -0,0 +1,9 @@
+from ninja import Schema
+
+
+class CacheStat(Schema):
+    backend: str
+    hits: int
+    misses: int
+    evictions: int | None = None
+    size: int | None = None
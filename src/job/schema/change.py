@@ -0,0 +1,45 @@
+from datetime import datetime
+from enum import StrEnum
+from uuid import UUID
+
+from ninja import Schema
+from pydantic import ConfigDict, Field
+
+from job.schema.job import JobResponse
+
+
+class JobChangeType(StrEnum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+
+class JobChangeQuery(Schema):
+    # The next_since of the previous response; 0 starts from the beginning
+    since: int = Field(default=0, ge=0)
+    limit: int = Field(default=100, ge=1, le=1000)
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class JobChangeStreamQuery(Schema):
+    # Replays changes after this seq before going live, omitted streams only new changes; Last-Event-ID takes
+    # precedence when a client reconnects
+    since: int | None = Field(default=None, ge=0)
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class JobChange(Schema):
+    seq: int
+    type: JobChangeType
+    id: UUID
+    changed_at: datetime
+    # The job as of this change, None for deletions
+    job: JobResponse | None = None
+
+
+class JobChangeFeed(Schema):
+    changes: list[JobChange]
+    next_since: int
+    has_more: bool
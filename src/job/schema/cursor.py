@@ -0,0 +1,35 @@
+import base64
+from datetime import date
+from enum import StrEnum
+from uuid import UUID
+
+from ninja import Schema
+from pydantic import ConfigDict
+
+from job.exception import InvalidQueryException
+from job.schema.job import JobSortField, SortOrder
+
+
+class CursorDirection(StrEnum):
+    NEXT = "next"
+    PREV = "prev"
+
+
+class JobCursor(Schema):
+    order_by: JobSortField
+    sort_order: SortOrder
+    direction: CursorDirection
+    value: date
+    id: UUID
+
+    model_config = ConfigDict(extra="forbid")
+
+    def encode(self) -> str:
+        return base64.urlsafe_b64encode(self.model_dump_json().encode()).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "JobCursor":
+        try:
+            return cls.model_validate_json(base64.urlsafe_b64decode(token.encode()))
+        except ValueError as exc:
+            raise InvalidQueryException("Invalid pagination cursor") from exc
@@ -1,18 +1,29 @@
+import json
 from datetime import date
 from enum import StrEnum
 from uuid import UUID
 
 from ninja import Schema
-from pydantic import ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_serializer, model_validator
 
 from job.enum_type import JobStatusEnum
 from job.schema.salary import SalaryRange
 
 
+def split_comma_separated(value):
+    # ?x=a,b and ?x=a&x=b are both accepted
+    if isinstance(value, str):
+        value = [value]
+    if isinstance(value, list):
+        return [part for item in value for part in (item.split(",") if isinstance(item, str) else [item]) if part]
+    return value
+
+
 class JobBase(Schema):
-    title: str
+    # Lengths match the varchar columns, a longer value would only fail in the database
+    title: str = Field(max_length=255)
     description: str
-    location: str
+    location: str = Field(max_length=255)
     salary_range: SalaryRange
     posting_date: date
     expiration_date: date
@@ -23,13 +34,13 @@ class JobBase(Schema):
 
 
 class JobCreate(JobBase):
-    company_name: str
+    company_name: str = Field(max_length=255)
 
 
 class JobUpdate(Schema):
-    title: str | None = None
+    title: str | None = Field(None, max_length=255)
     description: str | None = None
-    location: str | None = None
+    location: str | None = Field(None, max_length=255)
     salary_range: SalaryRange | None = None
     posting_date: date | None = None
     expiration_date: date | None = None
@@ -38,6 +49,14 @@ class JobUpdate(Schema):
 
     model_config = ConfigDict(extra="forbid")
 
+    @model_validator(mode="after")
+    def validate_no_null_fields(self):
+        # Omitted fields are left unchanged; an explicit null would try to clear a NOT NULL column
+        null_fields = sorted(field for field in self.model_fields_set if getattr(self, field) is None)
+        if null_fields:
+            raise ValueError(f"{', '.join(null_fields)} cannot be null")
+        return self
+
 
 class JobResponse(JobBase):
     id: UUID
@@ -46,9 +65,73 @@ class JobResponse(JobBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class JobField(StrEnum):
+    ID = "id"
+    TITLE = "title"
+    DESCRIPTION = "description"
+    LOCATION = "location"
+    SALARY_RANGE = "salary_range"
+    COMPANY_NAME = "company_name"
+    POSTING_DATE = "posting_date"
+    EXPIRATION_DATE = "expiration_date"
+    REQUIRED_SKILLS = "required_skills"
+    STATUS = "status"
+
+
+# A plain BaseModel: ninja's Schema re-validates nested instances from their attributes, which would mark every
+# field as set and bring the unselected ones back as null
+class JobPartialResponse(BaseModel):
+    id: UUID
+    title: str | None = None
+    description: str | None = None
+    location: str | None = None
+    salary_range: SalaryRange | None = None
+    company_name: str | None = None
+    posting_date: date | None = None
+    expiration_date: date | None = None
+    required_skills: list[str] | None = None
+    status: JobStatusEnum | None = None
+
+    @model_serializer(mode="wrap")
+    def serialize_selected_fields(self, handler):
+        # Fields that were not selected are left out instead of being rendered as null
+        data = handler(self)
+        return {field: value for field, value in data.items() if field in self.model_fields_set}
+
+
+class JobBulkItemResult(Schema):
+    index: int
+    success: bool
+    id: UUID | None = None
+    error: str | None = None
+
+
+class JobBulkCreateResult(Schema):
+    created: int
+    failed: int
+    results: list[JobBulkItemResult]
+
+
+class JobBatchQuery(Schema):
+    ids: list[UUID] = Field(..., min_length=1)
+
+    model_config = ConfigDict(extra="forbid")
+
+    @field_validator("ids", mode="before")
+    @classmethod
+    def split_ids(cls, value):
+        return split_comma_separated(value)
+
+
+class JobBatchResult(Schema):
+    jobs: list[JobResponse]
+    missing: list[UUID]
+
+
 class JobSortField(StrEnum):
     POSTING_DATE = "posting_date"
     EXPIRATION_DATE = "expiration_date"
+    RELEVANCE = "relevance"
 
 
 class SortOrder(StrEnum):
@@ -56,27 +139,120 @@ class SortOrder(StrEnum):
     DESC = "desc"
 
 
-class JobListQuery(Schema):
-    page: int = 1
-    page_size: int = 10
+class PaginationMode(StrEnum):
+    OFFSET = "offset"
+    CURSOR = "cursor"
+
+
+class CountMode(StrEnum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
 
+
+class SkillMatch(StrEnum):
+    ANY = "any"
+    ALL = "all"
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class JobFilterQuery(Schema):
     search: str | None = None
 
     status: JobStatusEnum | None = None
     location: str | None = None
     company_name: str | None = None
     skills: list[str] | None = None
+    skills_match: SkillMatch = SkillMatch.ANY
+
+    fuzzy: bool = False
+    # The trigram index pre-filters at pg_trgm's default word_similarity_threshold (0.6), so only stricter values apply
+    similarity_threshold: float | None = Field(default=None, ge=0.6, le=1.0)
+
+    # Sparse fieldset, e.g. fields=title,company_name,location; id is always returned
+    fields: list[JobField] | None = None
+
+    model_config = ConfigDict(extra="forbid")
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def split_fields(cls, value):
+        return split_comma_separated(value)
+
+    def selected_fields(self) -> list[JobField]:
+        if self.fields:
+            return list(dict.fromkeys([JobField.ID, *self.fields]))
+        return list(JobField)
+
+    def filter_key(self) -> str:
+        return json.dumps(
+            {
+                "search": self.search.lower() if self.search else None,
+                "status": self.status,
+                "location": self.location,
+                "company_name": self.company_name.lower() if self.company_name else None,
+                "skills": sorted(set(self.skills)) if self.skills else None,
+                "skills_match": self.skills_match,
+                "fuzzy": self.fuzzy,
+                "similarity_threshold": self.similarity_threshold,
+            },
+            sort_keys=True,
+        )
+
+
+class JobListQuery(JobFilterQuery):
+    page: int = 1
+    page_size: int = 10
+
+    pagination: PaginationMode = PaginationMode.OFFSET
+    cursor: str | None = None
+    count_mode: CountMode = CountMode.EXACT
 
     order_by: JobSortField | None = JobSortField.POSTING_DATE
     sort_order: SortOrder | None = SortOrder.DESC
 
-    model_config = ConfigDict(extra="forbid")
+    @model_validator(mode="after")
+    def validate_relevance_order(self):
+        if self.order_by == JobSortField.RELEVANCE:
+            if not self.search:
+                raise ValueError("order_by=relevance requires a search term")
+            if self.pagination == PaginationMode.CURSOR or self.cursor:
+                raise ValueError("cursor pagination does not support order_by=relevance")
+        return self
+
+    def query_key(self) -> str:
+        return json.dumps(
+            {
+                "filter": self.filter_key(),
+                "page": self.page,
+                "page_size": self.page_size,
+                "pagination": self.pagination,
+                "cursor": self.cursor,
+                "count_mode": self.count_mode,
+                "order_by": self.order_by,
+                "sort_order": self.sort_order,
+                "fields": sorted(set(self.fields)) if self.fields else None,
+            },
+            sort_keys=True,
+        )
+
+
+class JobExportQuery(JobFilterQuery):
+    format: ExportFormat = ExportFormat.NDJSON
 
 
 class PaginationResult(Schema):
-    total: int
+    total: int | None
+    count_mode: CountMode = CountMode.EXACT
     page: int
     page_size: int
-    list: list[JobResponse]
+    list: list[JobResponse] | list[JobPartialResponse]
+
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
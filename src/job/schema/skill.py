@@ -0,0 +1,21 @@
+from ninja import Schema
+from pydantic import ConfigDict, Field
+
+
+class SkillListQuery(Schema):
+    prefix: str | None = Field(default=None, min_length=1, max_length=100)
+    with_count: bool = False
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class SkillSuggestQuery(Schema):
+    prefix: str = Field(min_length=1, max_length=100)
+    limit: int = Field(default=10, ge=1, le=50)
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class SkillCount(Schema):
+    name: str
+    job_count: int
@@ -1,7 +1,31 @@
+import hashlib
+from typing import Any, AsyncIterator
 from uuid import UUID
 
+from django.conf import settings
+from pydantic import ValidationError
+
+from .cache import job_cache, job_count_cache, job_list_cache, job_list_generation
+from .change_stream import job_change_broker
+from .exception import InvalidQueryException, describe_validation_error
 from .repository import JobRepository
-from .schema.job import JobCreate, JobListQuery, JobResponse, JobUpdate, PaginationResult
+from .schema.cache import CacheStat
+from .schema.change import JobChangeFeed, JobChangeQuery, JobChangeStreamQuery
+from .schema.job import (
+    JobBatchQuery,
+    JobBatchResult,
+    JobBulkCreateResult,
+    JobBulkItemResult,
+    JobCreate,
+    JobExportQuery,
+    JobListQuery,
+    JobPartialResponse,
+    JobResponse,
+    JobUpdate,
+    PaginationResult,
+)
+from .schema.skill import SkillCount, SkillListQuery, SkillSuggestQuery
+from .skill_index import skill_prefix_index
 
 
 class JobService:
@@ -12,13 +36,72 @@ class JobService:
         created_job: JobResponse = await self.job_repository.create(create_job)
         return created_job
 
+    async def bulk_create_job(self, items: list[dict[str, Any]]) -> JobBulkCreateResult:
+        results: dict[int, JobBulkItemResult] = {}
+        valid_jobs: list[tuple[int, JobCreate]] = []
+
+        for index, item in enumerate(items):
+            try:
+                valid_jobs.append((index, JobCreate.model_validate(item)))
+            except ValidationError as exc:
+                results[index] = JobBulkItemResult(index=index, success=False, error=describe_validation_error(exc))
+
+        if valid_jobs:
+            created_jobs = await self.job_repository.bulk_create([job for _, job in valid_jobs])
+            for (index, _), created_job in zip(valid_jobs, created_jobs):
+                results[index] = JobBulkItemResult(index=index, success=True, id=created_job.id)
+
+        return JobBulkCreateResult(
+            created=len(valid_jobs),
+            failed=len(items) - len(valid_jobs),
+            results=[results[index] for index in range(len(items))],
+        )
+
     async def get_job(self, job_id: UUID) -> JobResponse:
         job: JobResponse = await self.job_repository.get_by_id(job_id)
         return job
 
-    async def get_all_job(self, query: JobListQuery) -> PaginationResult:
+    async def get_job_batch(self, query: JobBatchQuery) -> JobBatchResult:
+        job_ids = list(dict.fromkeys(query.ids))
+        if len(job_ids) > settings.JOB_BATCH_MAX_IDS:
+            raise InvalidQueryException(f"At most {settings.JOB_BATCH_MAX_IDS} ids can be fetched at once")
+
+        jobs = await self.job_repository.get_by_ids(job_ids)
+        return JobBatchResult(
+            jobs=[jobs[job_id] for job_id in job_ids if job_id in jobs],
+            missing=[job_id for job_id in job_ids if job_id not in jobs],
+        )
+
+    async def job_exists(self, job_id: UUID) -> bool:
+        return await self.job_repository.exists(job_id)
+
+    async def get_job_changes(self, query: JobChangeQuery) -> JobChangeFeed:
+        return await self.job_repository.get_changes(query)
+
+    def stream_job_changes(self, query: JobChangeStreamQuery, last_event_id: str | None) -> AsyncIterator[bytes]:
+        since = query.since
+        if last_event_id is not None:
+            if not last_event_id.isdigit():
+                raise InvalidQueryException("Last-Event-ID must be a change sequence number")
+            since = int(last_event_id)
+        return job_change_broker.stream(self.job_repository, since)
+
+    def export_jobs(self, query: JobExportQuery) -> AsyncIterator[JobResponse | JobPartialResponse]:
+        return self.job_repository.export(query)
+
+    async def get_all_job(self, query: JobListQuery) -> tuple[bytes, str]:
+        # A write bumps the generation, so entries from before it can no longer be looked up and age out of the LRU
+        cache_key = (job_list_generation.value, query.query_key())
+        cached: tuple[bytes, str] | None = await job_list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # The page is serialized once, for its ETag, and that same JSON is what gets cached and sent
         job_result: PaginationResult = await self.job_repository.get_all(query)
-        return job_result
+        body = job_result.model_dump_json().encode()
+        etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        await job_list_cache.set(cache_key, (body, etag))
+        return body, etag
 
     async def update_job(self, job_id: UUID, update_job: JobUpdate) -> JobResponse:
         updated: JobResponse = await self.job_repository.update(job_id, update_job)
@@ -27,6 +110,16 @@ class JobService:
     async def delete_job(self, job_id: UUID) -> bool:
         return await self.job_repository.delete(job_id)
 
-    async def get_all_skill(self) -> list[str]:
-        skill_list: list[str] = await self.job_repository.get_all_skill()
+    async def get_all_skill(self, query: SkillListQuery) -> list[str] | list[SkillCount]:
+        skill_list: list[str] | list[SkillCount] = await self.job_repository.get_all_skill(query)
         return skill_list
+
+    async def suggest_skill(self, query: SkillSuggestQuery) -> list[SkillCount]:
+        if skill_prefix_index.is_stale():
+            generation = skill_prefix_index.generation
+            skills: list[SkillCount] = await self.job_repository.get_all_skill(SkillListQuery(with_count=True))
+            skill_prefix_index.build(skills, generation)
+        return skill_prefix_index.suggest(query.prefix, query.limit)
+
+    async def get_cache_stat(self) -> dict[str, CacheStat]:
+        return {"job": job_cache.stat(), "job_count": job_count_cache.stat(), "job_list": job_list_cache.stat()}
@@ -0,0 +1,51 @@
+import heapq
+import time
+from bisect import bisect_left, bisect_right
+from threading import Lock
+
+from django.conf import settings
+
+from job.schema.skill import SkillCount
+
+
+class SkillPrefixIndex:
+    def __init__(self, ttl: float = 60.0):
+        self.ttl = ttl
+        self._keys: list[str] = []
+        self._skills: list[SkillCount] = []
+        self._expires_at = 0.0
+        self._generation = 0
+        self._lock = Lock()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def is_stale(self) -> bool:
+        return self._expires_at <= time.monotonic()
+
+    def build(self, skills: list[SkillCount], generation: int) -> None:
+        ordered = sorted(skills, key=lambda skill: skill.name.casefold())
+        with self._lock:
+            self._keys = [skill.name.casefold() for skill in ordered]
+            self._skills = ordered
+            # A write that landed while the catalog was being read leaves the index stale for the next caller
+            if generation == self._generation:
+                self._expires_at = time.monotonic() + self.ttl
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._expires_at = 0.0
+
+    def suggest(self, prefix: str, limit: int) -> list[SkillCount]:
+        key = prefix.casefold()
+        with self._lock:
+            keys, skills = self._keys, self._skills
+
+        start = bisect_left(keys, key)
+        end = bisect_right(keys, key + chr(0x10FFFF), lo=start)
+        return heapq.nlargest(limit, skills[start:end], key=lambda skill: skill.job_count)
+
+
+skill_prefix_index = SkillPrefixIndex(ttl=settings.SKILL_INDEX_TTL)
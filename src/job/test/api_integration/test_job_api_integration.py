@@ -1,7 +1,23 @@
+import asyncio
+import csv
+import io
+import json
+from datetime import date
+
+import psycopg2
 import pytest
+from asgiref.sync import async_to_sync
 from django.core.asgi import get_asgi_application
+from django.core.management import call_command
+from django.db import connection
 from httpx import ASGITransport, AsyncClient
 
+from job.change_stream import job_change_broker
+from job.model import JobDBModel, JobSkillDBModel
+from job.repository import JobRepository
+from job.schema.change import JobChangeQuery
+from job.schema.job import JobField, JobListQuery, SkillMatch
+
 
 @pytest.mark.asyncio
 @pytest.mark.django_db
@@ -109,6 +125,26 @@ async def test_positive_when_multiple_jobs_exist_then_job_list_is_returned(auth_
     assert len(data["list"]) > 0
 
 
+@pytest.mark.asyncio
+@pytest.mark.django_db
+async def test_positive_when_count_mode_is_estimated_then_total_is_the_planner_estimate(
+    auth_header, create_multiple_jobs
+):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=auth_header) as client:
+        response = await client.get("/api/job/", params={"status": "active", "count_mode": "estimated"})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["count_mode"] == "estimated"
+    assert isinstance(response.json()["total"], int)
+    assert response.json()["total"] >= 1
+
+
 @pytest.mark.asyncio
 @pytest.mark.django_db
 async def test_positive_when_filter_by_active_status_then_only_active_jobs_are_returned(
@@ -132,7 +168,6 @@ async def test_positive_when_filter_by_active_status_then_only_active_jobs_are_r
 @pytest.mark.asyncio
 @pytest.mark.django_db
 async def test_positive_when_search_keyword_is_given_then_matched_jobs_are_returned(auth_header, create_multiple_jobs):
-
     # Mock
     app = get_asgi_application()
     transport = ASGITransport(app=app)
@@ -213,7 +248,6 @@ async def test_negative_when_invalid_job_payload_then_API_returns_422(auth_heade
 @pytest.mark.asyncio
 @pytest.mark.django_db
 async def test_negative_when_create_job_with_unexpected_field_then_return_422(auth_header):
-
     # Mock
     app = get_asgi_application()
     transport = ASGITransport(app=app)
@@ -273,7 +307,6 @@ async def test_negative_when_delete_by_non_existent_job_id_then_API_returns_404(
 @pytest.mark.asyncio
 @pytest.mark.django_db
 async def test_negative_when_missing_token_then_API_returns_401():
-
     # Mock
     app = get_asgi_application()
     transport = ASGITransport(app=app)
@@ -295,3 +328,643 @@ async def test_negative_when_missing_token_then_API_returns_401():
     async with AsyncClient(transport=transport, base_url="http://test") as client:
         response = await client.post("/api/job/", json=payload)
         assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_positive_when_paging_with_cursor_then_every_job_is_returned_once(auth_header, create_multiple_jobs):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    params = {"page_size": 2, "pagination": "cursor", "search": "Integration"}
+    seen_ids = []
+    pages = []
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=auth_header) as client:
+        response = await client.get("/api/job/", params=params)
+        while True:
+            assert response.status_code == 200
+            data = response.json()
+            pages.append(data)
+            seen_ids.extend(job["id"] for job in data["list"])
+            if data["next_cursor"] is None:
+                break
+            response = await client.get("/api/job/", params={**params, "cursor": data["next_cursor"]})
+
+        back_response = await client.get("/api/job/", params={**params, "cursor": pages[-1]["prev_cursor"]})
+
+    # Assert
+    assert len(seen_ids) == len(set(seen_ids)) == pages[0]["total"]
+    assert pages[0]["prev_cursor"] is None
+    assert [job["id"] for job in back_response.json()["list"]] == [job["id"] for job in pages[-2]["list"]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_positive_when_fuzzy_company_name_has_typo_then_matched_jobs_are_returned(auth_header, created_job_id):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=auth_header) as client:
+        response = await client.get("/api/job/", params={"company_name": "TestCoo", "fuzzy": True})
+
+    # Assert
+    assert response.status_code == 200
+    assert [job["id"] for job in response.json()["list"]] == [str(created_job_id.id)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_positive_when_filtering_skills_with_all_match_then_only_jobs_with_every_skill_are_returned(
+    auth_header, created_job_id
+):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=auth_header) as client:
+        all_response = await client.get("/api/job/", params={"skills": ["Python", "Go"], "skills_match": "all"})
+        any_response = await client.get("/api/job/", params={"skills": ["Python", "Go"], "skills_match": "any"})
+
+    # Assert
+    assert all_response.json()["list"] == []
+    assert [job["id"] for job in any_response.json()["list"]] == [str(created_job_id.id)]
+
+
+@pytest.mark.django_db
+def test_positive_when_filtering_skills_then_planner_can_use_gin_index(create_multiple_jobs):
+    # Arrange
+    query = JobListQuery(skills=["Python", "Go"], skills_match=SkillMatch.ALL)
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+
+    # Act
+    plan = JobDBModel.objects.filter(JobRepository._build_filters(query)).explain()
+
+    # Assert
+    assert "job_post_required_skills_idx" in plan
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_positive_when_jobs_are_written_then_skill_catalog_counts_follow(auth_header, created_job_id):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=auth_header) as client:
+        await client.put(
+            f"/api/job/{created_job_id.id}",
+            json={
+                "title": "Test Job",
+                "description": "Fixture created job",
+                "location": "Taipei",
+                "salary_range": {"min": 50000, "max": 70000},
+                "posting_date": "2024-01-01",
+                "expiration_date": "2024-12-31",
+                "required_skills": ["Python", "Pytest"],
+                "status": "active",
+            },
+        )
+        counts = await client.get("/api/job/skill_list", params={"prefix": "py", "with_count": True})
+        await client.delete(f"/api/job/{created_job_id.id}")
+        after_delete = await client.get("/api/job/skill_list")
+
+    # Assert
+    assert counts.json() == [{"name": "Pytest", "job_count": 1}, {"name": "Python", "job_count": 1}]
+    assert after_delete.json() == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_positive_when_job_is_created_then_skill_suggestions_are_refreshed(auth_header, created_job_id):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=auth_header) as client:
+        before = await client.get("/api/job/skill_suggest", params={"prefix": "dj"})
+        await client.post(
+            "/api/job/",
+            json={
+                "title": "Backend Engineer",
+                "description": "Build scalable backend services",
+                "location": "Taipei",
+                "salary_range": {"min": 90000, "max": 120000},
+                "company_name": "TechNova",
+                "posting_date": "2024-01-01",
+                "expiration_date": "2024-12-31",
+                "required_skills": ["Django"],
+                "status": "active",
+            },
+        )
+        after = await client.get("/api/job/skill_suggest", params={"prefix": "dj"})
+
+    # Assert
+    assert before.json() == [{"name": "Django", "job_count": 1}]
+    assert after.json() == [{"name": "Django", "job_count": 2}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_positive_when_cached_job_is_updated_then_next_read_returns_new_values(auth_header, created_job_id):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=auth_header) as client:
+        before = await client.get(f"/api/job/{created_job_id.id}")
+        cached = await client.get(f"/api/job/{created_job_id.id}")
+        await client.put(
+            f"/api/job/{created_job_id.id}",
+            json={
+                "title": "Renamed Job",
+                "description": "Fixture created job",
+                "location": "Taipei",
+                "salary_range": {"min": 50000, "max": 70000},
+                "posting_date": "2024-01-01",
+                "expiration_date": "2024-12-31",
+                "required_skills": ["Python", "Django"],
+                "status": "active",
+            },
+        )
+        after = await client.get(f"/api/job/{created_job_id.id}")
+        stat = await client.get("/api/job/cache_stat")
+
+    # Assert
+    assert before.json()["title"] == cached.json()["title"] == "Test Job"
+    assert after.json()["title"] == "Renamed Job"
+    assert stat.json()["job"]["hits"] >= 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_positive_when_list_is_unchanged_then_etag_revalidation_returns_304(auth_header, created_job_id):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=auth_header) as client:
+        first = await client.get("/api/job/")
+        etag = first.headers["ETag"]
+        unchanged = await client.get("/api/job/", headers={"If-None-Match": etag})
+        await client.delete(f"/api/job/{created_job_id.id}")
+        changed = await client.get("/api/job/", headers={"If-None-Match": etag})
+
+    # Assert
+    assert unchanged.status_code == 304
+    assert changed.status_code == 200
+    assert changed.json()["list"] == []
+    assert changed.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_positive_when_bulk_creating_jobs_then_valid_items_are_inserted(auth_header):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+    item = {
+        "title": "Bulk Engineer",
+        "description": "Imported from partner feed",
+        "location": "Taipei",
+        "salary_range": {"min": 50000, "max": 70000},
+        "company_name": "FeedCo",
+        "posting_date": "2024-01-01",
+        "expiration_date": "2024-12-31",
+        "required_skills": ["Rust"],
+        "status": "active",
+    }
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=auth_header) as client:
+        response = await client.post("/api/job/bulk", json=[item, {**item, "status": "unknown"}, item])
+        listed = await client.get("/api/job/", params={"company_name": "FeedCo"})
+        skills = await client.get("/api/job/skill_list", params={"prefix": "rust", "with_count": True})
+
+    # Assert
+    assert response.status_code == 200
+    assert (response.json()["created"], response.json()["failed"]) == (2, 1)
+    assert listed.json()["total"] == 2
+    assert skills.json() == [{"name": "Rust", "job_count": 2}]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_positive_when_importing_ndjson_then_jobs_are_upserted_through_copy(tmp_path):
+    # Arrange
+    job_id = "00000000-0000-0000-0000-0000000000aa"
+    record = {
+        "id": job_id,
+        "title": "Imported Engineer",
+        "description": "From the partner feed",
+        "location": "Taipei",
+        "salary_range": {"min": 50000, "max": 70000},
+        "company_name": "FeedCo",
+        "posting_date": "2024-01-01",
+        "expiration_date": "2024-12-31",
+        "required_skills": ["Python"],
+        "status": "active",
+    }
+    first_file = tmp_path / "first.ndjson"
+    first_file.write_text(json.dumps(record) + "\n" + json.dumps({"title": "broken"}) + "\n")
+    second_file = tmp_path / "second.ndjson"
+    second_file.write_text(json.dumps({**record, "title": "Renamed Engineer", "required_skills": ["Go"]}) + "\n")
+
+    # Act
+    call_command("import_jobs", str(first_file), stdout=io.StringIO(), stderr=io.StringIO())
+    call_command("import_jobs", str(second_file), "--on-conflict", "skip", stdout=io.StringIO())
+    skipped_title = JobDBModel.objects.get(id=job_id).title
+    call_command("import_jobs", str(second_file), stdout=io.StringIO())
+
+    # Assert
+    job = JobDBModel.objects.get(id=job_id)
+    assert JobDBModel.objects.count() == 1
+    assert skipped_title == "Imported Engineer"
+    assert (job.title, job.required_skills) == ("Renamed Engineer", ["Go"])
+    assert list(JobSkillDBModel.objects.values_list("name", "job_count")) == [("Go", 1)]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_positive_when_reimporting_unchanged_rows_then_they_are_not_fed_as_changes(tmp_path):
+    # Arrange
+    record = {
+        "id": "00000000-0000-0000-0000-0000000000ab",
+        "title": "Imported Engineer",
+        "description": "From the partner feed",
+        "location": "Taipei",
+        "salary_range": {"min": 50000, "max": 70000},
+        "company_name": "FeedCo",
+        "posting_date": "2024-01-01",
+        "expiration_date": "2024-12-31",
+        "required_skills": ["Python"],
+        "status": "active",
+    }
+    ndjson_file = tmp_path / "jobs.ndjson"
+    ndjson_file.write_text(json.dumps(record) + "\n")
+    job_repository = JobRepository()
+
+    # Act
+    call_command("import_jobs", str(ndjson_file), stdout=io.StringIO())
+    since = async_to_sync(job_repository.get_change_head)()
+    call_command("import_jobs", str(ndjson_file), stdout=io.StringIO())
+    feed = async_to_sync(job_repository.get_changes)(JobChangeQuery(since=since))
+
+    # Assert
+    assert feed.changes == []
+    assert JobDBModel.objects.get(id=record["id"]).change_seq <= since
+
+
+@pytest.mark.django_db(transaction=True)
+def test_negative_when_import_rows_are_not_job_objects_then_they_are_reported_and_skipped(tmp_path):
+    # Arrange
+    record = {
+        "title": "Imported Engineer",
+        "description": "From the partner feed",
+        "location": "Taipei",
+        "salary_range": {"min": 50000, "max": 70000},
+        "company_name": "FeedCo",
+        "posting_date": "2024-01-01",
+        "expiration_date": "2024-12-31",
+        "required_skills": ["Python"],
+        "status": "active",
+    }
+    ndjson_file = tmp_path / "jobs.ndjson"
+    # The last line would not fit the varchar(255) title column
+    ndjson_file.write_text(
+        "123\nnull\n[1, 2]\n" + json.dumps(record) + "\n" + json.dumps({**record, "title": "x" * 256}) + "\n"
+    )
+    csv_file = tmp_path / "jobs.csv"
+    csv_file.write_text(",".join(record) + "\nShort row,only two cells\n")
+    stderr = io.StringIO()
+
+    # Act
+    call_command("import_jobs", str(ndjson_file), stdout=io.StringIO(), stderr=stderr)
+    call_command("import_jobs", str(csv_file), stdout=io.StringIO(), stderr=stderr)
+
+    # Assert
+    assert JobDBModel.objects.count() == 1
+    assert [line.split(":")[0] for line in stderr.getvalue().splitlines()] == [
+        "Line 1",
+        "Line 2",
+        "Line 3",
+        "Line 5",
+        "Line 2",
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_positive_when_importing_empty_strings_then_they_are_not_copied_as_null(tmp_path):
+    # Arrange
+    record = {
+        "title": "Imported Engineer",
+        "description": "",
+        "location": "",
+        "salary_range": {"min": 50000, "max": 70000},
+        "company_name": "FeedCo",
+        "posting_date": "2024-01-01",
+        "expiration_date": "2024-12-31",
+        "required_skills": [],
+        "status": "active",
+    }
+    file = tmp_path / "jobs.ndjson"
+    file.write_text(json.dumps(record) + "\n")
+
+    # Act
+    call_command("import_jobs", str(file), stdout=io.StringIO())
+
+    # Assert
+    job = JobDBModel.objects.get()
+    assert (job.description, job.location) == ("", "")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_positive_when_generating_jobs_then_rows_and_skill_catalog_are_loaded():
+    # Act
+    call_command("generate_jobs", "500", "--batch-size", "120", "--workers", "2", stdout=io.StringIO())
+
+    # Assert
+    skill_total = sum(JobSkillDBModel.objects.values_list("job_count", flat=True))
+    assert JobDBModel.objects.count() == 500
+    assert skill_total == sum(len(skills) for skills in JobDBModel.objects.values_list("required_skills", flat=True))
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_positive_when_listing_jobs_then_server_timing_reports_sql_queries(auth_header, created_job_id):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=auth_header) as client:
+        response = await client.get("/api/job/")
+
+    # Assert
+    assert response.status_code == 200
+    db_timing = response.headers["Server-Timing"].split(", ")[0]
+    assert db_timing.startswith("db;dur=")
+    assert int(db_timing.split('desc="')[1].split(" ")[0]) >= 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_positive_when_patching_one_field_then_other_fields_are_kept_in_one_statement(
+    auth_header, created_job_id
+):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=auth_header) as client:
+        response = await client.patch(
+            f"/api/job/{created_job_id.id}", json={"title": "Patched Title", "salary_range": {"min": 1000}}
+        )
+        fetched = await client.get(f"/api/job/{created_job_id.id}")
+        missing = await client.patch("/api/job/00000000-0000-0000-0000-000000000000", json={"title": "Nobody"})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["title"] == "Patched Title"
+    assert response.json()["salary_range"] == {"min": 1000, "max": None}
+    assert response.json()["description"] == created_job_id.description
+    assert fetched.json() == response.json()
+    # The auth user lookup plus a single UPDATE ... RETURNING
+    assert 'desc="2 queries"' in response.headers["Server-Timing"]
+    assert missing.status_code == 404
+
+    # The generated search_vector is recomputed from the new title
+    search_vector = await JobDBModel.objects.filter(id=created_job_id.id).values_list("search_vector", flat=True).aget()
+    assert "'patch':1A" in search_vector
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_positive_when_checking_job_with_head_then_existence_is_answered_without_body(
+    auth_header, created_job_id
+):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=auth_header) as client:
+        found = await client.head(f"/api/job/{created_job_id.id}")
+        missing = await client.head("/api/job/00000000-0000-0000-0000-000000000000")
+
+    # Assert
+    assert found.status_code == 200
+    assert found.content == b""
+    assert missing.status_code == 404
+    # The auth user lookup plus a single SELECT 1 ... LIMIT 1
+    assert 'desc="2 queries"' in found.headers["Server-Timing"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_positive_when_fetching_jobs_in_batch_then_order_and_missing_ids_are_reported(
+    auth_header, create_multiple_jobs
+):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    job_ids = [str(job_id) async for job_id in JobDBModel.objects.order_by("-title").values_list("id", flat=True)]
+    missing_id = "00000000-0000-0000-0000-000000000000"
+    requested = [job_ids[2], missing_id, job_ids[0], job_ids[1]]
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=auth_header) as client:
+        cold = await client.get("/api/job/batch", params={"ids": ",".join(requested)})
+        warm = await client.post("/api/job/batch", json={"ids": [job_ids[0], job_ids[2]]})
+
+    # Assert
+    assert cold.status_code == 200
+    assert [job["id"] for job in cold.json()["jobs"]] == [job_ids[2], job_ids[0], job_ids[1]]
+    assert cold.json()["missing"] == [missing_id]
+    assert [job["id"] for job in warm.json()["jobs"]] == [job_ids[0], job_ids[2]]
+    # The auth user lookup plus one id__in query; the second request is served from the job cache
+    assert 'desc="2 queries"' in cold.headers["Server-Timing"]
+    assert 'desc="1 queries"' in warm.headers["Server-Timing"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_positive_when_listing_with_fields_then_only_selected_fields_are_returned(
+    auth_header, create_multiple_jobs
+):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=auth_header) as client:
+        offset_page = await client.get("/api/job/", params={"fields": "title,company_name", "page_size": 2})
+        first_page = await client.get(
+            "/api/job/", params={"fields": "title", "pagination": "cursor", "page_size": 3, "order_by": "posting_date"}
+        )
+        second_page = await client.get(
+            "/api/job/",
+            params={
+                "fields": "title",
+                "cursor": first_page.json()["next_cursor"],
+                "page_size": 3,
+                "order_by": "posting_date",
+            },
+        )
+
+    # Assert
+    assert offset_page.status_code == 200
+    assert {tuple(job) for job in offset_page.json()["list"]} == {("id", "title", "company_name")}
+    assert {tuple(job) for job in first_page.json()["list"] + second_page.json()["list"]} == {("id", "title")}
+    titles = [job["title"] for job in first_page.json()["list"] + second_page.json()["list"]]
+    assert sorted(titles) == [f"Job {i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_positive_when_exporting_jobs_then_every_match_is_streamed(auth_header, create_multiple_jobs):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=auth_header) as client:
+        ndjson = await client.get("/api/job/export", params={"skills": "Python"})
+        csv_export = await client.get(
+            "/api/job/export", params={"format": "csv", "fields": "title,salary_range", "search": "Job"}
+        )
+        empty = await client.get("/api/job/export", params={"format": "csv", "location": "Nowhere"})
+
+    # Assert
+    assert ndjson.status_code == 200
+    assert ndjson.headers["Content-Type"] == "application/x-ndjson"
+    jobs = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert sorted(job["title"] for job in jobs) == [f"Job {i}" for i in range(5)]
+    assert jobs[0]["salary_range"] == {"min": 80000, "max": 100000}
+
+    rows = list(csv.reader(io.StringIO(csv_export.text)))
+    assert csv_export.headers["Content-Disposition"] == 'attachment; filename="jobs.csv"'
+    assert rows[0] == ["id", "title", "salary_range"]
+    assert len(rows) == 6
+    assert json.loads(rows[1][2]) == {"min": 80000, "max": 100000}
+    assert list(csv.reader(io.StringIO(empty.text))) == [list(JobField)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_positive_when_reading_changes_then_writes_since_checkpoint_are_returned_in_order(
+    auth_header, create_multiple_jobs
+):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=auth_header) as client:
+        initial = await client.get("/api/job/changes", params={"limit": 3})
+        rest = await client.get("/api/job/changes", params={"since": initial.json()["next_since"]})
+        checkpoint = rest.json()["next_since"]
+
+        job_ids = [change["id"] for change in initial.json()["changes"] + rest.json()["changes"]]
+        await client.patch(f"/api/job/{job_ids[0]}", json={"title": "Changed"})
+        await client.delete(f"/api/job/{job_ids[1]}")
+        created = await client.post(
+            "/api/job/",
+            json={
+                "title": "Feed Engineer",
+                "description": "Created after the checkpoint",
+                "location": "Taipei",
+                "salary_range": {"min": 60000, "max": 90000},
+                "company_name": "FeedCo",
+                "posting_date": "2024-01-01",
+                "expiration_date": "2024-12-31",
+                "required_skills": ["Python"],
+                "status": "active",
+            },
+        )
+        changes = await client.get("/api/job/changes", params={"since": checkpoint})
+        caught_up = await client.get("/api/job/changes", params={"since": changes.json()["next_since"]})
+
+    # Assert
+    assert initial.json()["has_more"] is True
+    assert rest.json()["has_more"] is False
+    assert len(set(job_ids)) == 5
+    assert {change["type"] for change in initial.json()["changes"] + rest.json()["changes"]} == {"created"}
+
+    feed = changes.json()["changes"]
+    assert [(change["type"], change["id"]) for change in feed] == [
+        ("updated", job_ids[0]),
+        ("deleted", job_ids[1]),
+        ("created", created.json()["id"]),
+    ]
+    assert feed[0]["job"]["title"] == "Changed"
+    assert feed[1]["job"] is None
+    assert feed[0]["seq"] < feed[1]["seq"] < feed[2]["seq"]
+    assert caught_up.json() == {"changes": [], "next_since": changes.json()["next_since"], "has_more": False}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_positive_when_an_earlier_write_is_uncommitted_then_changes_stop_before_it(created_job_id):
+    # Arrange
+    job_repository = JobRepository()
+    since = JobDBModel.objects.get(id=created_job_id.id).change_seq
+    other = psycopg2.connect(**connection.get_connection_params())
+
+    # Act
+    with other, other.cursor() as cursor:
+        # Draws the next sequence value but leaves its transaction open
+        cursor.execute("UPDATE job_post SET title = 'In flight' WHERE id = %s", [str(created_job_id.id)])
+        JobDBModel.objects.create(
+            title="Committed later",
+            description="Written after the open transaction drew its sequence value",
+            location="Taipei",
+            salary_range={"min": 50000, "max": 70000},
+            company_name="TestCo",
+            posting_date=date(2024, 1, 1),
+            expiration_date=date(2024, 12, 31),
+            required_skills=["Python"],
+            status="active",
+        )
+        blocked = async_to_sync(job_repository.get_changes)(JobChangeQuery(since=since))
+    released = async_to_sync(job_repository.get_changes)(JobChangeQuery(since=since))
+    other.close()
+
+    # Assert
+    assert blocked.changes == []
+    assert [change.job.title for change in released.changes] == ["In flight", "Committed later"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_positive_when_a_job_is_created_then_every_change_stream_receives_it(fake_job_create_data):
+    # Arrange
+    job_repository = JobRepository()
+    streams = [job_change_broker.stream(job_repository, None) for _ in range(2)]
+    pending = [asyncio.create_task(anext(stream)) for stream in streams]
+    await asyncio.sleep(0)
+    await asyncio.wait_for(job_change_broker._ready.wait(), 5)
+
+    # Act
+    created = await job_repository.create(fake_job_create_data)
+    events = await asyncio.wait_for(asyncio.gather(*pending), 5)
+    for stream in streams:
+        await stream.aclose()
+    await asyncio.wait_for(job_change_broker._task, 5)
+
+    # Assert
+    assert len(set(events)) == 1
+    event = events[0].decode()
+    assert "event: created\n" in event
+    assert f'"id":"{created.id}"' in event
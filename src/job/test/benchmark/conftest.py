@@ -0,0 +1,52 @@
+import os
+from itertools import islice
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from ninja_jwt.tokens import RefreshToken
+
+from job.bulk_load import ConflictAction, JobCopyLoader
+from job.cache import job_cache, job_count_cache, job_list_cache
+from job.data_generator import JobGenerator
+from job.model import JobDBModel
+from job.skill_index import skill_prefix_index
+
+
+@pytest.fixture
+def benchmark_job_count() -> int:
+    return int(os.getenv("BENCHMARK_JOB_COUNT", "1000"))
+
+
+@pytest.fixture
+def benchmark_auth_header(transactional_db) -> dict:
+    user, _ = get_user_model().objects.get_or_create(username="benchmark", defaults={"is_active": True})
+    access = RefreshToken.for_user(user).access_token
+    return {"Authorization": f"Bearer {str(access)}"}
+
+
+@pytest.fixture
+def benchmark_job_ids(transactional_db, benchmark_job_count) -> list:
+    # Same seed as generate_jobs' default, so results line up with a dev database loaded by that command
+    jobs = JobGenerator(seed=42).generate(benchmark_job_count)
+    job_ids = []
+    with JobCopyLoader(ConflictAction.SKIP) as loader:
+        while batch := list(islice(jobs, 10000)):
+            loader.load(batch)
+            job_ids.extend(job_id for job_id, _ in batch)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {JobDBModel._meta.db_table}")
+    return job_ids
+
+
+@pytest.fixture
+def clear_job_caches():
+    # Benchmarks time the database path, so every run starts without cached counts, pages or jobs
+    def clear():
+        job_cache.clear()
+        job_count_cache.clear()
+        job_list_cache.clear()
+        skill_prefix_index.invalidate()
+
+    return clear
@@ -0,0 +1,46 @@
+import asyncio
+import os
+import time
+
+import pytest
+from django.core.asgi import get_asgi_application
+from httpx import ASGITransport, AsyncClient
+
+from job.test.utils.benchmark import record_benchmark, summarize_latency
+
+CONCURRENCY = int(os.getenv("BENCHMARK_CONCURRENCY", "50"))
+REQUEST_COUNT = int(os.getenv("BENCHMARK_REQUEST_COUNT", "2000"))
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_benchmark_concurrent_list_and_get_traffic(benchmark_auth_header, benchmark_job_ids):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    latencies: list[float] = []
+
+    # Arrange
+    paths = [
+        f"/api/job/{benchmark_job_ids[i % len(benchmark_job_ids)]}" if i % 2 else f"/api/job/?page={i % 20 + 1}"
+        for i in range(REQUEST_COUNT)
+    ]
+
+    async def send(client: AsyncClient, path: str):
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - started)
+            assert response.status_code == 200
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=benchmark_auth_header) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(send(client, path) for path in paths))
+        elapsed = time.perf_counter() - started
+
+    # Assert
+    result = summarize_latency(latencies, elapsed)
+    record_benchmark("job_api_load", {"concurrency": CONCURRENCY, **result})
+    assert result["requests"] == REQUEST_COUNT
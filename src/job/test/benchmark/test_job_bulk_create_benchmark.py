@@ -0,0 +1,55 @@
+import os
+import time
+
+import pytest
+from django.core.asgi import get_asgi_application
+from httpx import ASGITransport, AsyncClient
+
+from job.test.utils.benchmark import record_benchmark
+
+BULK_JOB_COUNT = int(os.getenv("BENCHMARK_BULK_JOB_COUNT", "2000"))
+
+
+def make_job_payload(index: int) -> dict:
+    return {
+        "title": f"Feed Engineer {index}",
+        "description": "Imported from the nightly partner feed",
+        "location": "Taipei",
+        "salary_range": {"min": 60000, "max": 90000},
+        "company_name": f"Partner {index % 20}",
+        "posting_date": "2024-01-01",
+        "expiration_date": "2024-12-31",
+        "required_skills": ["Python", "SQL"],
+        "status": "active",
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_benchmark_bulk_create_against_single_create(benchmark_auth_header):
+    # Arrange
+    transport = ASGITransport(app=get_asgi_application())
+    payloads = [make_job_payload(i) for i in range(BULK_JOB_COUNT)]
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=benchmark_auth_header) as client:
+        started = time.perf_counter()
+        for payload in payloads:
+            response = await client.post("/api/job/", json=payload)
+            assert response.status_code == 200
+        single_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        response = await client.post("/api/job/bulk", json=payloads)
+        bulk_elapsed = time.perf_counter() - started
+
+    # Assert
+    assert response.json()["created"] == BULK_JOB_COUNT
+    record_benchmark(
+        "job_bulk_create",
+        {
+            "job_count": BULK_JOB_COUNT,
+            "single_rows_per_s": round(BULK_JOB_COUNT / single_elapsed, 1),
+            "bulk_rows_per_s": round(BULK_JOB_COUNT / bulk_elapsed, 1),
+        },
+    )
@@ -0,0 +1,43 @@
+import time
+import tracemalloc
+
+import pytest
+from django.conf import settings
+
+from job.export import encode_export
+from job.repository import JobRepository
+from job.schema.job import ExportFormat, JobExportQuery
+from job.test.utils.benchmark import record_benchmark
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_benchmark_export_streams_in_flat_memory(benchmark_job_ids):
+    # Arrange
+    job_repository = JobRepository()
+    results = {}
+
+    # Act
+    for export_format in ExportFormat:
+        query = JobExportQuery(format=export_format)
+        size = 0
+        tracemalloc.start()
+        started = time.perf_counter()
+        async for chunk in encode_export(
+            job_repository.export(query), export_format, query.selected_fields(), settings.JOB_EXPORT_CHUNK_SIZE
+        ):
+            size += len(chunk)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[export_format.value] = {
+            "bytes": size,
+            "elapsed_s": round(elapsed, 3),
+            "rows_per_s": round(len(benchmark_job_ids) / elapsed),
+            "peak_memory_kb": round(peak / 1024),
+        }
+
+    # Assert
+    record_benchmark("job_export", {"job_count": len(benchmark_job_ids), "timings": results})
+    assert all(result["bytes"] > 0 for result in results.values())
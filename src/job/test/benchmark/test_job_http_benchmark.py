@@ -0,0 +1,61 @@
+import os
+
+import pytest
+from django.core.asgi import get_asgi_application
+from httpx import ASGITransport, AsyncClient, Response
+
+from job.data_generator import LOCATIONS, SKILLS
+from job.test.utils.benchmark import measure, record_benchmark
+
+REPEAT = int(os.getenv("BENCHMARK_REPEAT", "20"))
+
+JOB_PAYLOAD = {
+    "title": "HTTP Benchmark Engineer",
+    "description": "Created by the HTTP benchmark",
+    "location": "Taipei",
+    "salary_range": {"min": 60000, "max": 90000},
+    "company_name": "BenchCo",
+    "posting_date": "2024-01-01",
+    "expiration_date": "2024-12-31",
+    "required_skills": ["Python", "SQL"],
+    "status": "active",
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_benchmark_http_hot_paths(benchmark_auth_header, benchmark_job_ids, clear_job_caches):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    job_id = benchmark_job_ids[len(benchmark_job_ids) // 2]
+    update_payload = {key: value for key, value in JOB_PAYLOAD.items() if key != "company_name"}
+    timings = {}
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=benchmark_auth_header) as client:
+
+        async def call(method: str, path: str, **kwargs) -> Response:
+            response = await client.request(method, path, **kwargs)
+            assert response.status_code == 200
+            return response
+
+        cases = {
+            "list": lambda: call("GET", "/api/job/"),
+            "list_filtered": lambda: call(
+                "GET", "/api/job/", params={"location": LOCATIONS[0], "skills": SKILLS[0], "search": "engineer"}
+            ),
+            "get": lambda: call("GET", f"/api/job/{job_id}"),
+            "skill_list": lambda: call("GET", "/api/job/skill_list"),
+            "create": lambda: call("POST", "/api/job/", json=JOB_PAYLOAD),
+            "update": lambda: call("PUT", f"/api/job/{job_id}", json=update_payload),
+        }
+        for name, action in cases.items():
+            timings[name] = await measure(action, REPEAT, before_each=clear_job_caches)
+        timings["list.cached"] = await measure(cases["list"], REPEAT)
+
+    # Assert
+    record_benchmark("job_http", {"job_count": len(benchmark_job_ids), "timings": timings})
+    assert all(timing["runs"] == REPEAT for timing in timings.values())
@@ -0,0 +1,72 @@
+import os
+
+import pytest
+from django.core.asgi import get_asgi_application
+from httpx import ASGITransport, AsyncClient
+
+from job.model import JobDBModel
+from job.repository import JobRepository
+from job.schema.job import CountMode, JobField, JobListQuery
+from job.test.utils.benchmark import measure, record_benchmark
+
+REPEAT = int(os.getenv("BENCHMARK_REPEAT", "20"))
+PAGE_SIZES = (100, 500)
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_benchmark_list_row_mapping(benchmark_job_ids):
+    # Arrange
+    qs = JobDBModel.objects.order_by("-posting_date", "-id")
+    fields = list(JobField)
+    results = {}
+
+    async def orm(page_size: int) -> list:
+        return [job.to_service_model() async for job in qs[:page_size]]
+
+    async def rows(page_size: int) -> list:
+        job_list = await JobRepository._fetch_rows(qs[:page_size], fields)
+        return [JobRepository._to_list_item(job, fields) for job in job_list]
+
+    # Act
+    for page_size in PAGE_SIZES:
+        assert await orm(page_size) == await rows(page_size)
+        for name, action in {"orm": orm, "rows": rows}.items():
+            timing = await measure(lambda action=action: action(page_size), REPEAT)
+            timing["per_row_us"] = round(timing["median_ms"] * 1000 / page_size, 2)
+            results[f"{name}.{page_size}"] = timing
+
+    # Assert
+    record_benchmark("job_list_mapping", {"job_count": len(benchmark_job_ids), "timings": results})
+    assert all(timing["runs"] == REPEAT for timing in results.values())
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_benchmark_list_page(benchmark_auth_header, benchmark_job_ids, clear_job_caches):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    repository = JobRepository()
+    results = {}
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=benchmark_auth_header) as client:
+
+        async def http(page_size: int) -> None:
+            response = await client.get("/api/job/", params={"page_size": page_size, "count_mode": "none"})
+            assert response.status_code == 200
+
+        for page_size in PAGE_SIZES:
+            query = JobListQuery(page_size=page_size, count_mode=CountMode.NONE)
+            cases = {"get_all": lambda: repository.get_all(query), "http": lambda: http(page_size)}
+            for name, action in cases.items():
+                timing = await measure(action, REPEAT, before_each=clear_job_caches)
+                timing["per_row_us"] = round(timing["median_ms"] * 1000 / page_size, 2)
+                results[f"{name}.{page_size}"] = timing
+
+    # Assert
+    record_benchmark("job_list_page", {"job_count": len(benchmark_job_ids), "timings": results})
+    assert all(timing["runs"] == REPEAT for timing in results.values())
@@ -0,0 +1,43 @@
+import os
+
+import pytest
+from ninja.renderers import JSONRenderer
+
+from job.data_generator import JobGenerator
+from job.renderer import ORJSONRenderer, PydanticJSONRenderer, orjson
+from job.schema.job import JobResponse, PaginationResult
+from job.test.utils.benchmark import measure, record_benchmark
+
+REPEAT = int(os.getenv("BENCHMARK_REPEAT", "20"))
+PAGE_SIZES = (100, 500, 1000)
+
+RENDERERS = {"json": JSONRenderer(), "pydantic": PydanticJSONRenderer()}
+if orjson is not None:
+    RENDERERS["orjson"] = ORJSONRenderer()
+
+
+def make_page(page_size: int) -> PaginationResult:
+    jobs = [JobResponse(id=job_id, **job.model_dump()) for job_id, job in JobGenerator(seed=42).generate(page_size)]
+    return PaginationResult(total=page_size, page=1, page_size=page_size, list=jobs)
+
+
+@pytest.mark.asyncio
+async def test_benchmark_pagination_result_rendering():
+    # Arrange
+    results = {}
+
+    # Act
+    for page_size in PAGE_SIZES:
+        # The same python-mode dump ninja hands to the renderer
+        data = make_page(page_size).model_dump()
+        for name, renderer in RENDERERS.items():
+
+            async def render(renderer=renderer):
+                return renderer.render(None, data, response_status=200)
+
+            content = await render()
+            results[f"{name}.{page_size}"] = {"bytes": len(content), **await measure(render, REPEAT)}
+
+    # Assert
+    record_benchmark("job_renderer", {"timings": results})
+    assert all(timing["runs"] == REPEAT for timing in results.values())
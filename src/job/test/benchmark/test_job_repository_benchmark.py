@@ -0,0 +1,84 @@
+import os
+from datetime import date
+
+import pytest
+
+from job.data_generator import LOCATIONS, SKILLS, company_names
+from job.enum_type import JobStatusEnum
+from job.repository import JobRepository
+from job.schema.job import (
+    CountMode,
+    JobCreate,
+    JobListQuery,
+    JobSortField,
+    JobUpdate,
+    PaginationMode,
+    SkillMatch,
+)
+from job.schema.salary import SalaryRange
+from job.schema.skill import SkillListQuery
+from job.test.utils.benchmark import measure, record_benchmark
+
+REPEAT = int(os.getenv("BENCHMARK_REPEAT", "20"))
+
+# The generator's Zipf distributions make the first-ranked values the most common ones
+TOP_COMPANY = company_names(1)[0]
+FILTER_CASES = {
+    "no_filter": JobListQuery(),
+    "status": JobListQuery(status=JobStatusEnum.ACTIVE),
+    "location": JobListQuery(location=LOCATIONS[1]),
+    "company_name": JobListQuery(company_name=TOP_COMPANY),
+    "company_name_fuzzy": JobListQuery(company_name=TOP_COMPANY[:-1], fuzzy=True),
+    "skills_any": JobListQuery(skills=[SKILLS[0], SKILLS[5]]),
+    "skills_all": JobListQuery(skills=[SKILLS[0], SKILLS[5]], skills_match=SkillMatch.ALL),
+    "search": JobListQuery(search="backend engineer"),
+    "search_relevance": JobListQuery(search="backend engineer", order_by=JobSortField.RELEVANCE),
+    "combined": JobListQuery(status=JobStatusEnum.ACTIVE, location=LOCATIONS[0], skills=[SKILLS[0]], search="engineer"),
+    "deep_offset": JobListQuery(page=50),
+    "cursor": JobListQuery(pagination=PaginationMode.CURSOR),
+    "count_estimated": JobListQuery(status=JobStatusEnum.ACTIVE, count_mode=CountMode.ESTIMATED),
+    "count_none": JobListQuery(status=JobStatusEnum.ACTIVE, count_mode=CountMode.NONE),
+}
+
+
+def make_job_create(index: int) -> JobCreate:
+    return JobCreate(
+        title=f"Benchmark Engineer {index}",
+        description="Created by the repository benchmark",
+        location="Taipei",
+        salary_range=SalaryRange(min=60000, max=90000),
+        company_name="BenchCo",
+        posting_date=date(2024, 1, 1),
+        expiration_date=date(2024, 12, 31),
+        required_skills=["Python", "SQL"],
+        status=JobStatusEnum.ACTIVE,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_benchmark_repository_hot_paths(benchmark_job_ids, clear_job_caches):
+    # Arrange
+    job_repository = JobRepository()
+    timings = {}
+    created = iter(range(REPEAT + 1))
+    job_id = benchmark_job_ids[len(benchmark_job_ids) // 2]
+
+    # Act
+    for name, query in FILTER_CASES.items():
+        timings[f"get_all.{name}"] = await measure(
+            lambda query=query: job_repository.get_all(query), REPEAT, before_each=clear_job_caches
+        )
+
+    timings["get_all_skill"] = await measure(lambda: job_repository.get_all_skill(SkillListQuery()), REPEAT)
+    timings["get_by_id"] = await measure(lambda: job_repository.get_by_id(job_id), REPEAT, before_each=clear_job_caches)
+    timings["get_by_id.cached"] = await measure(lambda: job_repository.get_by_id(job_id), REPEAT)
+    timings["create"] = await measure(lambda: job_repository.create(make_job_create(next(created))), REPEAT)
+    timings["update"] = await measure(
+        lambda: job_repository.update(job_id, JobUpdate(**make_job_create(0).model_dump(exclude={"company_name"}))),
+        REPEAT,
+    )
+
+    # Assert
+    record_benchmark("job_repository", {"job_count": len(benchmark_job_ids), "timings": timings})
+    assert all(timing["runs"] == REPEAT for timing in timings.values())
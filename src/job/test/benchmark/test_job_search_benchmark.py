@@ -0,0 +1,52 @@
+import os
+import statistics
+import time
+
+import pytest
+from django.db.models import Q, QuerySet
+
+from job.model import JobDBModel
+from job.repository import JobRepository
+from job.schema.job import JobListQuery
+from job.test.utils.benchmark import record_benchmark
+
+SEARCH_TERMS = ["python", "backend engineer", "kubernetes", "platform"]
+REPEAT = int(os.getenv("BENCHMARK_REPEAT", "5"))
+
+
+def icontains_search_filter(search: str) -> Q:
+    return Q(title__icontains=search) | Q(description__icontains=search) | Q(company_name__icontains=search)
+
+
+async def time_first_page(qs: QuerySet) -> float:
+    started = time.perf_counter()
+    await qs.acount()
+    [job async for job in qs.order_by("-posting_date", "-id")[:10]]
+    return time.perf_counter() - started
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_benchmark_full_text_search_against_icontains(benchmark_job_ids):
+    # Arrange
+    results = []
+
+    # Act
+    for term in SEARCH_TERMS:
+        icontains_qs = JobDBModel.objects.filter(icontains_search_filter(term))
+        full_text_qs = JobDBModel.objects.filter(JobRepository._build_filters(JobListQuery(search=term)))
+
+        icontains_timings = [await time_first_page(icontains_qs) for _ in range(REPEAT)]
+        full_text_timings = [await time_first_page(full_text_qs) for _ in range(REPEAT)]
+
+        results.append(
+            {
+                "term": term,
+                "icontains_median_ms": round(statistics.median(icontains_timings) * 1000, 3),
+                "full_text_median_ms": round(statistics.median(full_text_timings) * 1000, 3),
+            }
+        )
+
+    # Assert
+    record_benchmark("job_search", {"job_count": len(benchmark_job_ids), "results": results})
+    assert len(results) == len(SEARCH_TERMS)
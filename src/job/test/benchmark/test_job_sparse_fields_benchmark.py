@@ -0,0 +1,48 @@
+import os
+
+import pytest
+from django.core.asgi import get_asgi_application
+from httpx import ASGITransport, AsyncClient
+
+from job.test.utils.benchmark import measure, record_benchmark
+
+REPEAT = int(os.getenv("BENCHMARK_REPEAT", "20"))
+PAGE_SIZE = 100
+
+FIELD_SETS = {
+    "all": None,
+    "card": "title,company_name,location",
+    "title": "title",
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_benchmark_list_payload_by_field_set(benchmark_auth_header, benchmark_job_ids, clear_job_caches):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    results = {}
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=benchmark_auth_header) as client:
+        for name, fields in FIELD_SETS.items():
+            params = {"page_size": PAGE_SIZE, "count_mode": "none"}
+            if fields:
+                params["fields"] = fields
+
+            response = await client.get("/api/job/", params=params)
+            assert response.status_code == 200
+            timing = await measure(
+                lambda params=params: client.get("/api/job/", params=params), REPEAT, before_each=clear_job_caches
+            )
+            results[name] = {"bytes": len(response.content), **timing}
+
+    # Assert
+    record_benchmark(
+        "job_sparse_fields", {"job_count": len(benchmark_job_ids), "page_size": PAGE_SIZE, "timings": results}
+    )
+    assert results["card"]["bytes"] < results["all"]["bytes"]
+    assert results["title"]["bytes"] < results["card"]["bytes"]
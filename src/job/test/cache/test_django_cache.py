@@ -0,0 +1,41 @@
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from job.cache import DjangoCache, LocalCache, build_cache
+
+
+@pytest.mark.asyncio
+async def test_django_cache_round_trips_through_cache_alias():
+    cache = DjangoCache(alias="default", ttl=60, key_prefix="test-job")
+
+    await cache.set("key", {"title": "Engineer"})
+    hit = await cache.get("key")
+    await cache.delete("key")
+    miss = await cache.get("key")
+
+    assert hit == {"title": "Engineer"}
+    assert miss is None
+    assert (cache.stat().hits, cache.stat().misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_django_cache_get_many_maps_prefixed_keys_back():
+    cache = DjangoCache(alias="default", ttl=60, key_prefix="test-job-many")
+
+    await cache.set_many({"a": 1, "b": 2})
+    found = await cache.get_many(["a", "b", "c"])
+    await cache.delete("a")
+    await cache.delete("b")
+
+    assert found == {"a": 1, "b": 2}
+    assert (cache.stat().hits, cache.stat().misses) == (2, 1)
+
+
+def test_build_cache_selects_backend():
+    assert isinstance(build_cache("local", maxsize=1, ttl=1, alias="default", key_prefix="job"), LocalCache)
+    assert isinstance(build_cache("django", maxsize=1, ttl=1, alias="default", key_prefix="job"), DjangoCache)
+
+
+def test_build_cache_with_unknown_backend_raises():
+    with pytest.raises(ImproperlyConfigured):
+        build_cache("redis", maxsize=1, ttl=1, alias="default", key_prefix="job")
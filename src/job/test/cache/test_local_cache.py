@@ -0,0 +1,60 @@
+import pytest
+
+from job.cache import LocalCache
+from job.schema.cache import CacheStat
+
+
+@pytest.mark.asyncio
+async def test_local_cache_returns_stored_value():
+    cache = LocalCache(maxsize=2, ttl=60)
+
+    await cache.set("key", 1)
+
+    assert await cache.get("key") == 1
+
+
+@pytest.mark.asyncio
+async def test_local_cache_expires_entry_after_ttl(mocker):
+    cache = LocalCache(maxsize=2, ttl=10)
+    mock_monotonic = mocker.patch("job.cache.time.monotonic", return_value=100.0)
+
+    await cache.set("key", 1)
+    mock_monotonic.return_value = 110.0
+
+    assert await cache.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_local_cache_evicts_least_recently_used_entry():
+    cache = LocalCache(maxsize=2, ttl=60)
+
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    await cache.get("a")
+    await cache.set("c", 3)
+
+    assert await cache.get("a") == 1
+    assert await cache.get("b") is None
+    assert await cache.get("c") == 3
+
+
+@pytest.mark.asyncio
+async def test_local_cache_stat_counts_hits_misses_and_evictions():
+    cache = LocalCache(maxsize=1, ttl=60)
+
+    await cache.set("a", 1)
+    await cache.get("a")
+    await cache.set("b", 2)
+    await cache.get("a")
+
+    assert cache.stat() == CacheStat(backend="local", hits=1, misses=1, evictions=1, size=1)
+
+
+@pytest.mark.asyncio
+async def test_local_cache_get_many_returns_only_hits():
+    cache = LocalCache(maxsize=4, ttl=60)
+
+    await cache.set_many({"a": 1, "b": 2})
+
+    assert await cache.get_many(["a", "c", "b"]) == {"a": 1, "b": 2}
+    assert (cache.stat().hits, cache.stat().misses) == (2, 1)
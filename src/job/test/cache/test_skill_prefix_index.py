@@ -0,0 +1,59 @@
+from job.schema.skill import SkillCount
+from job.skill_index import SkillPrefixIndex
+
+
+def build_index(ttl: float = 60) -> SkillPrefixIndex:
+    index = SkillPrefixIndex(ttl=ttl)
+    index.build(
+        [
+            SkillCount(name="Python", job_count=5),
+            SkillCount(name="PyTorch", job_count=9),
+            SkillCount(name="pytest", job_count=5),
+            SkillCount(name="PostgreSQL", job_count=7),
+            SkillCount(name="Go", job_count=3),
+        ],
+        index.generation,
+    )
+    return index
+
+
+def test_skill_prefix_index_suggests_case_insensitive_prefix_matches_by_job_count():
+    index = build_index()
+
+    result = index.suggest("PY", limit=10)
+
+    assert [skill.name for skill in result] == ["PyTorch", "pytest", "Python"]
+
+
+def test_skill_prefix_index_limits_suggestions_to_top_n():
+    index = build_index()
+
+    result = index.suggest("p", limit=2)
+
+    assert [skill.name for skill in result] == ["PyTorch", "PostgreSQL"]
+
+
+def test_skill_prefix_index_returns_empty_list_without_match():
+    index = build_index()
+
+    assert index.suggest("rust", limit=10) == []
+
+
+def test_skill_prefix_index_expires_after_ttl(mocker):
+    mock_monotonic = mocker.patch("job.skill_index.time.monotonic", return_value=100.0)
+    index = build_index(ttl=10)
+
+    assert index.is_stale() is False
+    mock_monotonic.return_value = 110.0
+    assert index.is_stale() is True
+
+
+def test_skill_prefix_index_build_from_before_invalidation_stays_stale():
+    index = SkillPrefixIndex(ttl=60)
+    generation = index.generation
+
+    index.invalidate()
+    index.build([SkillCount(name="Go", job_count=1)], generation)
+
+    assert index.is_stale() is True
+    assert index.suggest("go", limit=10) == [SkillCount(name="Go", job_count=1)]
@@ -0,0 +1,148 @@
+import asyncio
+import socket
+from datetime import datetime, timezone
+
+import pytest
+
+from job.change_stream import KEEPALIVE, JobChangeBroker, encode_event
+from job.schema.change import JobChange, JobChangeFeed, JobChangeType
+
+
+class FakeListener:
+    # A socket pair stands in for the LISTEN connection, so the broker's event loop reader fires for real
+    def __init__(self):
+        self.reader, self.writer = socket.socketpair()
+        self.notifies = []
+
+    def fileno(self) -> int:
+        return self.reader.fileno()
+
+    def poll(self) -> None:
+        self.reader.recv(1024)
+
+    def notify(self) -> None:
+        self.writer.send(b"x")
+
+    def close(self) -> None:
+        self.reader.close()
+        self.writer.close()
+
+
+@pytest.fixture
+def listener(mocker):
+    fake_listener = FakeListener()
+    mocker.patch.object(JobChangeBroker, "_listen", return_value=fake_listener)
+    return fake_listener
+
+
+@pytest.fixture
+def change_log(fake_job_response) -> list[JobChange]:
+    return [make_change(seq, fake_job_response) for seq in (1, 2, 3)]
+
+
+@pytest.fixture
+def mock_repository(mocker, change_log):
+    async def get_changes(query):
+        page = [change for change in change_log if change.seq > query.since][: query.limit]
+        return JobChangeFeed(changes=page, next_since=page[-1].seq if page else query.since, has_more=False)
+
+    repository = mocker.Mock()
+    repository.get_changes = mocker.AsyncMock(side_effect=get_changes)
+    repository.get_change_head = mocker.AsyncMock(side_effect=lambda: change_log[-1].seq)
+    mocker.patch("job.change_stream.JobRepository", return_value=repository)
+    return repository
+
+
+def make_change(seq: int, job) -> JobChange:
+    return JobChange(
+        seq=seq, type=JobChangeType.UPDATED, id=job.id, changed_at=datetime(2024, 1, 2, tzinfo=timezone.utc), job=job
+    )
+
+
+async def wait_until_listening(broker: JobChangeBroker) -> None:
+    # Lets the pending streams subscribe (which starts the listener) before waiting on it
+    await asyncio.sleep(0)
+    await asyncio.wait_for(broker._ready.wait(), 1)
+
+
+async def stop(broker: JobChangeBroker, *streams) -> None:
+    for stream in streams:
+        await stream.aclose()
+    await asyncio.wait_for(broker._task, 1)
+
+
+@pytest.mark.asyncio
+async def test_positive_one_notification_fans_out_to_every_stream(
+    listener, mock_repository, change_log, fake_job_response
+):
+    # Arrange
+    broker = JobChangeBroker("job_change", heartbeat=5)
+    streams = [broker.stream(mock_repository, None), broker.stream(mock_repository, None)]
+    pending = [asyncio.create_task(anext(stream)) for stream in streams]
+    await wait_until_listening(broker)
+
+    # Act
+    change_log.append(make_change(4, fake_job_response))
+    listener.notify()
+    events = await asyncio.wait_for(asyncio.gather(*pending), 1)
+    await stop(broker, *streams)
+
+    # Assert
+    assert events == [encode_event(change_log[-1])] * 2
+    # At most once when the listener starts and once for the notification, shared by both streams
+    assert mock_repository.get_changes.await_count <= 2
+    assert broker.subscriber_count == 0
+
+
+@pytest.mark.asyncio
+async def test_positive_resumed_stream_replays_the_gap_then_goes_live(
+    listener, mock_repository, change_log, fake_job_response
+):
+    # Arrange
+    broker = JobChangeBroker("job_change", heartbeat=5)
+    stream = broker.stream(mock_repository, 1)
+
+    # Act
+    replayed = await asyncio.wait_for(anext(stream), 1)
+    change_log.append(make_change(4, fake_job_response))
+    listener.notify()
+    live = await asyncio.wait_for(anext(stream), 1)
+    await stop(broker, stream)
+
+    # Assert
+    assert replayed == encode_event(change_log[1]) + encode_event(change_log[2])
+    assert live == encode_event(change_log[3])
+
+
+@pytest.mark.asyncio
+async def test_positive_idle_stream_sends_keepalive(listener, mock_repository):
+    # Arrange
+    broker = JobChangeBroker("job_change", heartbeat=0.01)
+    stream = broker.stream(mock_repository, None)
+
+    # Act
+    event = await asyncio.wait_for(anext(stream), 1)
+    await stop(broker, stream)
+
+    # Assert
+    assert event == KEEPALIVE
+
+
+@pytest.mark.asyncio
+async def test_negative_stream_that_falls_behind_is_closed(listener, mock_repository, change_log, fake_job_response):
+    # Arrange
+    broker = JobChangeBroker("job_change", heartbeat=5, queue_size=1)
+    slow_stream = broker.stream(mock_repository, None)
+    pending = asyncio.create_task(anext(slow_stream))
+    await wait_until_listening(broker)
+
+    # Act
+    # Both changes are queued in one go, before the stream gets to run
+    change_log.extend([make_change(4, fake_job_response), make_change(5, fake_job_response)])
+    listener.notify()
+
+    # Assert
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(pending, 1)
+    assert broker.subscriber_count == 0
+    await asyncio.wait_for(broker._task, 1)
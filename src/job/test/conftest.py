@@ -3,9 +3,24 @@ from uuid import UUID, uuid4
 
 import pytest
 
+from job.cache import job_cache, job_count_cache, job_list_cache
 from job.enum_type import JobStatusEnum
 from job.schema.job import JobCreate, JobResponse
 from job.schema.salary import SalaryRange
+from job.skill_index import skill_prefix_index
+
+
+@pytest.fixture(autouse=True)
+def clear_job_cache():
+    job_cache.clear()
+    job_count_cache.clear()
+    job_list_cache.clear()
+    skill_prefix_index.invalidate()
+    yield
+    job_cache.clear()
+    job_count_cache.clear()
+    job_list_cache.clear()
+    skill_prefix_index.invalidate()
 
 
 @pytest.fixture
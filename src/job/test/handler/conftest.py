@@ -5,7 +5,7 @@ import django
 import pytest
 from django.contrib.auth.models import User
 from django.core.asgi import get_asgi_application
-from ninja_jwt.authentication import JWTAuth
+from ninja_jwt.authentication import AsyncJWTAuth
 
 from job.enum_type import JobStatusEnum
 from job.schema.job import JobResponse
@@ -21,7 +21,7 @@ def asgi_django_app():
 @pytest.fixture
 def mock_auth_user(mocker):
     mock_user = User(id=1, username="test_user", is_active=True)
-    mocker.patch.object(JWTAuth, "authenticate", return_value=mock_user)
+    mocker.patch.object(AsyncJWTAuth, "authenticate", return_value=mock_user)
     return mock_user
 
 
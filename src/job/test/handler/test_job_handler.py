@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from uuid import uuid4
 
 import pytest
@@ -6,7 +7,9 @@ from httpx import ASGITransport, AsyncClient
 
 from job.enum_type import JobStatusEnum
 from job.exception import NotFoundException
-from job.schema.job import JobCreate, PaginationResult
+from job.schema.change import JobChange, JobChangeFeed, JobChangeQuery, JobChangeType
+from job.schema.job import JobCreate, JobPartialResponse, PaginationResult
+from job.schema.skill import SkillCount, SkillListQuery
 from job.test.utils.schema_extract import extract_job_update_fields
 
 """Positive test cases for job handler APIs"""
@@ -82,6 +85,31 @@ async def test_positive_list_all_job(mocker, fake_job_response, mock_auth_user):
     assert data["list"][0]["title"] == fake_job_response.title
 
 
+@pytest.mark.asyncio
+async def test_positive_list_job_with_fields_returns_only_selected_fields(mocker, fake_job_response, mock_auth_user):
+    # Mock
+    partial_job = JobPartialResponse.model_validate({"id": fake_job_response.id, "title": fake_job_response.title})
+    mock_get_all = mocker.patch(
+        "job.repository.JobRepository.get_all",
+        return_value=PaginationResult(total=1, page=1, page_size=10, list=[partial_job]),
+    )
+
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    headers = {"Authorization": "Bearer faketoken"}
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        response = await client.get("/api/job/", params={"fields": "title"})
+
+    # Assert
+    assert response.status_code == 200
+    assert mock_get_all.call_args.args[0].fields == ["title"]
+    assert response.json()["list"] == [{"id": str(fake_job_response.id), "title": fake_job_response.title}]
+
+
 @pytest.mark.asyncio
 async def test_positive_update_job_api(mocker, fake_job_response, mock_auth_user):
     # Mock
@@ -103,6 +131,167 @@ async def test_positive_update_job_api(mocker, fake_job_response, mock_auth_user
     assert response.json()["id"] == str(fake_job_response.id)
 
 
+@pytest.mark.asyncio
+async def test_positive_patch_job_api_sends_only_given_fields(mocker, fake_job_response, mock_auth_user):
+    # Mock
+    mock_update = mocker.patch("job.repository.JobRepository.update", return_value=fake_job_response)
+
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    headers = {"Authorization": "Bearer faketoken"}
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        response = await client.patch(f"/api/job/{fake_job_response.id}", json={"title": "Engineer"})
+
+    # Assert
+    assert response.status_code == 200
+    update_job = mock_update.call_args.args[1]
+    assert update_job.model_fields_set == {"title"}
+
+
+@pytest.mark.asyncio
+async def test_positive_head_job_api_reports_existence_without_body(mocker, mock_auth_user):
+    # Mock
+    mocker.patch("job.repository.JobRepository.exists", side_effect=[True, False])
+
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    headers = {"Authorization": "Bearer faketoken"}
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        found = await client.head(f"/api/job/{uuid4()}")
+        missing = await client.head(f"/api/job/{uuid4()}")
+
+    # Assert
+    assert found.status_code == 200
+    assert missing.status_code == 404
+    assert found.content == b""
+
+
+@pytest.mark.asyncio
+async def test_positive_get_job_batch_api_accepts_query_and_body(mocker, fake_job_response, mock_auth_user):
+    # Mock
+    missing_id = uuid4()
+    mock_get_by_ids = mocker.patch(
+        "job.repository.JobRepository.get_by_ids", return_value={fake_job_response.id: fake_job_response}
+    )
+
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    headers = {"Authorization": "Bearer faketoken"}
+    ids = [str(missing_id), str(fake_job_response.id)]
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        get_response = await client.get("/api/job/batch", params={"ids": ",".join(ids)})
+        post_response = await client.post("/api/job/batch", json={"ids": ids})
+
+    # Assert
+    assert get_response.status_code == 200
+    assert get_response.json() == post_response.json()
+    assert [job["id"] for job in get_response.json()["jobs"]] == [str(fake_job_response.id)]
+    assert get_response.json()["missing"] == [str(missing_id)]
+    assert mock_get_by_ids.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_positive_export_job_api_streams_ndjson_and_csv(mocker, fake_job_response, mock_auth_user):
+    # Mock
+    async def export(self, query):
+        yield fake_job_response
+
+    mock_export = mocker.patch("job.repository.JobRepository.export", side_effect=export, autospec=True)
+
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    headers = {"Authorization": "Bearer faketoken"}
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        ndjson_response = await client.get("/api/job/export", params={"status": "active"})
+        csv_response = await client.get("/api/job/export", params={"format": "csv", "fields": "title"})
+
+    # Assert
+    assert ndjson_response.status_code == 200
+    assert ndjson_response.headers["Content-Type"] == "application/x-ndjson"
+    assert ndjson_response.text == fake_job_response.model_dump_json() + "\n"
+    assert csv_response.headers["Content-Type"] == "text/csv; charset=utf-8"
+    assert csv_response.text.splitlines() == ["id,title", f"{fake_job_response.id},{fake_job_response.title}"]
+    assert mock_export.call_args_list[0].args[1].status == JobStatusEnum.ACTIVE
+
+
+@pytest.mark.asyncio
+async def test_positive_list_job_changes_api(mocker, fake_job_response, mock_auth_user):
+    # Mock
+    feed = JobChangeFeed(
+        changes=[
+            JobChange(
+                seq=7,
+                type=JobChangeType.UPDATED,
+                id=fake_job_response.id,
+                changed_at=datetime(2024, 1, 2, tzinfo=timezone.utc),
+                job=fake_job_response,
+            )
+        ],
+        next_since=7,
+        has_more=False,
+    )
+    mock_get_changes = mocker.patch("job.repository.JobRepository.get_changes", return_value=feed)
+
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    headers = {"Authorization": "Bearer faketoken"}
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        response = await client.get("/api/job/changes", params={"since": 3, "limit": 50})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["changes"][0]["type"] == "updated"
+    assert response.json()["changes"][0]["job"]["id"] == str(fake_job_response.id)
+    assert response.json()["next_since"] == 7
+    assert mock_get_changes.call_args.args[0] == JobChangeQuery(since=3, limit=50)
+
+
+@pytest.mark.asyncio
+async def test_positive_stream_job_changes_api_resumes_from_last_event_id(mocker, mock_auth_user):
+    # Mock
+    async def stream(job_repository, since):
+        yield b"id: 8\nevent: deleted\ndata: {}\n\n"
+
+    mock_stream = mocker.patch("job.service.job_change_broker.stream", side_effect=stream)
+
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    headers = {"Authorization": "Bearer faketoken", "Last-Event-ID": "7"}
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        response = await client.get("/api/job/changes/stream", params={"since": 3})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "text/event-stream"
+    assert response.headers["Cache-Control"] == "no-cache"
+    assert response.text == "id: 8\nevent: deleted\ndata: {}\n\n"
+    assert mock_stream.call_args.args[1] == 7
+
+
 @pytest.mark.asyncio
 async def test_positive_delete_job_api(mocker, fake_job_response, mock_auth_user):
     # Mock
@@ -338,6 +527,161 @@ async def test_get_skill_list(mocker, mock_auth_user):
     assert sorted(response.json()) == sorted(expected_skill_list)
 
 
+@pytest.mark.asyncio
+async def test_get_skill_list_with_prefix_and_count(mocker, mock_auth_user):
+    # Mock
+    mock_get_all_skill = mocker.patch(
+        "job.repository.JobRepository.get_all_skill", return_value=[SkillCount(name="Python", job_count=3)]
+    )
+
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    headers = {"Authorization": "Bearer faketoken"}
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        response = await client.get("/api/job/skill_list", params={"prefix": "py", "with_count": True})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == [{"name": "Python", "job_count": 3}]
+    mock_get_all_skill.assert_called_once_with(SkillListQuery(prefix="py", with_count=True))
+
+
+@pytest.mark.asyncio
+async def test_suggest_skill(mocker, mock_auth_user):
+    # Mock
+    mocker.patch(
+        "job.repository.JobRepository.get_all_skill",
+        return_value=[SkillCount(name="Python", job_count=3), SkillCount(name="PyTorch", job_count=5)],
+    )
+
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    headers = {"Authorization": "Bearer faketoken"}
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        response = await client.get("/api/job/skill_suggest", params={"prefix": "py", "limit": 1})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == [{"name": "PyTorch", "job_count": 5}]
+
+
+@pytest.mark.asyncio
+async def test_get_cache_stat(mock_auth_user):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    headers = {"Authorization": "Bearer faketoken"}
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        response = await client.get("/api/job/cache_stat")
+
+    # Assert
+    assert response.status_code == 200
+    assert set(response.json()) == {"job", "job_count", "job_list"}
+    assert response.json()["job"]["backend"] == "local"
+
+
+@pytest.mark.asyncio
+async def test_list_job_returns_304_when_etag_matches(mocker, fake_job_list, mock_auth_user):
+    # Mock
+    mock_get_all = mocker.patch(
+        "job.repository.JobRepository.get_all",
+        return_value=PaginationResult(total=len(fake_job_list), page=1, page_size=10, list=fake_job_list),
+    )
+
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    headers = {"Authorization": "Bearer faketoken"}
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        first = await client.get("/api/job/")
+        etag = first.headers["ETag"]
+        not_modified = await client.get("/api/job/", headers={"If-None-Match": f"W/{etag}"})
+        other_page = await client.get("/api/job/", params={"page": 2}, headers={"If-None-Match": '"stale"'})
+
+    # Assert
+    assert first.status_code == 200
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["ETag"] == etag
+    assert other_page.status_code == 200
+    assert mock_get_all.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_job_api(mocker, fake_job_response, mock_auth_user):
+    # Mock
+    mock_bulk_create = mocker.patch("job.repository.JobRepository.bulk_create", return_value=[fake_job_response])
+
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    headers = {"Authorization": "Bearer faketoken"}
+    valid_item = fake_job_response.model_dump(mode="json", exclude={"id"})
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        response = await client.post("/api/job/bulk", json=[valid_item, {"title": "Incomplete"}])
+        empty_response = await client.post("/api/job/bulk", json=[])
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["created"] == 1
+    assert response.json()["results"][0] == {
+        "index": 0,
+        "success": True,
+        "id": str(fake_job_response.id),
+        "error": None,
+    }
+    assert response.json()["results"][1]["success"] is False
+    assert len(mock_bulk_create.call_args.args[0]) == 1
+    assert empty_response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_negative_bulk_create_job_api_when_item_is_longer_than_its_column(
+    mocker, fake_job_response, mock_auth_user
+):
+    # Mock
+    mock_bulk_create = mocker.patch(
+        "job.repository.JobRepository.bulk_create", return_value=[fake_job_response, fake_job_response]
+    )
+
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    headers = {"Authorization": "Bearer faketoken"}
+    valid_item = fake_job_response.model_dump(mode="json", exclude={"id"})
+    too_long_item = {**valid_item, "company_name": "x" * 256}
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        response = await client.post("/api/job/bulk", json=[valid_item, too_long_item, valid_item])
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["created"] == 2
+    assert [result["success"] for result in response.json()["results"]] == [True, False, True]
+    assert "company_name" in response.json()["results"][1]["error"]
+    assert len(mock_bulk_create.call_args.args[0]) == 2
+
+
 @pytest.mark.asyncio
 async def test_list_job_by_skill_list(mocker, fake_job_list, mock_auth_user):
     # Mock
@@ -365,3 +709,39 @@ async def test_list_job_by_skill_list(mocker, fake_job_list, mock_auth_user):
     # Assert
     assert response.status_code == 200
     assert all("python" in job["required_skills"] or "vue" in job["required_skills"] for job in response.json()["list"])
+
+
+@pytest.mark.asyncio
+async def test_negative_list_job_when_cursor_is_invalid(mock_auth_user):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    headers = {"Authorization": "Bearer faketoken"}
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        response = await client.get("/api/job/?cursor=not-a-cursor")
+
+    # Assert
+    assert response.status_code == 400
+    assert "cursor" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_negative_stream_job_changes_when_last_event_id_is_invalid(mock_auth_user):
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    headers = {"Authorization": "Bearer faketoken", "Last-Event-ID": "not-a-seq"}
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        response = await client.get("/api/job/changes/stream")
+
+    # Assert
+    assert response.status_code == 400
+    assert "Last-Event-ID" in response.json()["detail"]
@@ -0,0 +1,119 @@
+import logging
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.asgi import get_asgi_application
+from django.test import RequestFactory
+from httpx import ASGITransport, AsyncClient
+from ninja_jwt.authentication import AsyncJWTAuth
+
+from job.instrumentation import QueryStats, current_query_stats, log_slow_request, query_timer, server_timing
+from job.metrics import http_requests, sql_slow_queries
+from job.schema.job import PaginationResult
+
+
+def test_query_stats_keeps_slowest_statement():
+    # Arrange
+    stats = QueryStats()
+
+    # Act
+    stats.add("SELECT 1", 0.002)
+    stats.add("SELECT 2", 0.005)
+    stats.add("SELECT 3", 0.001)
+
+    # Assert
+    assert stats.count == 3
+    assert stats.duration == pytest.approx(0.008)
+    assert (stats.slowest_sql, stats.slowest_duration) == ("SELECT 2", 0.005)
+
+
+def test_query_timer_records_into_current_request_stats():
+    # Arrange
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+
+    # Act
+    try:
+        result = query_timer(lambda *args: "rows", "SELECT 1", None, False, {})
+    finally:
+        current_query_stats.reset(token)
+
+    # Assert
+    assert result == "rows"
+    assert stats.count == 1
+    assert stats.slowest_sql == "SELECT 1"
+
+
+def test_query_timer_logs_statements_over_threshold(settings, caplog):
+    # Arrange
+    settings.SLOW_QUERY_THRESHOLD_MS = 0
+    slow_queries = sql_slow_queries.values()[()]
+
+    # Act
+    with caplog.at_level(logging.WARNING, logger="job.sql"):
+        query_timer(lambda *args: None, "SELECT pg_sleep(1)", None, False, {})
+
+    # Assert
+    assert "SELECT pg_sleep(1)" in caplog.text
+    assert sql_slow_queries.values()[()] == slow_queries + 1
+
+
+def test_server_timing_reports_db_and_view_durations():
+    # Arrange
+    stats = QueryStats(count=2, duration=0.0031, slowest_sql="SELECT 1", slowest_duration=0.002)
+
+    # Act
+    header = server_timing(stats, 0.0125)
+
+    # Assert
+    assert header == 'db;dur=3.10;desc="2 queries", db-slowest;dur=2.00, view;dur=12.50'
+
+
+def test_slow_request_log_names_the_slowest_statement(settings, caplog):
+    # Arrange
+    settings.SLOW_REQUEST_THRESHOLD_MS = 100
+    request = RequestFactory().get("/api/job/")
+    sql = "SELECT *\n  FROM job_post WHERE " + " AND ".join(["status = %s"] * 50)
+    stats = QueryStats(count=3, duration=0.09, slowest_sql=sql, slowest_duration=0.08)
+
+    # Act
+    with caplog.at_level(logging.WARNING, logger="job.request"):
+        log_slow_request(request, stats, 0.05)
+        log_slow_request(request, stats, 0.15)
+
+    # Assert
+    [record] = caplog.records
+    assert record.getMessage().startswith(
+        "Slow request GET /api/job/ (150.0 ms, 3 queries, 90.0 ms SQL); "
+        "slowest statement (80.0 ms): SELECT * FROM job_post WHERE status = %s AND"
+    )
+    assert record.getMessage().endswith("...")
+
+
+@pytest.mark.asyncio
+async def test_requests_get_server_timing_header_and_metrics(mocker):
+    # Mock
+    mocker.patch.object(AsyncJWTAuth, "authenticate", return_value=User(id=1, username="test_user", is_active=True))
+    mocker.patch(
+        "job.repository.JobRepository.get_all",
+        return_value=PaginationResult(total=0, page=1, page_size=10, list=[]),
+    )
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    headers = {"Authorization": "Bearer faketoken"}
+    requests = http_requests.values()[("GET", "/api/job/", "200")]
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        response = await client.get("/api/job/")
+        metrics = await client.get("/metrics")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["Server-Timing"].startswith('db;dur=0.00;desc="0 queries"')
+    assert metrics.status_code == 200
+    assert metrics.headers["Content-Type"].startswith("text/plain")
+    assert f'job_http_requests_total{{method="GET",route="/api/job/",status="200"}} {int(requests) + 1}' in metrics.text
+    assert "# TYPE job_sql_duration_seconds_total counter" in metrics.text
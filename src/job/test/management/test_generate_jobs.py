@@ -0,0 +1,57 @@
+from collections import Counter
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from job.data_generator import JobGenerator, company_names, zipf_cum_weights
+
+
+def test_job_generator_is_deterministic_for_a_seed():
+    first = list(JobGenerator(seed=7).generate(50))
+    second = list(JobGenerator(seed=7).generate(50))
+    other = list(JobGenerator(seed=8).generate(50))
+
+    assert first == second
+    assert first != other
+
+
+def test_job_generator_skews_companies_and_skills_towards_top_ranks():
+    generator = JobGenerator(seed=1, company_count=100, zipf_exponent=1.2)
+
+    jobs = [job for _, job in generator.generate(2000)]
+    company_counts = Counter(job.company_name for job in jobs)
+    skill_counts = Counter(skill for job in jobs for skill in job.required_skills)
+
+    assert company_counts.most_common(1)[0][0] == generator.companies[0]
+    assert skill_counts[generator.skills[0]] > skill_counts[generator.skills[-1]] * 5
+
+
+def test_job_generator_produces_valid_jobs():
+    for _, job in JobGenerator(seed=3, skill_count=60, location_count=20).generate(200):
+        assert 2 <= len(set(job.required_skills)) == len(job.required_skills) <= 6
+        assert job.salary_range.min < job.salary_range.max
+        assert job.posting_date < job.expiration_date
+
+
+def test_zipf_cum_weights_follow_inverse_rank():
+    assert zipf_cum_weights(3, 1.0) == [1.0, 1.5, 1.5 + 1 / 3]
+
+
+def test_company_names_are_unique_beyond_the_name_pool():
+    names = company_names(500)
+
+    assert len(set(names)) == 500
+
+
+@pytest.mark.parametrize(
+    "argument, value, message",
+    [
+        ("--companies", "0", "--companies and --locations"),
+        ("--locations", "0", "--companies and --locations"),
+        ("--skills", "1", "--skills must be at least 2"),
+    ],
+)
+def test_generate_jobs_rejects_pools_too_small_to_sample(argument, value, message):
+    with pytest.raises(CommandError, match=message):
+        call_command("generate_jobs", "10", argument, value)
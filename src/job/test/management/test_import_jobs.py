@@ -0,0 +1,88 @@
+import csv
+import io
+import json
+from uuid import UUID
+
+import pytest
+from pydantic import ValidationError
+
+from job.enum_type import JobStatusEnum
+from job.management.commands.import_jobs import parse_record, read_records
+
+JOB_RECORD = {
+    "title": "Imported Engineer",
+    "description": "From the partner feed",
+    "location": "Taipei",
+    "salary_range": {"min": 50000, "max": 70000},
+    "company_name": "FeedCo",
+    "posting_date": "2024-01-01",
+    "expiration_date": "2024-12-31",
+    "required_skills": ["Python", "SQL"],
+    "status": "active",
+}
+
+
+def test_read_records_skips_blank_ndjson_lines():
+    file = io.StringIO(json.dumps(JOB_RECORD) + "\n\n" + json.dumps(JOB_RECORD) + "\n")
+
+    assert [line_no for line_no, _ in read_records(file, "ndjson")] == [1, 3]
+
+
+def test_parse_record_decodes_json_cells_from_csv():
+    row = {
+        **JOB_RECORD,
+        "id": "00000000-0000-0000-0000-000000000001",
+        "salary_range": '{"min": 50000, "max": 70000}',
+        "required_skills": '["Python", "SQL"]',
+    }
+    file = io.StringIO()
+    writer = csv.DictWriter(file, fieldnames=list(row))
+    writer.writeheader()
+    writer.writerow(row)
+    file.seek(0)
+
+    [(line_no, raw)] = list(read_records(file, "csv"))
+    job_id, job = parse_record(raw)
+
+    assert line_no == 2
+    assert job_id == UUID("00000000-0000-0000-0000-000000000001")
+    assert job.required_skills == ["Python", "SQL"]
+    assert job.status == JobStatusEnum.ACTIVE
+
+
+def test_parse_record_without_id_generates_one():
+    job_id, job = parse_record(json.dumps(JOB_RECORD))
+
+    assert isinstance(job_id, UUID)
+    assert job.title == "Imported Engineer"
+
+
+def test_parse_record_with_invalid_job_raises():
+    with pytest.raises(ValidationError):
+        parse_record(json.dumps({**JOB_RECORD, "status": "archived"}))
+
+
+@pytest.mark.parametrize("field", ["title", "location", "company_name"])
+def test_parse_record_with_value_longer_than_its_column_raises(field):
+    with pytest.raises(ValidationError, match=field):
+        parse_record(json.dumps({**JOB_RECORD, field: "x" * 256}))
+
+
+@pytest.mark.parametrize("line", ["123", "null", "[1, 2]", '"a job"'])
+def test_parse_record_with_non_object_ndjson_raises(line):
+    with pytest.raises(ValueError, match="Expected a JSON object"):
+        parse_record(line)
+
+
+@pytest.mark.parametrize("cells", [["Imported Engineer"], [*JOB_RECORD, "extra"]], ids=["short", "long"])
+def test_parse_record_with_csv_row_not_matching_header_raises(cells):
+    file = io.StringIO()
+    writer = csv.writer(file)
+    writer.writerow(list(JOB_RECORD))
+    writer.writerow(cells)
+    file.seek(0)
+
+    [(_, raw)] = list(read_records(file, "csv"))
+
+    with pytest.raises(ValueError, match="as many cells as the header"):
+        parse_record(raw)
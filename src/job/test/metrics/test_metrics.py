@@ -0,0 +1,145 @@
+import threading
+
+import pytest
+from django.core.asgi import get_asgi_application
+from httpx import ASGITransport, AsyncClient
+
+from job.cache import LocalCache
+from job.metrics import CallbackMetric, Counter, Gauge, Histogram, MetricsRegistry, http_request_duration
+
+
+def test_counter_sums_shards_written_by_different_threads():
+    # Arrange
+    counter = Counter("test_total", "Test counter", ("route",))
+
+    def work():
+        for _ in range(1000):
+            counter.inc("/api/job/")
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+
+    # Act
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    assert counter.values() == {("/api/job/",): 4000}
+
+
+def test_exited_threads_fold_their_shards_into_the_total():
+    # Arrange
+    counter = Counter("test_total", "Test counter", ("route",))
+    histogram = Histogram("test_seconds", "Test histogram", ("route",), buckets=(0.1, 1.0))
+
+    def work():
+        counter.inc("/api/job/")
+        histogram.observe(0.5, "/api/job/")
+
+    # Act
+    # One short-lived thread at a time, like sync_to_async under ASGI
+    for _ in range(100):
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+    # Assert
+    assert counter.values() == {("/api/job/",): 100}
+    assert ("test_seconds_count", {"route": "/api/job/"}, 100) in list(histogram.samples())
+    assert not counter._shards._shards
+    assert not histogram._shards._shards
+
+
+def test_gauge_goes_up_and_down():
+    # Arrange
+    gauge = Gauge("test_in_flight", "Test gauge", ("method",))
+
+    # Act
+    gauge.inc("GET")
+    gauge.inc("GET")
+    gauge.dec("GET")
+
+    # Assert
+    assert gauge.values() == {("GET",): 1}
+
+
+def test_histogram_renders_cumulative_buckets():
+    # Arrange
+    registry = MetricsRegistry()
+    histogram = registry.register(Histogram("test_seconds", "Test histogram", ("route",), buckets=(0.1, 1.0)))
+
+    # Act
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.1, "/a")
+    histogram.observe(0.5, "/a")
+    histogram.observe(3.0, "/a")
+    text = registry.render()
+
+    # Assert
+    assert "# TYPE test_seconds histogram" in text
+    assert 'test_seconds_bucket{route="/a",le="0.1"} 2' in text
+    assert 'test_seconds_bucket{route="/a",le="1"} 3' in text
+    assert 'test_seconds_bucket{route="/a",le="+Inf"} 4' in text
+    assert 'test_seconds_sum{route="/a"} 3.65' in text
+    assert 'test_seconds_count{route="/a"} 4' in text
+
+
+@pytest.mark.asyncio
+async def test_callback_metric_reads_values_when_rendered():
+    # Arrange
+    cache = LocalCache(maxsize=1, ttl=60)
+    registry = MetricsRegistry()
+    registry.register(
+        CallbackMetric("test_cache_hits_total", "counter", "Hits", ("cache",), lambda: {("job",): cache.stat().hits})
+    )
+
+    # Act
+    await cache.set("key", 1)
+    await cache.get("key")
+    text = registry.render()
+
+    # Assert
+    assert 'test_cache_hits_total{cache="job"} 1' in text
+
+
+def test_label_values_are_escaped():
+    # Arrange
+    registry = MetricsRegistry()
+    registry.register(Counter("test_total", "Test counter", ("path",))).inc('a"b\\c')
+
+    # Act
+    text = registry.render()
+
+    # Assert
+    assert 'test_total{path="a\\"b\\\\c"} 1' in text
+
+
+@pytest.mark.asyncio
+async def test_unmatched_routes_share_one_label():
+    # Mock
+    app = get_asgi_application()
+    transport = ASGITransport(app=app)
+
+    # Arrange
+    before = http_request_duration_count("GET", "unmatched")
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/no-such-path/1")
+        await client.get("/no-such-path/2")
+        metrics = await client.get("/metrics")
+
+    # Assert
+    assert http_request_duration_count("GET", "unmatched") == before + 2
+    assert 'job_http_requests_total{method="GET",route="unmatched",status="404"}' in metrics.text
+    assert 'job_http_requests_in_flight{method="GET"} 1' in metrics.text
+    assert 'job_cache_hits_total{cache="job"}' in metrics.text
+
+
+def http_request_duration_count(method: str, route: str) -> int:
+    return sum(
+        value
+        for name, labels, value in http_request_duration.samples()
+        if name.endswith("_count") and labels == {"method": method, "route": route}
+    )
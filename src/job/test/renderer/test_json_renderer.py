@@ -0,0 +1,84 @@
+import json
+from datetime import date
+from uuid import UUID
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from ninja.renderers import JSONRenderer
+
+from job.renderer import ORJSONRenderer, PydanticJSONRenderer, build_renderer, orjson
+from job.schema.job import JobPartialResponse, JobResponse, JobStatusEnum, PaginationResult, SalaryRange
+
+requires_orjson = pytest.mark.skipif(orjson is None, reason="orjson is not installed")
+RENDERERS = [PydanticJSONRenderer, pytest.param(ORJSONRenderer, marks=requires_orjson)]
+
+
+def make_page() -> PaginationResult:
+    return PaginationResult(
+        total=2,
+        page=1,
+        page_size=10,
+        list=[
+            JobResponse(
+                id=UUID(int=1),
+                title="Render Job",
+                description="Café “quoted”",
+                location="Taipei",
+                salary_range=SalaryRange(min=80000, max=100000),
+                company_name="Render Co",
+                posting_date=date(2024, 1, 1),
+                expiration_date=date(2024, 2, 1),
+                required_skills=["Python"],
+                status=JobStatusEnum.ACTIVE,
+            )
+        ],
+    )
+
+
+@pytest.mark.parametrize("renderer_class", RENDERERS)
+def test_renderer_matches_default_json_renderer(renderer_class):
+    # Arrange
+    data = make_page().model_dump()
+
+    # Act
+    content = renderer_class().render(None, data, response_status=200)
+
+    # Assert
+    assert isinstance(content, bytes)
+    assert json.loads(content) == json.loads(JSONRenderer().render(None, data, response_status=200))
+
+
+@pytest.mark.parametrize("renderer_class", RENDERERS)
+def test_renderer_encodes_nested_models(renderer_class):
+    # Arrange
+    data = {"job": JobPartialResponse(id=UUID(int=2), title="Sparse")}
+
+    # Act
+    content = renderer_class().render(None, data, response_status=200)
+
+    # Assert
+    assert json.loads(content) == {"job": {"id": str(UUID(int=2)), "title": "Sparse"}}
+
+
+def test_build_renderer_selects_backend():
+    assert isinstance(build_renderer("pydantic"), PydanticJSONRenderer)
+    assert isinstance(build_renderer("json"), JSONRenderer)
+
+
+@requires_orjson
+def test_build_renderer_selects_orjson():
+    assert isinstance(build_renderer("orjson"), ORJSONRenderer)
+
+
+def test_build_renderer_without_orjson_raises(mocker):
+    # Mock
+    mocker.patch("job.renderer.orjson", None)
+
+    # Act & Assert
+    with pytest.raises(ImproperlyConfigured):
+        build_renderer("orjson")
+
+
+def test_build_renderer_with_unknown_backend_raises():
+    with pytest.raises(ImproperlyConfigured):
+        build_renderer("yaml")
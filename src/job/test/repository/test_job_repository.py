@@ -1,21 +1,40 @@
-from datetime import date
+from datetime import date, datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID
 
 import pytest
+from django.db.models import Q
 
-from job.exception import NotFoundException
+from job.cache import job_cache, job_list_generation
+from job.exception import InvalidQueryException, NotFoundException
+from job.model import JobDBModel, JobSkillDBModel, JobTombstoneDBModel
 from job.repository import JobRepository
+from job.schema.change import JobChangeQuery, JobChangeType
+from job.schema.cursor import CursorDirection, JobCursor
 from job.schema.job import (
+    CountMode,
     JobCreate,
+    JobExportQuery,
+    JobField,
     JobListQuery,
+    JobPartialResponse,
     JobResponse,
     JobSortField,
     JobStatusEnum,
     JobUpdate,
+    PaginationMode,
     SalaryRange,
+    SkillMatch,
     SortOrder,
 )
+from job.schema.skill import SkillCount, SkillListQuery
+
+
+def make_job_row(job: JobResponse) -> tuple:
+    # The row values_list(*JobField) reads for a job
+    return tuple(
+        getattr(job, field) if field != JobField.SALARY_RANGE else job.salary_range.model_dump() for field in JobField
+    )
 
 
 @pytest.mark.asyncio
@@ -65,6 +84,39 @@ async def test_create_job_returns_service_model(mocker):
     assert isinstance(result, JobResponse)
 
 
+@pytest.mark.asyncio
+async def test_bulk_create_inserts_in_configured_batches(mocker, settings):
+    # Mock
+    settings.JOB_BULK_BATCH_SIZE = 2
+    mock_objects = MagicMock()
+    mock_objects.abulk_create = AsyncMock(side_effect=lambda jobs, batch_size: jobs)
+
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "objects", mock_objects)
+    generation = job_list_generation.value
+
+    create_job = JobCreate(
+        title="Bulk Job",
+        description="desc",
+        location="Taipei",
+        salary_range=SalaryRange(min=80000, max=100000),
+        company_name="Test Co",
+        posting_date=date.today(),
+        expiration_date=date.today(),
+        required_skills=["Python"],
+        status=JobStatusEnum.ACTIVE,
+    )
+
+    # Act
+    result = await job_repository.bulk_create([create_job, create_job, create_job])
+
+    # Assert
+    assert mock_objects.abulk_create.call_args.kwargs == {"batch_size": 2}
+    assert len(mock_objects.abulk_create.call_args.args[0]) == 3
+    assert [job.title for job in result] == ["Bulk Job"] * 3
+    assert job_list_generation.value == generation + 1
+
+
 @pytest.mark.asyncio
 async def test_get_by_id_returns_service_model(mocker):
     # Mock
@@ -86,7 +138,7 @@ async def test_get_by_id_returns_service_model(mocker):
     mock_job.to_service_model.return_value = mock_job_response
 
     mock_objects = MagicMock()
-    mock_objects.filter.return_value.first.return_value = mock_job
+    mock_objects.aget = AsyncMock(return_value=mock_job)
 
     job_repository = JobRepository()
     mocker.patch.object(job_repository, "objects", mock_objects)
@@ -95,7 +147,7 @@ async def test_get_by_id_returns_service_model(mocker):
     result = await job_repository.get_by_id(fake_job_id)
 
     # Assert
-    mock_objects.filter.assert_called_once()
+    mock_objects.aget.assert_awaited_once_with(id=fake_job_id)
     mock_job.to_service_model.assert_called_once()
     assert result.id == fake_job_id
     assert isinstance(result, JobResponse)
@@ -119,26 +171,114 @@ async def test_update_job_returns_updated_service_model(mocker):
     )
 
     mock_job = MagicMock()
-    mock_job.asave = AsyncMock()
     mock_job.to_service_model.return_value = mock_job_response
 
-    mock_objects = MagicMock()
-    mock_objects.filter.return_value.first.return_value = mock_job
-
     job_repository = JobRepository()
-    mocker.patch.object(job_repository, "objects", mock_objects)
+    mock_update = mocker.patch.object(job_repository, "_update_returning", AsyncMock(return_value=mock_job))
 
     # Act
     update_data = JobUpdate(title="Updated Job")
     result = await job_repository.update(fake_job_id, update_data)
 
     # Assert
-    mock_objects.filter.assert_called_once()
+    mock_update.assert_awaited_once_with(fake_job_id, {"title": "Updated Job"})
     mock_job.to_service_model.assert_called_once()
     assert result.title == "Updated Job"
     assert isinstance(result, JobResponse)
 
 
+@pytest.mark.asyncio
+async def test_update_job_dumps_nested_fields_whole(mocker):
+    # Mock
+    job_repository = JobRepository()
+    mock_update = mocker.patch.object(job_repository, "_update_returning", AsyncMock(return_value=MagicMock()))
+
+    # Act
+    await job_repository.update(UUID(int=7), JobUpdate(salary_range=SalaryRange(min=1000)))
+
+    # Assert
+    mock_update.assert_awaited_once_with(UUID(int=7), {"salary_range": {"min": 1000, "max": None}})
+
+
+@pytest.mark.asyncio
+async def test_update_job_raises_not_found_when_no_row_is_returned(mocker):
+    # Mock
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "_update_returning", AsyncMock(return_value=None))
+    generation = job_list_generation.value
+
+    # Act & Assert
+    with pytest.raises(NotFoundException):
+        await job_repository.update(UUID(int=8), JobUpdate(title="Updated Job"))
+    assert job_list_generation.value == generation
+
+
+@pytest.mark.asyncio
+async def test_update_job_without_fields_reads_current_row(mocker):
+    # Mock
+    mock_objects = MagicMock()
+    mock_objects.aget = AsyncMock(return_value=MagicMock())
+
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "objects", mock_objects)
+    mock_update = mocker.patch.object(job_repository, "_update_returning", AsyncMock())
+
+    # Act
+    await job_repository.update(UUID(int=9), JobUpdate())
+
+    # Assert
+    mock_update.assert_not_awaited()
+    mock_objects.aget.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_exists_checks_primary_key_unless_job_is_cached(mocker):
+    # Mock
+    mock_objects = MagicMock()
+    mock_objects.filter.return_value.aexists = AsyncMock(return_value=False)
+
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "objects", mock_objects)
+
+    # Arrange
+    cached_job_id = UUID(int=10)
+    await job_cache.set(cached_job_id, "cached")
+
+    # Act
+    cached = await job_repository.exists(cached_job_id)
+    missing = await job_repository.exists(UUID(int=11))
+
+    # Assert
+    assert (cached, missing) == (True, False)
+    mock_objects.filter.assert_called_once_with(id=UUID(int=11))
+
+
+@pytest.mark.asyncio
+async def test_get_by_ids_fetches_only_uncached_jobs_in_one_query(mocker, fake_job_response):
+    # Mock
+    cached_job = fake_job_response.model_copy(update={"id": UUID(int=12)})
+    mock_job = MagicMock()
+    mock_job.id = UUID(int=13)
+    mock_job.to_service_model.return_value = fake_job_response.model_copy(update={"id": UUID(int=13)})
+
+    mock_objects = MagicMock()
+    mock_objects.filter.return_value.__aiter__.return_value = [mock_job]
+
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "objects", mock_objects)
+
+    # Arrange
+    await job_cache.set(UUID(int=12), cached_job)
+
+    # Act
+    jobs = await job_repository.get_by_ids([UUID(int=12), UUID(int=13), UUID(int=14)])
+
+    # Assert
+    mock_objects.filter.assert_called_once_with(id__in=[UUID(int=13), UUID(int=14)])
+    assert set(jobs) == {UUID(int=12), UUID(int=13)}
+    assert await job_cache.get(UUID(int=13)) == jobs[UUID(int=13)]
+
+
 @pytest.mark.asyncio
 async def test_delete_job_returns_true(mocker):
     # Mock
@@ -163,20 +303,121 @@ async def test_delete_job_returns_true(mocker):
 
 
 @pytest.mark.asyncio
-async def test_get_all_skill_returns_unique_skills(mocker):
+async def test_get_by_id_serves_repeated_reads_from_job_cache(mocker):
     # Mock
+    fake_job_id = UUID("00000000-0000-0000-0000-000000000005")
+    mock_job = MagicMock()
+    mock_job.to_service_model.return_value = JobResponse(
+        id=fake_job_id,
+        title="Cached Job",
+        description="desc",
+        location="Taipei",
+        salary_range=SalaryRange(min=80000, max=100000),
+        company_name="Test Co",
+        posting_date=date.today(),
+        expiration_date=date.today(),
+        required_skills=["Python"],
+        status=JobStatusEnum.ACTIVE,
+    )
+
     mock_objects = MagicMock()
-    mock_objects.values_list.return_value = [["Python", "Vue"], ["Python", "Django"]]
+    mock_objects.aget = AsyncMock(return_value=mock_job)
 
     job_repository = JobRepository()
     mocker.patch.object(job_repository, "objects", mock_objects)
 
+    hits = job_cache.stat().hits
+
+    # Act
+    first = await job_repository.get_by_id(fake_job_id)
+    second = await job_repository.get_by_id(fake_job_id)
+
+    # Assert
+    mock_objects.aget.assert_awaited_once()
+    assert first == second
+    assert job_cache.stat().hits == hits + 1
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_does_not_cache_a_row_read_before_a_concurrent_update(mocker, fake_job_response):
+    # Mock
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "_update_returning", AsyncMock(return_value=MagicMock()))
+
+    async def read_then_update(job_id):
+        # The row is loaded, then an update commits and evicts before the read gets to cache it
+        stale_job = MagicMock()
+        stale_job.to_service_model.return_value = fake_job_response
+        await job_repository.update(job_id, JobUpdate(title="Updated Job"))
+        return stale_job
+
+    mocker.patch.object(job_repository, "_get_or_raise", side_effect=read_then_update)
+
+    # Act
+    result = await job_repository.get_by_id(fake_job_response.id)
+
+    # Assert
+    assert result == fake_job_response
+    assert await job_cache.get(fake_job_response.id) is None
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_invalidate_cached_job(mocker):
+    # Mock
+    fake_job_id = UUID("00000000-0000-0000-0000-000000000006")
+    mock_objects = MagicMock()
+    mock_objects.filter.return_value.adelete = AsyncMock(return_value=(1, {}))
+
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "objects", mock_objects)
+    mocker.patch.object(job_repository, "_update_returning", AsyncMock(return_value=MagicMock()))
+
+    # Act & Assert
+    await job_cache.set(fake_job_id, "stale")
+    await job_repository.update(fake_job_id, JobUpdate(title="Updated Job"))
+    assert await job_cache.get(fake_job_id) is None
+
+    await job_cache.set(fake_job_id, "stale")
+    await job_repository.delete(fake_job_id)
+    assert await job_cache.get(fake_job_id) is None
+
+
+@pytest.mark.asyncio
+async def test_get_all_skill_reads_skill_catalog(mocker):
+    # Mock
+    mock_skills = MagicMock()
+    mock_qs = mock_skills.order_by.return_value
+    mock_qs.values_list.return_value.__aiter__.return_value = ["Django", "Python", "Vue"]
+
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "skills", mock_skills)
+
+    # Act
+    result = await job_repository.get_all_skill(SkillListQuery())
+
+    # Assert
+    mock_skills.order_by.assert_called_once_with("name")
+    mock_qs.filter.assert_not_called()
+    mock_qs.values_list.assert_called_once_with("name", flat=True)
+    assert result == ["Django", "Python", "Vue"]
+
+
+@pytest.mark.asyncio
+async def test_get_all_skill_with_prefix_and_count_returns_skill_counts(mocker):
+    # Mock
+    mock_skills = MagicMock()
+    mock_filtered = mock_skills.order_by.return_value.filter.return_value
+    mock_filtered.__aiter__.return_value = [JobSkillDBModel(name="Python", job_count=3)]
+
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "skills", mock_skills)
+
     # Act
-    result = await job_repository.get_all_skill()
+    result = await job_repository.get_all_skill(SkillListQuery(prefix="py", with_count=True))
 
     # Assert
-    mock_objects.values_list.assert_called_once()
-    assert sorted(result) == ["Django", "Python", "Vue"]
+    mock_skills.order_by.return_value.filter.assert_called_once_with(name__istartswith="py")
+    assert result == [SkillCount(name="Python", job_count=3)]
 
 
 @pytest.mark.asyncio
@@ -196,13 +437,13 @@ async def test_get_all_returns_paginated_jobs(mocker):
         status=JobStatusEnum.ACTIVE,
     )
 
-    mock_job = MagicMock()
-    mock_job.to_service_model.return_value = mock_job_response
+    mock_page = MagicMock()
+    mock_page.values_list.return_value.__aiter__.return_value = [make_job_row(mock_job_response)]
 
     mock_qs = MagicMock()
-    mock_qs.count.return_value = 1
+    mock_qs.acount = AsyncMock(return_value=1)
     mock_qs.order_by.return_value = mock_qs
-    mock_qs.__getitem__.return_value = [mock_job]
+    mock_qs.__getitem__.return_value = mock_page
 
     mock_objects = MagicMock()
     mock_objects.filter.return_value = mock_qs
@@ -219,16 +460,17 @@ async def test_get_all_returns_paginated_jobs(mocker):
 
     # Assert
     mock_objects.filter.assert_called_once()
+    mock_page.values_list.assert_called_once_with(*JobField)
     assert result.total == 1
     assert isinstance(result.list[0], JobResponse)
+    assert result.list[0] == mock_job_response
 
 
 @pytest.mark.asyncio
 async def test_get_all_with_no_filters(mocker):
     # Mock
     fake_job_id = UUID("00000000-0000-0000-0000-000000000005")
-    mock_job = MagicMock()
-    mock_job.to_service_model.return_value = JobResponse(
+    mock_job_response = JobResponse(
         id=fake_job_id,
         title="Default",
         description="",
@@ -241,10 +483,13 @@ async def test_get_all_with_no_filters(mocker):
         status=JobStatusEnum.ACTIVE,
     )
 
+    mock_page = MagicMock()
+    mock_page.values_list.return_value.__aiter__.return_value = [make_job_row(mock_job_response)]
+
     mock_qs = MagicMock()
-    mock_qs.count.return_value = 1
+    mock_qs.acount = AsyncMock(return_value=1)
     mock_qs.order_by.return_value = mock_qs
-    mock_qs.__getitem__.return_value = [mock_job]
+    mock_qs.__getitem__.return_value = mock_page
 
     mock_objects = MagicMock()
     mock_objects.filter.return_value = mock_qs
@@ -267,7 +512,7 @@ async def test_get_by_id_raises_not_found(mocker):
     fake_job_id = UUID("00000000-0000-0000-0000-00000000abcd")
 
     mock_objects = MagicMock()
-    mock_objects.filter.return_value.first.return_value = None
+    mock_objects.aget = AsyncMock(side_effect=JobDBModel.DoesNotExist)
 
     job_repository = JobRepository()
     mocker.patch.object(job_repository, "objects", mock_objects)
@@ -275,3 +520,366 @@ async def test_get_by_id_raises_not_found(mocker):
     # Act & Assert
     with pytest.raises(NotFoundException):
         await job_repository.get_by_id(fake_job_id)
+
+
+@pytest.mark.asyncio
+async def test_get_all_with_fields_reads_only_selected_columns(mocker):
+    # Mock
+    mock_page = MagicMock()
+    mock_page.values_list.return_value.__aiter__.return_value = [(UUID(int=1), "Sparse Job", {"min": 1, "max": 2})]
+
+    mock_qs = MagicMock()
+    mock_qs.acount = AsyncMock(return_value=1)
+    mock_qs.order_by.return_value = mock_qs
+    mock_qs.__getitem__.return_value = mock_page
+
+    mock_objects = MagicMock()
+    mock_objects.filter.return_value = mock_qs
+
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "objects", mock_objects)
+
+    # Act
+    query = JobListQuery.model_validate({"fields": "title,salary_range,id"})
+    result = await job_repository.get_all(query)
+
+    # Assert
+    mock_page.values_list.assert_called_once_with(JobField.ID, JobField.TITLE, JobField.SALARY_RANGE)
+    assert isinstance(result.list[0], JobPartialResponse)
+    assert result.list[0].model_dump(mode="json") == {
+        "id": str(UUID(int=1)),
+        "title": "Sparse Job",
+        "salary_range": {"min": 1, "max": 2},
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_changes_merges_jobs_and_tombstones_by_seq(mocker, fake_job_response):
+    # Mock
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    updated_at = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    job_row = (*make_job_row(fake_job_response), 12, created_at, updated_at)
+    tombstone = JobTombstoneDBModel(id=UUID(int=9), change_seq=11, deleted_at=updated_at)
+
+    mock_page = MagicMock()
+    mock_page.values_list.return_value.__aiter__.return_value = [job_row]
+
+    mock_objects = MagicMock()
+    mock_objects.filter.return_value.order_by.return_value.__getitem__.return_value = mock_page
+    mock_tombstones = MagicMock()
+    mock_tombstones.filter.return_value.order_by.return_value.__getitem__.return_value.__aiter__.return_value = [
+        tombstone
+    ]
+
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "objects", mock_objects)
+    mocker.patch.object(job_repository, "tombstones", mock_tombstones)
+    mocker.patch.object(JobRepository, "_change_watermark", AsyncMock(return_value=20))
+
+    # Act
+    result = await job_repository.get_changes(JobChangeQuery(since=10, limit=1))
+
+    # Assert
+    mock_objects.filter.assert_called_once_with(Q(change_seq__gt=10, change_seq__lt=20))
+    mock_objects.filter.return_value.order_by.return_value.__getitem__.assert_called_once_with(slice(None, 2))
+    assert [(change.seq, change.type, change.job) for change in result.changes] == [(11, JobChangeType.DELETED, None)]
+    assert result.next_since == 11
+    assert result.has_more is True
+
+
+@pytest.mark.asyncio
+async def test_get_changes_without_new_writes_keeps_checkpoint(mocker, fake_job_response):
+    # Mock
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    job_row = (*make_job_row(fake_job_response), 12, created_at, created_at)
+
+    mock_page = MagicMock()
+    mock_page.values_list.return_value.__aiter__.return_value = [job_row]
+
+    mock_objects = MagicMock()
+    mock_objects.filter.return_value.order_by.return_value.__getitem__.return_value = mock_page
+
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "objects", mock_objects)
+    mocker.patch.object(job_repository, "tombstones", MagicMock())
+    mocker.patch.object(JobRepository, "_change_watermark", AsyncMock(return_value=20))
+
+    # Act
+    changed = await job_repository.get_changes(JobChangeQuery(since=10))
+    mock_page.values_list.return_value.__aiter__.return_value = []
+    unchanged = await job_repository.get_changes(JobChangeQuery(since=12))
+
+    # Assert
+    assert [(change.type, change.job) for change in changed.changes] == [(JobChangeType.CREATED, fake_job_response)]
+    assert (unchanged.changes, unchanged.next_since, unchanged.has_more) == ([], 12, False)
+
+
+@pytest.mark.asyncio
+async def test_export_streams_filtered_rows_by_id(mocker):
+    # Mock
+    mock_qs = MagicMock()
+    mock_qs.order_by.return_value.values.return_value.aiterator.return_value.__aiter__.return_value = [
+        {"id": UUID(int=1), "title": "Export Job", "status": "active"}
+    ]
+
+    mock_objects = MagicMock()
+    mock_objects.filter.return_value = mock_qs
+
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "objects", mock_objects)
+
+    # Act
+    query = JobExportQuery.model_validate({"fields": "title,status", "status": "active"})
+    result = [job async for job in job_repository.export(query)]
+
+    # Assert
+    mock_qs.order_by.assert_called_once_with("id")
+    mock_qs.order_by.return_value.values.assert_called_once_with(JobField.ID, JobField.TITLE, JobField.STATUS)
+    assert result[0].model_dump() == {"id": UUID(int=1), "title": "Export Job", "status": JobStatusEnum.ACTIVE}
+
+
+@pytest.mark.asyncio
+async def test_get_all_with_cursor_pagination_returns_next_cursor(mocker):
+    # Mock
+    mock_job_list = [
+        JobResponse(
+            id=UUID(f"00000000-0000-0000-0000-{day:012d}"),
+            title="Cursor Job",
+            description="cursor test",
+            location="Taipei",
+            salary_range=SalaryRange(min=80000, max=100000),
+            company_name="Cursor Co",
+            posting_date=date(2024, 1, day),
+            expiration_date=date(2024, 1, day),
+            required_skills=["Python"],
+            status=JobStatusEnum.ACTIVE,
+        )
+        for day in range(11, 0, -1)
+    ]
+
+    mock_page = MagicMock()
+    mock_page.values_list.return_value.__aiter__.return_value = [make_job_row(job) for job in mock_job_list]
+
+    mock_qs = MagicMock()
+    mock_qs.acount = AsyncMock(return_value=11)
+    mock_qs.order_by.return_value = mock_qs
+    mock_qs.__getitem__.return_value = mock_page
+
+    mock_objects = MagicMock()
+    mock_objects.filter.return_value = mock_qs
+
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "objects", mock_objects)
+
+    # Act
+    query = JobListQuery(page_size=10, pagination=PaginationMode.CURSOR)
+    result = await job_repository.get_all(query)
+
+    # Assert
+    mock_qs.order_by.assert_called_once_with("-posting_date", "-id")
+    mock_qs.__getitem__.assert_called_once_with(slice(None, 11))
+    assert result.list == mock_job_list[:10]
+    assert result.prev_cursor is None
+
+    next_cursor = JobCursor.decode(result.next_cursor)
+    assert next_cursor.direction == CursorDirection.NEXT
+    assert next_cursor.value == date(2024, 1, 2)
+    assert next_cursor.id == mock_job_list[9].id
+
+
+@pytest.mark.asyncio
+async def test_get_all_with_cursor_for_other_ordering_raises_invalid_query(mocker):
+    # Mock
+    mock_objects = MagicMock()
+
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "objects", mock_objects)
+
+    # Arrange
+    cursor = JobCursor(
+        order_by=JobSortField.EXPIRATION_DATE,
+        sort_order=SortOrder.DESC,
+        direction=CursorDirection.NEXT,
+        value=date(2024, 1, 1),
+        id=UUID("00000000-0000-0000-0000-000000000001"),
+    ).encode()
+
+    # Act & Assert
+    with pytest.raises(InvalidQueryException):
+        await job_repository.get_all(JobListQuery(cursor=cursor, order_by=JobSortField.POSTING_DATE))
+
+    mock_objects.filter.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_all_with_count_mode_none_skips_count(mocker):
+    # Mock
+    mock_page = MagicMock()
+    mock_page.__aiter__.return_value = []
+
+    mock_qs = MagicMock()
+    mock_qs.acount = AsyncMock(return_value=1)
+    mock_qs.order_by.return_value = mock_qs
+    mock_qs.__getitem__.return_value = mock_page
+
+    mock_objects = MagicMock()
+    mock_objects.filter.return_value = mock_qs
+
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "objects", mock_objects)
+
+    # Act
+    result = await job_repository.get_all(JobListQuery(count_mode=CountMode.NONE))
+
+    # Assert
+    mock_qs.acount.assert_not_called()
+    assert result.total is None
+    assert result.count_mode == CountMode.NONE
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "explain_output",
+    [
+        '{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 4200}}',
+        '[{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 4200}}]',
+    ],
+    ids=["object", "list"],
+)
+async def test_get_all_with_count_mode_estimated_reads_planner_rows(mocker, explain_output):
+    # Mock
+    mock_page = MagicMock()
+    mock_page.__aiter__.return_value = []
+
+    mock_qs = MagicMock()
+    mock_qs.acount = AsyncMock(return_value=1)
+    mock_qs.aexplain = AsyncMock(return_value=explain_output)
+    mock_qs.order_by.return_value = mock_qs
+    mock_qs.__getitem__.return_value = mock_page
+
+    mock_objects = MagicMock()
+    mock_objects.filter.return_value = mock_qs
+
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "objects", mock_objects)
+
+    # Act
+    result = await job_repository.get_all(JobListQuery(status=JobStatusEnum.ACTIVE, count_mode=CountMode.ESTIMATED))
+
+    # Assert
+    mock_qs.aexplain.assert_awaited_once_with(format="json")
+    mock_qs.acount.assert_not_called()
+    assert result.total == 4200
+    assert result.count_mode == CountMode.ESTIMATED
+
+
+@pytest.mark.asyncio
+async def test_get_all_exact_count_is_cached_per_normalized_filter(mocker):
+    # Mock
+    mock_page = MagicMock()
+    mock_page.__aiter__.return_value = []
+
+    mock_qs = MagicMock()
+    mock_qs.acount = AsyncMock(return_value=7)
+    mock_qs.order_by.return_value = mock_qs
+    mock_qs.__getitem__.return_value = mock_page
+
+    mock_objects = MagicMock()
+    mock_objects.filter.return_value = mock_qs
+
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "objects", mock_objects)
+
+    # Act
+    first = await job_repository.get_all(JobListQuery(page=1, skills=["Python", "Django"], search="API"))
+    second = await job_repository.get_all(JobListQuery(page=2, skills=["Django", "Python"], search="api"))
+
+    # Assert
+    mock_qs.acount.assert_awaited_once()
+    assert first.total == second.total == 7
+
+
+@pytest.mark.asyncio
+async def test_get_all_does_not_reuse_a_count_taken_during_a_write(mocker):
+    # Mock
+    mock_page = MagicMock()
+    mock_page.__aiter__.return_value = []
+
+    counts = iter([7, 8])
+
+    async def count_while_writing():
+        # A write lands, and invalidates the caches, while each count is running
+        JobRepository._invalidate_caches()
+        return next(counts)
+
+    mock_qs = MagicMock()
+    mock_qs.acount = AsyncMock(side_effect=count_while_writing)
+    mock_qs.order_by.return_value = mock_qs
+    mock_qs.__getitem__.return_value = mock_page
+
+    mock_objects = MagicMock()
+    mock_objects.filter.return_value = mock_qs
+
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "objects", mock_objects)
+
+    # Act
+    first = await job_repository.get_all(JobListQuery())
+    second = await job_repository.get_all(JobListQuery())
+
+    # Assert
+    assert mock_qs.acount.await_count == 2
+    assert (first.total, second.total) == (7, 8)
+
+
+@pytest.mark.asyncio
+async def test_get_all_with_relevance_order_ranks_by_search_vector(mocker):
+    # Mock
+    mock_page = MagicMock()
+    mock_page.__aiter__.return_value = []
+
+    mock_qs = MagicMock()
+    mock_qs.acount = AsyncMock(return_value=0)
+    mock_qs.alias.return_value = mock_qs
+    mock_qs.order_by.return_value = mock_qs
+    mock_qs.__getitem__.return_value = mock_page
+
+    mock_objects = MagicMock()
+    mock_objects.filter.return_value = mock_qs
+
+    job_repository = JobRepository()
+    mocker.patch.object(job_repository, "objects", mock_objects)
+
+    # Act
+    await job_repository.get_all(JobListQuery(search="backend python", order_by=JobSortField.RELEVANCE))
+
+    # Assert
+    assert "relevance" in mock_qs.alias.call_args.kwargs
+    mock_qs.order_by.assert_called_once_with("-relevance", "-id")
+    assert "search_vector" in str(mock_objects.filter.call_args.args[0])
+
+
+def test_build_filters_with_fuzzy_mode_uses_trigram_word_similarity():
+    # Arrange
+    query = JobListQuery(company_name="Technva", location="Taipe", fuzzy=True, similarity_threshold=0.7)
+
+    # Act
+    sql = str(JobDBModel.objects.filter(JobRepository._build_filters(query)).query)
+
+    # Assert
+    assert 'UPPER("job_post"."company_name") %>' in sql
+    assert 'UPPER("job_post"."location") %>' in sql
+    assert "WORD_SIMILARITY" in sql
+    assert '"job_post"."location" = ' not in sql
+
+
+@pytest.mark.parametrize(("skills_match", "operator"), [(SkillMatch.ANY, "?|"), (SkillMatch.ALL, "?&")])
+def test_build_filters_with_skills_uses_jsonb_key_operators(skills_match, operator):
+    # Arrange
+    query = JobListQuery(skills=["Python", "Django"], skills_match=skills_match)
+
+    # Act
+    sql = str(JobDBModel.objects.filter(JobRepository._build_filters(query)).query)
+
+    # Assert
+    assert f'"job_post"."required_skills" {operator}' in sql
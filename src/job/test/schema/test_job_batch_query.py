@@ -0,0 +1,16 @@
+from uuid import UUID
+
+import pytest
+from pydantic import ValidationError
+
+from job.schema.job import JobBatchQuery
+
+
+def test_job_batch_query_accepts_comma_separated_and_repeated_ids():
+    query = JobBatchQuery.model_validate({"ids": [f"{UUID(int=1)},{UUID(int=2)}", str(UUID(int=3))]})
+    assert query.ids == [UUID(int=1), UUID(int=2), UUID(int=3)]
+
+
+def test_job_batch_query_requires_at_least_one_id():
+    with pytest.raises(ValidationError):
+        JobBatchQuery.model_validate({"ids": ""})
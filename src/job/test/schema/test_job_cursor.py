@@ -0,0 +1,26 @@
+from datetime import date
+from uuid import UUID
+
+import pytest
+
+from job.exception import InvalidQueryException
+from job.schema.cursor import CursorDirection, JobCursor
+from job.schema.job import JobSortField, SortOrder
+
+
+def test_job_cursor_round_trip():
+    cursor = JobCursor(
+        order_by=JobSortField.POSTING_DATE,
+        sort_order=SortOrder.ASC,
+        direction=CursorDirection.PREV,
+        value=date(2024, 5, 1),
+        id=UUID("00000000-0000-0000-0000-000000000001"),
+    )
+
+    assert JobCursor.decode(cursor.encode()) == cursor
+
+
+@pytest.mark.parametrize("token", ["not-a-cursor", "eyJmb28iOiAiYmFyIn0="])
+def test_job_cursor_decode_invalid_token_raises(token):
+    with pytest.raises(InvalidQueryException):
+        JobCursor.decode(token)
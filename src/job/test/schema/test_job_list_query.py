@@ -0,0 +1,57 @@
+import pytest
+from pydantic import ValidationError
+
+from job.schema.job import JobField, JobListQuery, JobSortField, PaginationMode, SkillMatch
+
+
+def test_job_list_query_relevance_order_requires_search():
+    with pytest.raises(ValidationError) as exc_info:
+        JobListQuery(order_by=JobSortField.RELEVANCE)
+
+    assert any("requires a search term" in err["msg"] for err in exc_info.value.errors())
+
+
+def test_job_list_query_relevance_order_rejects_cursor_pagination():
+    with pytest.raises(ValidationError):
+        JobListQuery(order_by=JobSortField.RELEVANCE, search="python", pagination=PaginationMode.CURSOR)
+
+
+def test_job_list_query_filter_key_ignores_skill_order_and_case():
+    first = JobListQuery(search="Python", company_name="TechNova", skills=["SQL", "Django"], page=1)
+    second = JobListQuery(search="python", company_name="technova", skills=["Django", "SQL", "SQL"], page=3)
+
+    assert first.filter_key() == second.filter_key()
+
+
+def test_job_list_query_similarity_threshold_below_index_threshold_raises():
+    with pytest.raises(ValidationError):
+        JobListQuery(company_name="Technva", fuzzy=True, similarity_threshold=0.3)
+
+
+def test_job_list_query_filter_key_distinguishes_skills_match():
+    any_match = JobListQuery(skills=["Python", "Django"])
+    all_match = JobListQuery(skills=["Python", "Django"], skills_match=SkillMatch.ALL)
+
+    assert any_match.filter_key() != all_match.filter_key()
+
+
+def test_job_list_query_query_key_includes_paging():
+    first_page = JobListQuery(search="Python", page=1)
+    second_page = JobListQuery(search="python", page=2)
+
+    assert first_page.filter_key() == second_page.filter_key()
+    assert first_page.query_key() != second_page.query_key()
+    assert first_page.query_key() == JobListQuery(search="PYTHON", page=1).query_key()
+
+
+def test_job_list_query_fields_accept_comma_separated_values_and_change_query_key():
+    sparse = JobListQuery.model_validate({"fields": ["title,company_name", "location"]})
+
+    assert sparse.fields == [JobField.TITLE, JobField.COMPANY_NAME, JobField.LOCATION]
+    assert sparse.query_key() != JobListQuery().query_key()
+    assert sparse.filter_key() == JobListQuery().filter_key()
+
+
+def test_job_list_query_rejects_unknown_field():
+    with pytest.raises(ValidationError):
+        JobListQuery.model_validate({"fields": "title,password"})
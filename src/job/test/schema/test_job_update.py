@@ -0,0 +1,17 @@
+import pytest
+from pydantic import ValidationError
+
+from job.schema.job import JobUpdate
+
+
+def test_job_update_tracks_only_sent_fields():
+    update = JobUpdate.model_validate({"title": "Engineer", "status": "expired"})
+    assert update.model_fields_set == {"title", "status"}
+
+
+def test_job_update_rejects_explicit_null():
+    with pytest.raises(ValidationError) as exc_info:
+        JobUpdate.model_validate({"title": None, "location": None})
+
+    errors = exc_info.value.errors()
+    assert any("location, title cannot be null" in err["msg"] for err in errors)
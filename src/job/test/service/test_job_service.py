@@ -1,8 +1,12 @@
+from uuid import uuid4
+
 import pytest
 from pydantic import ValidationError
 
-from job.exception import NotFoundException
-from job.schema.job import JobCreate, JobResponse
+from job.cache import job_list_generation
+from job.exception import InvalidQueryException, NotFoundException
+from job.schema.job import JobBatchQuery, JobCreate, JobListQuery, JobResponse, PaginationResult
+from job.schema.skill import SkillCount, SkillListQuery, SkillSuggestQuery
 
 
 @pytest.mark.asyncio
@@ -111,3 +115,103 @@ async def test_negative_delete_job_returns_false_when_not_found(nonexistent_job_
 
     # Assert
     assert result is False
+
+
+@pytest.mark.asyncio
+async def test_positive_suggest_skill_builds_index_once_until_invalidated(job_service, mock_repository):
+    # Mock
+    mock_repository.get_all_skill.return_value = [
+        SkillCount(name="Django", job_count=2),
+        SkillCount(name="Docker", job_count=4),
+        SkillCount(name="Python", job_count=6),
+    ]
+
+    # Act
+    first = await job_service.suggest_skill(SkillSuggestQuery(prefix="d"))
+    second = await job_service.suggest_skill(SkillSuggestQuery(prefix="py"))
+
+    # Assert
+    mock_repository.get_all_skill.assert_awaited_once_with(SkillListQuery(with_count=True))
+    assert [skill.name for skill in first] == ["Docker", "Django"]
+    assert [skill.name for skill in second] == ["Python"]
+
+
+@pytest.mark.asyncio
+async def test_positive_get_all_job_caches_result_until_generation_bumps(job_service, mock_repository):
+    # Mock
+    mock_repository.get_all.return_value = PaginationResult(total=0, page=1, page_size=10, list=[])
+
+    # Act
+    first, first_etag = await job_service.get_all_job(JobListQuery(skills=["SQL", "Go"], company_name="Acme"))
+    second, second_etag = await job_service.get_all_job(JobListQuery(skills=["Go", "SQL"], company_name="ACME"))
+    job_list_generation.bump()
+    await job_service.get_all_job(JobListQuery(skills=["Go", "SQL"], company_name="ACME"))
+
+    # Assert
+    assert first == second
+    assert first_etag == second_etag
+    assert mock_repository.get_all.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_positive_bulk_create_job_reports_each_item_in_order(
+    existing_job_uuid, job_service, mock_repository, fake_job_create_data
+):
+    # Mock
+    mock_repository.bulk_create.return_value = [
+        JobResponse(id=existing_job_uuid, **fake_job_create_data.model_dump()),
+        JobResponse(id=existing_job_uuid, **fake_job_create_data.model_dump()),
+    ]
+    valid_item = fake_job_create_data.model_dump(mode="json")
+
+    # Act
+    result = await job_service.bulk_create_job([valid_item, {**valid_item, "status": "archived"}, valid_item])
+
+    # Assert
+    mock_repository.bulk_create.assert_awaited_once_with([fake_job_create_data, fake_job_create_data])
+    assert (result.created, result.failed) == (2, 1)
+    assert [item.success for item in result.results] == [True, False, True]
+    assert result.results[1].error.startswith("status:")
+    assert result.results[2].id == existing_job_uuid
+
+
+@pytest.mark.asyncio
+async def test_negative_bulk_create_job_skips_repository_when_every_item_is_invalid(job_service, mock_repository):
+    # Act
+    result = await job_service.bulk_create_job([{"title": "Missing fields"}])
+
+    # Assert
+    mock_repository.bulk_create.assert_not_awaited()
+    assert (result.created, result.failed) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_positive_get_job_batch_keeps_requested_order_and_reports_missing(
+    existing_job_uuid, nonexistent_job_uuid, random_nonexistent_uuid, job_service, mock_repository, fake_job_response
+):
+    # Mock
+    other_job = fake_job_response.model_copy(update={"id": random_nonexistent_uuid})
+    mock_repository.get_by_ids.return_value = {existing_job_uuid: fake_job_response, random_nonexistent_uuid: other_job}
+
+    # Act
+    result = await job_service.get_job_batch(
+        JobBatchQuery(ids=[random_nonexistent_uuid, nonexistent_job_uuid, existing_job_uuid, random_nonexistent_uuid])
+    )
+
+    # Assert
+    mock_repository.get_by_ids.assert_awaited_once_with(
+        [random_nonexistent_uuid, nonexistent_job_uuid, existing_job_uuid]
+    )
+    assert [job.id for job in result.jobs] == [random_nonexistent_uuid, existing_job_uuid]
+    assert result.missing == [nonexistent_job_uuid]
+
+
+@pytest.mark.asyncio
+async def test_negative_get_job_batch_rejects_too_many_ids(settings, job_service, mock_repository):
+    # Mock
+    settings.JOB_BATCH_MAX_IDS = 2
+
+    # Act & Assert
+    with pytest.raises(InvalidQueryException):
+        await job_service.get_job_batch(JobBatchQuery(ids=[uuid4(), uuid4(), uuid4()]))
+    mock_repository.get_by_ids.assert_not_awaited()
@@ -0,0 +1,145 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+BENCHMARK_RESULT_DIR = Path(os.getenv("BENCHMARK_RESULT_DIR", "benchmark_result"))
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    rank = max(1, round(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize_latency(latencies: list[float], elapsed: float) -> dict:
+    return {
+        "requests": len(latencies),
+        "elapsed_s": round(elapsed, 4),
+        "requests_per_s": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(max(latencies) * 1000, 3),
+    }
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def record_benchmark(name: str, result: dict) -> Path:
+    BENCHMARK_RESULT_DIR.mkdir(parents=True, exist_ok=True)
+    path = BENCHMARK_RESULT_DIR / f"{name}.json"
+
+    history = json.loads(path.read_text()) if path.exists() else []
+    history.append(
+        {
+            "commit": current_commit(),
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            **result,
+        }
+    )
+    path.write_text(json.dumps(history, indent=2))
+    return path
+
+
+def summarize_timings(samples: list[float]) -> dict:
+    return {
+        "runs": len(samples),
+        "min_ms": round(min(samples) * 1000, 3),
+        "median_ms": round(statistics.median(samples) * 1000, 3),
+        "p95_ms": round(percentile(samples, 95) * 1000, 3),
+    }
+
+
+async def measure(
+    action: Callable[[], Awaitable[Any]], repeat: int, before_each: Callable[[], Any] | None = None
+) -> dict:
+    # One untimed warm-up run so connection setup and cold plans don't skew the first sample
+    samples = []
+    for run in range(repeat + 1):
+        if before_each:
+            before_each()
+        started = time.perf_counter()
+        await action()
+        if run:
+            samples.append(time.perf_counter() - started)
+    return summarize_timings(samples)
+
+
+def flatten_metrics(result: Any, prefix: str = "") -> dict[str, float]:
+    if isinstance(result, dict):
+        items = result.items()
+    elif isinstance(result, list):
+        items = enumerate(result)
+    elif isinstance(result, (int, float)) and not isinstance(result, bool):
+        return {prefix: result}
+    else:
+        return {}
+
+    metrics: dict[str, float] = {}
+    for key, value in items:
+        metrics.update(flatten_metrics(value, f"{prefix}.{key}" if prefix else str(key)))
+    return metrics
+
+
+def compare_records(base: dict, head: dict, threshold: float) -> list[dict]:
+    base_metrics, head_metrics = flatten_metrics(base), flatten_metrics(head)
+    rows = []
+    for name in sorted(base_metrics.keys() & head_metrics.keys()):
+        # Latencies should go down and throughputs up; counts and sizes are context, not results
+        if name.endswith("per_s"):
+            higher_is_better = True
+        elif name.endswith(("_ms", "elapsed_s")):
+            higher_is_better = False
+        else:
+            continue
+
+        before, after = base_metrics[name], head_metrics[name]
+        change = (after - before) / before if before else 0.0
+        regression = change < -threshold if higher_is_better else change > threshold
+        rows.append({"metric": name, "base": before, "head": after, "change": change, "regression": regression})
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two recorded benchmark runs")
+    parser.add_argument("path", type=Path, help="Benchmark result file, e.g. benchmark_result/job_repository.json")
+    parser.add_argument("--base", help="Commit of the baseline run, defaults to the second to last run")
+    parser.add_argument("--head", help="Commit of the run to check, defaults to the last run")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative change that counts as a regression")
+    args = parser.parse_args(argv)
+
+    history = json.loads(args.path.read_text())
+
+    def find(commit: str | None, default_index: int) -> dict:
+        if commit is None:
+            return history[default_index]
+        # The latest run of a commit wins when it was benchmarked more than once
+        return next(record for record in reversed(history) if record["commit"].startswith(commit))
+
+    if len(history) < 2 and not (args.base and args.head):
+        print(f"{args.path}: need at least two runs to compare")
+        return 0
+
+    base, head = find(args.base, -2), find(args.head, -1)
+    rows = compare_records(base, head, args.threshold)
+
+    print(f"{args.path}: {base['commit']} -> {head['commit']}")
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        print(f"  {row['metric']:<60} {row['base']:>12} {row['head']:>12} {row['change']:>+8.1%} {flag}")
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -47,7 +47,8 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
-    "job",
+    "django.contrib.postgres",
+    "job.app.JobConfig",
     "corsheaders",
     "ninja_extra",
     "ninja_jwt",
@@ -59,7 +60,9 @@ NINJA_JWT = {
 }
 
 MIDDLEWARE = [
+    "job.middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "job.middleware.QueryInstrumentationMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -108,6 +111,55 @@ DATABASES = {
 }
 
 
+# Bulk job create
+
+JOB_BULK_MAX_ITEMS = config.get("JOB_BULK_MAX_ITEMS", 10000)
+JOB_BULK_BATCH_SIZE = config.get("JOB_BULK_BATCH_SIZE", 1000)
+JOB_BATCH_MAX_IDS = config.get("JOB_BATCH_MAX_IDS", 100)
+
+# Job export
+
+# Rows fetched per round trip from the export's server-side cursor
+JOB_EXPORT_CHUNK_SIZE = config.get("JOB_EXPORT_CHUNK_SIZE", 2000)
+
+# Job change stream
+
+# Seconds between SSE keepalive comments on an idle stream
+JOB_CHANGE_STREAM_HEARTBEAT = config.get("JOB_CHANGE_STREAM_HEARTBEAT", 15)
+# Seconds after which the listener re-reads the change feed without a notification, e.g. once a rolled-back writer
+# stops holding back changes that committed after it
+JOB_CHANGE_STREAM_POLL_INTERVAL = config.get("JOB_CHANGE_STREAM_POLL_INTERVAL", 30)
+# Events buffered per client; a client that falls further behind is disconnected and resumes with Last-Event-ID
+JOB_CHANGE_STREAM_QUEUE_SIZE = config.get("JOB_CHANGE_STREAM_QUEUE_SIZE", 1000)
+
+# Job list caching
+
+JOB_COUNT_CACHE_TTL = config.get("JOB_COUNT_CACHE_TTL", 30)
+JOB_COUNT_CACHE_SIZE = config.get("JOB_COUNT_CACHE_SIZE", 1024)
+# Writes in this process invalidate list entries immediately, the TTL bounds staleness from other workers
+JOB_LIST_CACHE_TTL = config.get("JOB_LIST_CACHE_TTL", 10)
+JOB_LIST_CACHE_SIZE = config.get("JOB_LIST_CACHE_SIZE", 1024)
+SKILL_INDEX_TTL = config.get("SKILL_INDEX_TTL", 60)
+
+# "local" keeps job detail entries in-process, "django" stores them in the JOB_CACHE_ALIAS cache
+JOB_CACHE_BACKEND = config.get("JOB_CACHE_BACKEND", "local")
+JOB_CACHE_ALIAS = config.get("JOB_CACHE_ALIAS", "default")
+JOB_CACHE_TTL = config.get("JOB_CACHE_TTL", 60)
+JOB_CACHE_SIZE = config.get("JOB_CACHE_SIZE", 4096)
+
+# SQL instrumentation
+
+# Statements slower than this are logged to the "job.sql" logger and counted in /metrics
+SLOW_QUERY_THRESHOLD_MS = config.get("SLOW_QUERY_THRESHOLD_MS", 200)
+# Requests slower than this are logged to the "job.request" logger together with their slowest statement
+SLOW_REQUEST_THRESHOLD_MS = config.get("SLOW_REQUEST_THRESHOLD_MS", 1000)
+
+# Response rendering
+
+# "pydantic" encodes with pydantic-core, "orjson" needs the optional orjson package, "json" is ninja's default
+JOB_JSON_RENDERER = config.get("JOB_JSON_RENDERER", "pydantic")
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
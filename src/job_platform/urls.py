@@ -1,13 +1,16 @@
 from authentication.handler import PrivateAuthController, PublicAuthController
+from django.conf import settings
 from django.contrib import admin
 from django.http import JsonResponse
 from django.urls import path
 from ninja_extra import NinjaExtraAPI
 
-from job.exception import NotFoundException
+from job.exception import InvalidQueryException, NotFoundException
 from job.handler import job_router
+from job.metrics import metrics_view
+from job.renderer import build_renderer
 
-api = NinjaExtraAPI()
+api = NinjaExtraAPI(renderer=build_renderer(settings.JOB_JSON_RENDERER))
 
 
 @api.exception_handler(NotFoundException)
@@ -15,6 +18,11 @@ def not_found_handler(request, exc: NotFoundException):
     return JsonResponse({"detail": str(exc)}, status=404)
 
 
+@api.exception_handler(InvalidQueryException)
+def invalid_query_handler(request, exc: InvalidQueryException):
+    return JsonResponse({"detail": str(exc)}, status=400)
+
+
 api.add_router("/job", job_router)
 api.register_controllers(PublicAuthController)
 api.register_controllers(PrivateAuthController)
@@ -22,4 +30,5 @@ api.register_controllers(PrivateAuthController)
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/", api.urls),
+    path("metrics", metrics_view),
 ]